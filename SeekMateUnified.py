@@ -21,6 +21,8 @@ import openpyxl
 from openpyxl import Workbook
 from datetime import datetime
 
+from bot_control import write_control_file
+
 # ============================================
 # DIRECT PATHS
 # ============================================
@@ -55,22 +57,7 @@ def save_config(data):
 # Pause/Stop control file
 # ============================================
 def write_control(pause=None, stop=None):
-    data = {"pause": False, "stop": False}
-
-    if os.path.exists(CONTROL_FILE):
-        try:
-            with open(CONTROL_FILE, "r", encoding="utf-8") as f:
-                data.update(json.load(f))
-        except:
-            pass
-
-    if pause is not None:
-        data["pause"] = pause
-    if stop is not None:
-        data["stop"] = stop
-
-    with open(CONTROL_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    write_control_file(CONTROL_FILE, pause=pause, stop=stop)
 
 # ============================================
 # INIT BROWSER (REQUIRED FOR CHROME TO OPEN)
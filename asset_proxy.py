@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Local Asset Proxy for SeekMateAI
+Every bot's Chrome has its own profile, so each one downloads SEEK's JS bundles, CSS and fonts
+separately. This is one forward proxy on the machine that the bots' Chrome sessions can route
+their static-asset requests through (set "ASSET_PROXY": true in config.json; init_browser adds a
+PAC script when it's running):
+- only the hosts in ASSET_PROXY_HOSTS go to the proxy, with DIRECT as fallback if it's down;
+  pages, API calls, logins and Cloudflare never touch it
+- HTTPS to those hosts is opened up locally, and immutable assets (Cache-Control: immutable, or
+  long max-age on a content-hashed file name) are kept in a disk cache shared by all instances
+- GET /health on the proxy port returns hit rate and bytes saved
+
+Intercepting needs a certificate per host. They all share one key, and Chrome is told to trust that
+key only (--ignore-certificate-errors-spki-list). Certificates are made with the cryptography package,
+or the openssl command if it isn't installed. With neither, the proxy only tunnels.
+
+Usage:
+    python asset_proxy.py                 # run the proxy
+    python asset_proxy.py stats           # hit rate / bytes saved of the running proxy
+    python asset_proxy.py clear           # empty the asset cache
+"""
+import os
+import re
+import ssl
+import sys
+import json
+import time
+import base64
+import select
+import shutil
+import socket
+import hashlib
+import fnmatch
+import threading
+import subprocess
+import http.client
+import urllib.request
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+from bot_status import get_data_dir
+
+PROXY_HOST = "127.0.0.1"
+PROXY_PORT = int(os.getenv("SEEKMATE_ASSET_PROXY_PORT", "8767"))
+
+DEFAULT_HOSTS = ["*.seekcdn.com"]   # Static-asset hosts to intercept; add more via ASSET_PROXY_HOSTS
+DEFAULT_CACHE_MB = 1024
+MAX_OBJECT_MB = 20
+MIN_MAX_AGE = 7 * 86400             # A hashed file name also needs at least this max-age
+TUNNEL_IDLE_TIMEOUT = 300
+UPSTREAM_TIMEOUT = 60
+STATS_LOG_INTERVAL = 300
+
+HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "proxy-authorization", "proxy-authenticate",
+               "te", "trailer", "trailers", "transfer-encoding", "upgrade"}
+# main.3f2a9c1b.js, app-4c3f2a1b9e8d7c6b.css, /static/0a1b2c3d4e5f6a7b/...
+_HASHED_RE = re.compile(r"[.\-_~][0-9a-f]{8,}\.[a-z0-9]+$|/[0-9a-f]{16,}/", re.IGNORECASE)
+_CACHEABLE_VARY = {"accept-encoding", "origin"}
+
+
+def _log(msg):
+    print(f"[Asset Proxy] {msg}", flush=True)
+
+
+# ============================================
+# CACHE POLICY
+# ============================================
+def _max_age(cache_control):
+    match = re.search(r"(?:s-)?max-age=(\d+)", cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def request_cacheable(method, headers):
+    """Only plain GETs can be answered from the cache - never credentials (each bot is its own account)"""
+    return method == "GET" and not any(h in headers for h in ("authorization", "cookie", "range"))
+
+
+def response_cacheable(path, status, headers):
+    """Immutable public asset: no cookies set, not private, immutable or long-lived with a hashed name"""
+    if status != 200 or "set-cookie" in headers:
+        return False
+    cache_control = headers.get("cache-control", "").lower()
+    if any(d in cache_control for d in ("private", "no-store", "no-cache")):
+        return False
+    vary = {v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()}
+    if not vary <= _CACHEABLE_VARY:
+        return False
+    if "immutable" in cache_control:
+        return True
+    return _max_age(cache_control) >= MIN_MAX_AGE and bool(_HASHED_RE.search(path.split("?")[0]))
+
+
+def cache_key(url, headers):
+    """The URL plus the request headers a cacheable response may vary on"""
+    raw = "\n".join((url, headers.get("accept-encoding", ""), headers.get("origin", "")))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class AssetCache:
+    """Responses on disk (<key>.body + <key>.json), least recently used dropped first (by mtime)"""
+
+    def __init__(self, directory, max_mb=DEFAULT_CACHE_MB):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size, self.entries = self._scan()
+
+    def _scan(self):
+        size = entries = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".body"):
+                    entries += 1
+                    try:
+                        size += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        pass
+        return size, entries
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """(status, headers, body) or None"""
+        path = self._path(key)
+        try:
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(path + ".body", "rb") as f:
+                body = f.read()
+            os.utime(path + ".body")
+        except (OSError, ValueError):
+            return None
+        return meta["status"], meta["headers"], body
+
+    def put(self, key, url, status, headers, body):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path + ".body")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"url": url, "status": status, "headers": headers, "stored_at": int(time.time())}, f)
+            os.replace(tmp, path + ".json")
+        except OSError as e:
+            _log(f"Could not store {url}: {e}")
+            return
+        with self._lock:
+            self.size += len(body)
+            self.entries += 1
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Oldest-used entries out until the cache is back under 90% of its size"""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".body"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                        files.append((st.st_mtime, st.st_size, path[:-5]))
+                    except OSError:
+                        pass
+        files.sort()
+        self.size = sum(size for _, size, _ in files)
+        self.entries = len(files)
+        for _, size, base in files:
+            if self.size <= self.max_bytes * 0.9:
+                break
+            for ext in (".body", ".json"):
+                try:
+                    os.remove(base + ext)
+                except OSError:
+                    pass
+            self.size -= size
+            self.entries -= 1
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+        self.size = self.entries = 0
+
+
+# ============================================
+# CERTIFICATES (for intercepted hosts)
+# ============================================
+class CertStore:
+    """One EC key; a certificate per intercepted host, signed with it. Chrome trusts the key's SPKI."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.key_file = os.path.join(directory, "key.pem")
+        self._contexts = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "certs"), exist_ok=True)
+        if not os.path.exists(self.key_file):
+            self._create_key()
+        self.spki = base64.b64encode(hashlib.sha256(self._public_der()).digest()).decode()
+
+    @staticmethod
+    def available():
+        return CRYPTOGRAPHY_AVAILABLE or shutil.which("openssl") is not None
+
+    def _create_key(self):
+        tmp = f"{self.key_file}.{os.getpid()}.tmp"
+        if CRYPTOGRAPHY_AVAILABLE:
+            key = ec.generate_private_key(ec.SECP256R1())
+            with open(tmp, "wb") as f:
+                f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                          serialization.NoEncryption()))
+        else:
+            subprocess.run(["openssl", "ecparam", "-name", "prime256v1", "-genkey", "-noout", "-out", tmp],
+                           check=True, capture_output=True)
+        os.replace(tmp, self.key_file)
+
+    def _public_der(self):
+        if CRYPTOGRAPHY_AVAILABLE:
+            with open(self.key_file, "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), None)
+            return key.public_key().public_bytes(serialization.Encoding.DER,
+                                                 serialization.PublicFormat.SubjectPublicKeyInfo)
+        return subprocess.run(["openssl", "pkey", "-in", self.key_file, "-pubout", "-outform", "DER"],
+                              check=True, capture_output=True).stdout
+
+    def _create_cert(self, host, cert_file):
+        tmp = f"{cert_file}.{os.getpid()}.tmp"
+        if CRYPTOGRAPHY_AVAILABLE:
+            import datetime
+            with open(self.key_file, "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), None)
+            name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host)])
+            now = datetime.datetime.now(datetime.timezone.utc)
+            cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name)
+                    .public_key(key.public_key()).serial_number(x509.random_serial_number())
+                    .not_valid_before(now - datetime.timedelta(days=1))
+                    .not_valid_after(now + datetime.timedelta(days=365))
+                    .add_extension(x509.SubjectAlternativeName([x509.DNSName(host)]), critical=False)
+                    .sign(key, hashes.SHA256()))
+            with open(tmp, "wb") as f:
+                f.write(cert.public_bytes(serialization.Encoding.PEM))
+        else:
+            subprocess.run(["openssl", "req", "-x509", "-new", "-key", self.key_file, "-subj", f"/CN={host}",
+                            "-addext", f"subjectAltName=DNS:{host}", "-days", "365", "-out", tmp],
+                           check=True, capture_output=True)
+        os.replace(tmp, cert_file)
+
+    def context(self, host):
+        """Server-side SSLContext presenting a certificate for `host`"""
+        with self._lock:
+            if host not in self._contexts:
+                cert_file = os.path.join(self.directory, "certs", f"{host}.pem")
+                if not os.path.exists(cert_file):
+                    self._create_cert(host, cert_file)
+                ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                ctx.load_cert_chain(cert_file, self.key_file)
+                ctx.set_alpn_protocols(["http/1.1"])
+                self._contexts[host] = ctx
+            return self._contexts[host]
+
+
+# ============================================
+# PROXY
+# ============================================
+class AssetProxy:
+    def __init__(self, hosts=None, cache_mb=DEFAULT_CACHE_MB, directory=None):
+        directory = directory or os.path.join(get_data_dir(), "asset_proxy")
+        self.hosts = [h.lower() for h in (DEFAULT_HOSTS if hosts is None else hosts)]
+        self.cache = AssetCache(os.path.join(directory, "cache"), cache_mb)
+        self.certs = None
+        if self.hosts and CertStore.available():
+            try:
+                self.certs = CertStore(directory)
+            except Exception as e:
+                _log(f"Certificates unavailable, tunnelling everything: {e}")
+        elif self.hosts:
+            _log("Neither cryptography nor openssl found - tunnelling everything, nothing is cached")
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "stored": 0, "passthrough": 0, "tunnels": 0,
+                      "intercepted": 0, "bytes_saved": 0, "bytes_upstream": 0, "bytes_tunnelled": 0}
+        self.tunnel_hosts = {}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+
+    def count(self, **increments):
+        with self._stats_lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def snapshot(self):
+        with self._stats_lock:
+            stats = dict(self.stats)
+            top = sorted(self.tunnel_hosts.items(), key=lambda kv: -kv[1])[:10]
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(hit_rate=round(stats["hits"] / lookups, 3) if lookups else None,
+                     cache_mb=round(self.cache.size / (1024 * 1024), 1), cache_entries=self.cache.entries,
+                     spki=self.certs.spki if self.certs else None, hosts=self.hosts,
+                     top_tunnelled_hosts={host: round(n / (1024 * 1024), 1) for host, n in top})
+        return stats
+
+    def intercept_context(self, host):
+        if self.certs and any(fnmatch.fnmatch(host.lower(), pattern) for pattern in self.hosts):
+            try:
+                return self.certs.context(host.lower())
+            except Exception as e:
+                _log(f"No certificate for {host}, tunnelling: {e}")
+        return None
+
+    # ---------- TUNNEL (everything not intercepted) ----------
+    def tunnel(self, handler, host, port):
+        try:
+            upstream = socket.create_connection((host, port), timeout=UPSTREAM_TIMEOUT)
+        except OSError as e:
+            handler.send_error(502, f"Cannot reach {host}:{port}: {e}")
+            return
+        handler.send_response(200, "Connection Established")
+        handler.end_headers()
+        client = handler.connection
+        moved = 0
+        try:
+            sockets = [client, upstream]
+            while True:
+                readable, _, broken = select.select(sockets, [], sockets, TUNNEL_IDLE_TIMEOUT)
+                if broken or not readable:
+                    break
+                done = False
+                for s in readable:
+                    data = s.recv(65536)
+                    if not data:
+                        done = True
+                        break
+                    (upstream if s is client else client).sendall(data)
+                    moved += len(data)
+                if done:
+                    break
+        except OSError:
+            pass
+        finally:
+            upstream.close()
+            handler.close_connection = True
+            with self._stats_lock:
+                self.stats["tunnels"] += 1
+                self.stats["bytes_tunnelled"] += moved
+                self.tunnel_hosts[host] = self.tunnel_hosts.get(host, 0) + moved
+
+    # ---------- FORWARD (plain HTTP and intercepted HTTPS) ----------
+    def _connection(self, scheme, host, port, fresh=False):
+        pool = self._local.__dict__.setdefault("pool", {})
+        key = (scheme, host, port)
+        if fresh or key not in pool:
+            if key in pool:
+                pool[key].close()
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            pool[key] = cls(host, port, timeout=UPSTREAM_TIMEOUT)
+        return pool[key]
+
+    def _upstream(self, scheme, host, port, method, path, body, headers):
+        for attempt in range(2):
+            conn = self._connection(scheme, host, port, fresh=attempt > 0)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Pooled keep-alive connection closed by the server - retry once on a new one
+                if attempt or method not in ("GET", "HEAD", "OPTIONS"):
+                    raise
+
+    def forward(self, handler, url):
+        self.count(requests=1)
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        method = handler.command
+
+        if handler.headers.get("Upgrade"):
+            handler.send_error(502, "Upgrade is not supported through the asset proxy")
+            handler.close_connection = True
+            return
+        headers = {k: v for k, v in handler.headers.items() if k.lower() not in HOP_HEADERS}
+        lower = {k.lower(): v for k, v in headers.items()}
+        body = _read_body(handler)
+
+        key = None
+        if request_cacheable(method, lower):
+            key = cache_key(url, lower)
+            hit = self.cache.get(key)
+            if hit:
+                status, cached_headers, cached_body = hit
+                handler.send_response(status)
+                for k, v in cached_headers:
+                    handler.send_header(k, v)
+                handler.send_header("Content-Length", str(len(cached_body)))
+                handler.send_header("X-SeekMate-Cache", "HIT")
+                handler.end_headers()
+                handler.wfile.write(cached_body)
+                self.count(hits=1, bytes_saved=len(cached_body))
+                return
+
+        try:
+            conn, resp = self._upstream(scheme, parts.hostname, port, method, path, body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            handler.send_error(502, f"Upstream error: {e}")
+            handler.close_connection = True
+            return
+
+        resp_headers = [(k, v) for k, v in resp.getheaders() if k.lower() not in HOP_HEADERS]
+        resp_lower = {k.lower(): v for k, v in resp_headers}
+        store = key is not None and response_cacheable(path, resp.status, resp_lower)
+        # Miss = an asset that could have come from the cache; everything else is passed through
+        self.count(misses=1 if store else 0, passthrough=0 if store else 1)
+
+        no_body = method == "HEAD" or resp.status in (204, 304) or resp.status < 200
+        length = resp_lower.get("content-length")
+        handler.send_response(resp.status, resp.reason)
+        for k, v in resp_headers:
+            if k.lower() != "content-length":
+                handler.send_header(k, v)
+        chunked = not no_body and length is None
+        if length is not None:
+            handler.send_header("Content-Length", length)
+        elif chunked:
+            handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        if no_body:
+            return
+
+        kept = [] if store else None
+        size = 0
+        try:
+            while True:
+                chunk = resp.read1(65536)
+                if not chunk:
+                    break
+                size += len(chunk)
+                handler.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk) if chunked else chunk)
+                if kept is not None:
+                    kept.append(chunk)
+                    if size > MAX_OBJECT_MB * 1024 * 1024:
+                        kept = None
+            if chunked:
+                handler.wfile.write(b"0\r\n\r\n")
+            resp.close()    # Frees the pooled connection for the next request
+        except (OSError, http.client.HTTPException):
+            # Browser went away (or upstream broke) mid-body - this connection can't be reused
+            conn.close()
+            handler.close_connection = True
+            return
+        finally:
+            self.count(bytes_upstream=size)
+        if kept is not None:
+            self.cache.put(key, url, resp.status, [h for h in resp_headers if h[0].lower() != "content-length"],
+                           b"".join(kept))
+            self.count(stored=1)
+
+    def log_stats_forever(self):
+        while True:
+            time.sleep(STATS_LOG_INTERVAL)
+            s = self.snapshot()
+            rate = f"{100 * s['hit_rate']:.0f}%" if s["hit_rate"] is not None else "-"
+            _log(f"{s['requests']} requests, hit rate {rate}, {s['bytes_saved'] / (1024 * 1024):.1f} MB saved, "
+                 f"cache {s['cache_mb']} MB / {s['cache_entries']} files, {s['tunnels']} tunnels")
+
+
+def _read_body(handler):
+    if handler.headers.get("Content-Length"):
+        return handler.rfile.read(int(handler.headers["Content-Length"]))
+    if "chunked" in (handler.headers.get("Transfer-Encoding") or "").lower():
+        body = b""
+        while True:
+            size = int(handler.rfile.readline().split(b";")[0].strip() or b"0", 16)
+            if not size:
+                handler.rfile.readline()
+                return body
+            body += handler.rfile.read(size)
+            handler.rfile.readline()
+    return None
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    proxy = None
+    tls_host = None     # Set once a CONNECT to an intercepted host has been opened up
+
+    def do_CONNECT(self):
+        host, _, port = self.path.rpartition(":")
+        port = int(port) if port.isdigit() else 443
+        context = self.proxy.intercept_context(host)
+        if not context:
+            self.proxy.tunnel(self, host, port)
+            return
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            conn = context.wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError) as e:
+            _log(f"TLS with the browser failed for {host}: {e}")
+            self.close_connection = True
+            return
+        # The requests inside the tunnel are read by the same handler loop
+        self.connection = conn
+        self.rfile = conn.makefile("rb", self.rbufsize)
+        self.wfile = conn.makefile("wb")
+        self.tls_host = host if port == 443 else f"{host}:{port}"
+        self.close_connection = False
+        self.proxy.count(intercepted=1)
+
+    def _request(self):
+        if self.tls_host:
+            self.proxy.forward(self, f"https://{self.tls_host}{self.path}")
+        elif self.path.startswith("/"):
+            self._local()
+        else:
+            self.proxy.forward(self, self.path)
+        self.wfile.flush()
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _request
+
+    def _local(self):
+        """Requests for the proxy itself: /health"""
+        if self.path.rstrip("/") in ("/health", "/stats"):
+            body = json.dumps(self.proxy.snapshot()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        else:
+            body = b'{"error": "not found"}'
+            self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# ============================================
+# CLIENT HELPERS (used by init_browser)
+# ============================================
+def proxy_status(timeout=0.5):
+    """The running proxy's /health, or None"""
+    try:
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+        with opener.open(f"http://{PROXY_HOST}:{PROXY_PORT}/health", timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except Exception:
+        return None
+
+
+def pac_script(hosts):
+    """Proxy auto-config: asset hosts through the proxy (direct if it's down), everything else direct"""
+    checks = " || ".join(f"shExpMatch(host, {json.dumps(h)})" for h in hosts) or "false"
+    return (f"function FindProxyForURL(url, host) {{\n"
+            f"    if ({checks}) return \"PROXY {PROXY_HOST}:{PROXY_PORT}; DIRECT\";\n"
+            f"    return \"DIRECT\";\n}}\n")
+
+
+def chrome_proxy_args():
+    """Chrome switches to route asset hosts through the asset proxy, or [] if it isn't running"""
+    status = proxy_status()
+    if not status or not status.get("hosts"):
+        return []
+    pac = base64.b64encode(pac_script(status["hosts"]).encode()).decode()
+    args = [f"--proxy-pac-url=data:application/x-ns-proxy-autoconfig;base64,{pac}"]
+    if status.get("spki"):
+        args.append(f"--ignore-certificate-errors-spki-list={status['spki']}")
+    return args
+
+
+def load_settings():
+    """(hosts, cache MB) from ASSET_PROXY_HOSTS / ASSET_CACHE_MAX_MB in config.json, if present"""
+    try:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json"), "r") as f:
+            config = json.load(f)
+    except Exception:
+        config = {}
+    return config.get("ASSET_PROXY_HOSTS", DEFAULT_HOSTS), config.get("ASSET_CACHE_MAX_MB", DEFAULT_CACHE_MB)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "stats":
+        status = proxy_status()
+        print(json.dumps(status, indent=2) if status else f"No asset proxy on {PROXY_HOST}:{PROXY_PORT}")
+        return
+    hosts, cache_mb = load_settings()
+    proxy = AssetProxy(hosts, cache_mb)
+    if command == "clear":
+        proxy.cache.clear()
+        print(f"Cleared {proxy.cache.directory}")
+        return
+
+    _ProxyHandler.proxy = proxy
+    server = ThreadingHTTPServer((PROXY_HOST, PROXY_PORT), _ProxyHandler)
+    server.daemon_threads = True
+    threading.Thread(target=proxy.log_stats_forever, daemon=True).start()
+    _log(f"Listening on http://{PROXY_HOST}:{PROXY_PORT} - caching {', '.join(proxy.hosts) or 'nothing'} "
+         f"({'intercepting' if proxy.certs else 'tunnel only'}), cache {proxy.cache.size // (1024 * 1024)} MB "
+         f"in {proxy.cache.directory}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
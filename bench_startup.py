@@ -0,0 +1,115 @@
+"""
+Start-up benchmark: how long importing each entry point takes, from `python -X importtime`.
+Every run is a fresh interpreter, so this is what a bot launch / dashboard start actually pays.
+Prints the median import time per entry point against its budget, plus the slowest imports,
+and exits with status 1 if any entry point is over budget.
+
+Usage: python bench_startup.py [--runs N] [--top N] [--json report.json] [module ...]
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Regression budget per entry point (median ms to import the module, interpreter start-up excluded)
+BUDGETS_MS = {
+    "main": 150,
+    "config_gui": 250,
+    "multi_bot_gui": 200,
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(module):
+    """
+    One fresh-interpreter import of `module`.
+    Returns (total_ms, [(cumulative_ms, self_ms, depth, name)]) or raises RuntimeError on failure.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPT_DIR, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        last = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+        raise RuntimeError(last)
+
+    rows = []
+    total_ms = None
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        depth = len(indent) // 2
+        rows.append((cumulative_us / 1000.0, self_us / 1000.0, depth, name))
+        if name == module and depth == 0:
+            total_ms = cumulative_us / 1000.0
+    if total_ms is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return total_ms, rows
+
+
+def run(modules, runs, top):
+    report = {}
+    over = False
+    for module in modules:
+        budget = BUDGETS_MS.get(module)
+        try:
+            measure(module)  # Warm-up: writes .pyc files so runs measure imports, not compiles
+            samples = []
+            rows = []
+            for _ in range(runs):
+                total_ms, rows = measure(module)
+                samples.append(total_ms)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"[BENCH] {module:<14} ❌ import failed: {e}")
+            report[module] = {"error": str(e), "budget_ms": budget}
+            over = True
+            continue
+
+        median = statistics.median(samples)
+        ok = budget is None or median <= budget
+        over = over or not ok
+        verdict = "no budget" if budget is None else ("✅ OK" if ok else "❌ OVER BUDGET")
+        print(f"[BENCH] {module:<14} median {median:7.1f} ms (min {min(samples):.1f}, max {max(samples):.1f}) "
+              f"| budget {budget if budget is not None else '-'} ms | {verdict}")
+
+        # Slowest imports made on behalf of this module (cumulative, outermost first)
+        slowest = sorted((r for r in rows if r[3] != module), key=lambda r: r[0], reverse=True)[:top]
+        for cumulative_ms, self_ms, depth, name in slowest:
+            print(f"          {cumulative_ms:7.1f} ms cumulative | {self_ms:6.1f} ms self | {name}")
+
+        report[module] = {
+            "median_ms": round(median, 2),
+            "samples_ms": [round(s, 2) for s in samples],
+            "budget_ms": budget,
+            "ok": ok,
+            "slowest": [{"name": n, "cumulative_ms": round(c, 2), "self_ms": round(s, 2)}
+                        for c, s, _, n in slowest],
+        }
+    return report, over
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for SeekMateAI entry points")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS_MS), help="modules to import (default: all budgeted)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list per module")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report, over = run(args.modules, args.runs, args.top)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Micro-benchmark: compiled TitleMatcher vs the original title_matches / blocklist helpers.
+Runs over a synthetic corpus of SEEK-style job titles, checks every decision is identical,
+then prints the timings.
+
+Usage: python bench_title_matcher.py [num_titles]
+"""
+import sys
+import time
+import random
+
+from title_matcher import TitleMatcher, detect_category, CATEGORY_RELATED
+
+
+# ---------- ORIGINAL IMPLEMENTATIONS (reference) ----------
+def legacy_title_matches(title, job_titles):
+    allowed = [t.lower().strip() for t in job_titles]
+    title_clean = title.lower().strip()
+
+    if any(a in title_clean for a in allowed):
+        return True
+
+    title_words = [w for w in title_clean.replace('-', ' ').split() if len(w) > 3]
+    for word in title_words:
+        if any(word in a for a in allowed):
+            return True
+
+    category = detect_category(allowed)
+    related = CATEGORY_RELATED.get(category)
+    if related and any(r in title_clean for r in related):
+        return True
+    return False
+
+
+def legacy_is_blocked(text, blocked):
+    if not blocked:
+        return False
+    text_clean = text.lower().strip()
+    return any(b in text_clean for b in blocked)
+
+
+# ---------- SYNTHETIC CORPUS ----------
+SENIORITY = ["", "Senior", "Junior", "Lead", "Principal", "Graduate", "Head of", "Assistant", "EL1", "APS6"]
+ROLES = [
+    "Project Manager", "Program Manager", "Business Analyst", "Policy Officer", "Software Engineer",
+    "Data Analyst", "Account Manager", "Business Development Manager", "Sales Executive",
+    "Executive Assistant", "Administration Officer", "Community Engagement Officer",
+    "Research Assistant", "Case Manager", "Delivery Lead", "Scrum Master", "Cloud Engineer",
+    "Cyber Security Analyst", "Warehouse Storeperson", "Forklift Driver", "Registered Nurse",
+    "Chef de Partie", "Customer Service Representative", "Electrician", "Carpenter",
+    "Call Centre Operator", "Retail Assistant", "Governance Advisor", "Operations Director",
+    "Teacher Aide", "Support Worker", "Disability Support Worker", "Barista", "Accountant",
+]
+SUFFIXES = ["", "- Contract", "- 12 Month Fixed Term", "(Hybrid)", "| Brisbane CBD", "- Immediate Start", "II"]
+
+PROFILES = [
+    ["Project Manager", "Program Manager", "Delivery Manager"],
+    ["Policy Officer", "Governance Advisor", "EL1 Policy"],
+    ["Business Development Manager", "Account Manager", "Sales"],
+    ["Software Engineer", "Developer", "Cloud Engineer"],
+    ["Executive Assistant", "Admin", "Coordinator"],
+    ["Research", "Community", "Stakeholder Engagement"],
+    ["Warehouse Worker"],
+]
+BLOCKED_TITLES = ["sales", "commission only", "door to door", "call centre", "forklift"]
+BLOCKED_COMPANIES = ["recruitment", "labour hire", "acme pty ltd", "talent"]
+COMPANIES = ["Acme Pty Ltd", "Queensland Health", "Hays Recruitment", "Department of Education",
+             "Telstra", "Brisbane City Council", "Labour Hire Co", "Woolworths", "Talent International"]
+
+
+def make_corpus(n, seed=42):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        title = " ".join(p for p in (rng.choice(SENIORITY), rng.choice(ROLES), rng.choice(SUFFIXES)) if p)
+        if rng.random() < 0.3:
+            title = title.upper() if rng.random() < 0.5 else f"  {title.lower()}  "
+        corpus.append((title, rng.choice(COMPANIES)))
+    return corpus
+
+
+def run(n):
+    corpus = make_corpus(n)
+    legacy_total = compiled_total = 0.0
+
+    for job_titles in PROFILES:
+        blocked_titles = [t.lower().strip() for t in BLOCKED_TITLES]
+        blocked_companies = [c.lower().strip() for c in BLOCKED_COMPANIES]
+
+        t0 = time.perf_counter()
+        legacy = [
+            (legacy_title_matches(t, job_titles),
+             legacy_is_blocked(t, blocked_titles),
+             legacy_is_blocked(c, blocked_companies))
+            for t, c in corpus
+        ]
+        t1 = time.perf_counter()
+        matcher = TitleMatcher(job_titles, BLOCKED_TITLES, BLOCKED_COMPANIES)
+        compiled = [
+            (matcher.matches(t),
+             matcher.blocked_title_keyword(t) is not None,
+             matcher.blocked_company_keyword(c) is not None)
+            for t, c in corpus
+        ]
+        t2 = time.perf_counter()
+
+        mismatches = [(corpus[i], legacy[i], compiled[i]) for i in range(n) if legacy[i] != compiled[i]]
+        if mismatches:
+            print(f"[BENCH] ❌ {len(mismatches)} decision(s) differ for {job_titles}, e.g. {mismatches[0]}")
+            sys.exit(1)
+
+        legacy_total += t1 - t0
+        compiled_total += t2 - t1
+        matched = sum(1 for m, _, _ in compiled if m)
+        print(f"[BENCH] {matcher.category:<10} legacy {t1 - t0:7.3f}s | compiled {t2 - t1:7.3f}s | "
+              f"{(t1 - t0) / (t2 - t1):5.1f}x | matched {matched}/{n}")
+
+    print(f"[BENCH] ✅ {n * len(PROFILES)} decisions identical | total legacy {legacy_total:.3f}s, "
+          f"compiled {compiled_total:.3f}s ({legacy_total / compiled_total:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
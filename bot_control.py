@@ -0,0 +1,111 @@
+"""
+Control Channel for SeekMateAI bots
+Pause / stop / recommended flags live in a small JSON control file (control.json or
+control_<instance>.json). Readers keep a cached copy and only re-parse the file when its
+stat signature changes, so checking it before every job card costs a single os.stat().
+Writers always replace the file atomically so a reader never sees a half-written file.
+"""
+import os
+import json
+import time
+
+from bot_status import write_json_atomic
+
+# Even if the stat signature looks unchanged, re-parse at least this often (coarse mtime filesystems)
+FORCE_REREAD_AFTER = 2.0
+
+# How often a paused bot re-stats the control file (stat only, no JSON parse)
+PAUSE_POLL_INTERVAL = 0.05
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def read_control_file(path):
+    """Read the control file fresh from disk. Returns {} if missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def control_state(data):
+    """Map control data to 'run', 'pause' or 'stop' (also understands the dashboard's {"status": ...})"""
+    if data.get("stop", False) or data.get("status") == "stop":
+        return "stop"
+    if data.get("pause", False) or data.get("status") == "pause":
+        return "pause"
+    return "run"
+
+
+def write_control_file(path, pause=None, stop=None, recommended=None):
+    """Update control flags with a read-modify-atomic-replace. Returns the new data."""
+    data = {"pause": False, "stop": False, "recommended": False}
+    data.update(read_control_file(path))
+    # Older dashboards wrote {"status": "pause"}; fold it into the flags so it can't linger
+    legacy = data.pop("status", None)
+    if legacy == "pause" and pause is None:
+        data["pause"] = True
+    elif legacy == "stop" and stop is None:
+        data["stop"] = True
+
+    if pause is not None:
+        data["pause"] = pause
+    if stop is not None:
+        data["stop"] = stop
+    if recommended is not None:
+        data["recommended"] = recommended
+
+    write_json_atomic(path, data)
+    return data
+
+
+class ControlChannel:
+    """Cached, stat-gated view of one control file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._signature = None
+        self._data = {}
+        self._read_at = 0.0
+
+    def read(self):
+        """Current control data; only touches the JSON when the file has changed"""
+        now = time.monotonic()
+        signature = _file_signature(self.path)
+        if signature != self._signature or now - self._read_at > FORCE_REREAD_AFTER:
+            self._data = read_control_file(self.path) if signature else {}
+            self._signature = signature
+            self._read_at = now
+        return self._data
+
+    def check(self):
+        """'run', 'pause' or 'stop'"""
+        return control_state(self.read())
+
+    def is_recommended(self):
+        return bool(self.read().get("recommended", False))
+
+    def wait_while_paused(self):
+        """Block while paused. Returns False if a stop arrives, True once resumed."""
+        while True:
+            status = self.check()
+            if status == "stop":
+                return False
+            if status == "run":
+                return True
+            time.sleep(PAUSE_POLL_INTERVAL)
+
+    def write(self, pause=None, stop=None, recommended=None):
+        """Atomically update flags and refresh the cache so our own write is seen immediately"""
+        self._data = write_control_file(self.path, pause=pause, stop=stop, recommended=recommended)
+        self._signature = _file_signature(self.path)
+        self._read_at = time.monotonic()
+        return self._data
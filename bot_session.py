@@ -0,0 +1,157 @@
+"""
+Per-profile Bot Sessions for SeekMateAI
+Everything that used to be a main.py module global for "this bot" - config values, the compiled
+title matcher, credentials and the instance file paths - lives on a BotSession. The code in main.py
+reads it through SESSION, which resolves to the session bound to the current thread, so one process
+can run several profiles side by side (see session_host.py). A plain `python main.py` run uses the
+process session built from the BOT_* environment variables, exactly as before.
+
+Objects that don't depend on the profile (LLM clients, compiled matchers) go through shared(),
+so N sessions hold one copy each instead of N.
+"""
+import os
+import threading
+
+from bot_control import ControlChannel
+from bot_status import default_status_file, instance_status_file
+from metrics_store import default_metrics_dir
+from run_checkpoint import default_checkpoint_file
+from title_matcher import TitleMatcher
+
+
+class BotSession:
+    """
+    State of one bot profile. Settings keep the config key names main.py always used
+    (SESSION.MAX_JOBS, SESSION.CONFIG ...); reload_config() in main.py fills them in.
+    """
+
+    def __init__(self, name=None, config_file="config.json", log_file=None, control_file="control.json",
+                 chrome_profile=None, status_file=None, checkpoint_file=None, console_prefix=""):
+        self.name = name                      # Instance name (None for the single-bot run)
+        self.config_file = config_file
+        self.log_file = log_file
+        self.control_file = control_file
+        self.chrome_profile = chrome_profile
+        self.status_file = status_file or default_status_file()
+        self.checkpoint_file = checkpoint_file or default_checkpoint_file(name, status_file)
+        self.metrics_dir = default_metrics_dir(name, status_file)
+        self.console_prefix = console_prefix  # Prepended to console output when sessions share a terminal
+        self.control = ControlChannel(control_file)
+        self.initialized = False
+
+        # Settings (same defaults main.py had as module globals)
+        self.CONFIG = {}
+        self.SEEK_EMAIL = ""
+        self.JOB_TITLE = ""
+        self.CV_PATH = ""
+        self.MAX_JOBS = 100
+        self.EXPECTED_SALARY = "100000"
+        self.LOCATION = "Brisbane, Australia"
+        self.SCAN_SPEED = 50
+        self.APPLY_SPEED = 50
+        self.COOLDOWN_DELAY = 5
+        self.STEALTH_MODE = False
+        self.MATCHER = TitleMatcher([])
+        self.BLOCKED_COMPANIES = []
+        self.BLOCKED_TITLES = []
+        self.SEARCH_URL = ""
+
+        # Credentials (config.json or environment / .env)
+        self.OPENAI_API_KEY = ""
+        self.ANTHROPIC_API_KEY = ""
+        self.TWOCAPTCHA_API_KEY = ""
+        self.TWILIO_ACCOUNT_SID = ""
+        self.TWILIO_AUTH_TOKEN = ""
+        self.TWILIO_WHATSAPP_FROM = "whatsapp:+14155238886"
+        self.WHATSAPP_NOTIFICATIONS = True
+
+    @classmethod
+    def for_instance(cls, name, info, script_dir=None):
+        """Session for an entry of bot_instances.json - same paths multi_bot_launcher passes via env"""
+        script_dir = script_dir or os.path.dirname(os.path.abspath(__file__))
+
+        def absolute(path):
+            return path if os.path.isabs(path) else os.path.join(script_dir, path)
+
+        return cls(
+            name=name,
+            config_file=absolute(info["config_file"]),
+            log_file=absolute(info["log_file"]),
+            control_file=absolute(info["control_file"]),
+            chrome_profile=info["chrome_profile"],
+            status_file=instance_status_file(name, info, script_dir),
+            console_prefix=f"[{name}] ",
+        )
+
+    def __repr__(self):
+        return f"<BotSession {self.name or 'Main'} ({self.config_file})>"
+
+
+# ============================================
+# CURRENT SESSION (per thread)
+# ============================================
+_local = threading.local()
+_default = None
+
+
+def set_default_session(session):
+    """Session used by threads that never called activate() (the single-bot process session)"""
+    global _default
+    _default = session
+
+
+def current_session():
+    session = getattr(_local, "session", None) or _default
+    if session is None:
+        raise RuntimeError("No bot session is active in this thread")
+    return session
+
+
+def activate(session):
+    """Bind `session` to the calling thread"""
+    _local.session = session
+
+
+def start_thread(target, *args, **kwargs):
+    """threading.Thread that runs `target` under the caller's session (daemon by default)"""
+    session = current_session()
+    daemon = kwargs.pop("daemon", True)
+
+    def run():
+        activate(session)
+        target(*args, **kwargs)
+
+    thread = threading.Thread(target=run, daemon=daemon)
+    thread.start()
+    return thread
+
+
+class _SessionProxy:
+    """SESSION.X is current_session().X"""
+
+    def __getattr__(self, name):
+        return getattr(current_session(), name)
+
+    def __setattr__(self, name, value):
+        setattr(current_session(), name, value)
+
+    def __repr__(self):
+        return f"<current {current_session()!r}>"
+
+
+SESSION = _SessionProxy()
+
+
+# ============================================
+# SHARED ACROSS SESSIONS
+# ============================================
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared(key, factory):
+    """Process-wide object for `key`, created once with factory() (LLM clients, compiled matchers)"""
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = factory()
+        return _shared[key]
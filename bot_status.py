@@ -0,0 +1,209 @@
+"""
+Live Status Snapshot for SeekMateAI bots
+Each running bot publishes a small JSON record describing what it is doing right now:
+phase, current search, counters, last error, heartbeat and rolling jobs/hour.
+The record is replaced atomically so monitors (dashboard, Slack, WhatsApp scheduler)
+can read it in O(1) instead of re-parsing the whole log file.
+"""
+import os
+import sys
+import json
+import time
+import threading
+from collections import deque
+
+# How often the record is rewritten while the bot is busy (state changes write immediately)
+PUBLISH_INTERVAL = 5
+
+# A bot that hasn't beaten its heartbeat in this many seconds is considered stalled
+STALE_AFTER = 15 * 60
+
+
+def get_data_dir():
+    """Get a consistent, user-writable data directory (same as main.py)"""
+    if sys.platform == "darwin":  # macOS
+        data_dir = os.path.expanduser("~/Library/Application Support/SeekMateAI")
+    elif sys.platform == "win32":  # Windows
+        data_dir = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), "SeekMateAI")
+    else:  # Linux
+        data_dir = os.path.expanduser("~/.seekmateai")
+
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def default_status_file(bot="seek"):
+    """Status file for this process: BOT_STATUS_FILE for instances, data dir otherwise"""
+    filename = "status.json" if bot == "seek" else f"status_{bot}.json"
+    return os.getenv("BOT_STATUS_FILE") or os.path.join(get_data_dir(), filename)
+
+
+def instance_status_file(name, info=None, script_dir=None):
+    """Status file path for a multi-bot instance entry from bot_instances.json"""
+    script_dir = script_dir or os.path.dirname(os.path.abspath(__file__))
+    p = (info or {}).get("status_file") or os.path.join(script_dir, f"status_{name}.json")
+    return p if os.path.isabs(p) else os.path.join(script_dir, p)
+
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file in the same directory, then os.replace() it into place"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def read_status(path):
+    """Read a published status record. Returns None if missing or unreadable."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def heartbeat_age(status, now=None):
+    """Seconds since the bot last beat its heartbeat (None if unknown)"""
+    if not status or not status.get("heartbeat"):
+        return None
+    return max(0.0, (now or time.time()) - float(status["heartbeat"]))
+
+
+def is_stale(status, max_age=STALE_AFTER, now=None):
+    """True if a running bot has stopped beating its heartbeat"""
+    if not status or status.get("phase") in ("paused", "finished", "stopped", "crashed"):
+        return False
+    age = heartbeat_age(status, now)
+    return age is not None and age > max_age
+
+
+def lifetime_count(status, counter):
+    """Counter summed across every run that has published to this status file"""
+    if not status:
+        return 0
+    return int((status.get("totals") or {}).get(counter, status.get(counter, 0)) or 0)
+
+
+class StatusPublisher:
+    """
+    Publishes the live status record for one bot run.
+    Call beat() from the hot loop; it only touches the disk every PUBLISH_INTERVAL seconds.
+    Phase changes, counter increments and errors are written straight away.
+    Per-run counters reset on every start; "totals" carries on from the previous record.
+    """
+
+    def __init__(self, path=None, bot="seek", instance=None, max_jobs=None, interval=PUBLISH_INTERVAL, metrics=None):
+        self.path = path or default_status_file(bot)
+        self.interval = interval
+        self.metrics = metrics   # Optional metrics_store.MetricsStore - counters are mirrored into it
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+        self._apply_times = deque()
+        previous = read_status(self.path) or {}
+        now = time.time()
+        self.data = {
+            "bot": bot,
+            "instance": instance or os.getenv("BOT_INSTANCE_NAME") or "Main",
+            "pid": os.getpid(),
+            "phase": "starting",
+            "title": "",
+            "location": "",
+            "page": 0,
+            "applied": 0,
+            "scanned": 0,
+            "skipped": 0,
+            "failed": 0,
+            "totals": {c: lifetime_count(previous, c) for c in ("applied", "scanned", "skipped", "failed")},
+            "max_jobs": max_jobs,
+            "last_error": "",
+            "last_error_at": None,
+            "last_event": "",
+            "started_at": now,
+            "heartbeat": now,
+            "jobs_per_hour": 0.0,
+        }
+        self._write()
+
+    # ---------- STATE CHANGES ----------
+    def set_phase(self, phase, **fields):
+        """Switch phase (searching, scanning, applying, paused, finished...) and publish now"""
+        with self._lock:
+            changed = self.data.get("phase") != phase
+            self.data["phase"] = phase
+            changed = self._merge(fields) or changed
+        self.beat(force=changed)
+
+    def update(self, **fields):
+        """Update title/location/page or any other field; publishes immediately if anything changed"""
+        with self._lock:
+            changed = self._merge(fields)
+        self.beat(force=changed)
+
+    def incr(self, counter, amount=1, event=""):
+        """Bump one of the applied/scanned/skipped/failed counters"""
+        with self._lock:
+            self.data[counter] = int(self.data.get(counter) or 0) + amount
+            totals = self.data["totals"]
+            totals[counter] = int(totals.get(counter) or 0) + amount
+            if counter == "applied":
+                self._apply_times.append(time.time())
+            if event:
+                self.data["last_event"] = event[:200]
+        if self.metrics is not None:
+            self.metrics.add(counter, amount)
+        self.beat(force=counter != "scanned")
+
+    def error(self, message):
+        """Record the most recent error"""
+        with self._lock:
+            self.data["last_error"] = str(message)[:300]
+            self.data["last_error_at"] = time.time()
+        self.beat(force=True)
+
+    def beat(self, force=False):
+        """Refresh the heartbeat; writes to disk at most every `interval` seconds unless forced"""
+        now = time.time()
+        with self._lock:
+            self.data["heartbeat"] = now
+            if not force and now - self._last_write < self.interval:
+                return
+            self.data["jobs_per_hour"] = self._jobs_per_hour(now)
+            self._last_write = now
+            snapshot = dict(self.data, totals=dict(self.data["totals"]))
+        self._write(snapshot)
+
+    def finish(self, phase="finished"):
+        """Final write when the run ends"""
+        self.set_phase(phase)
+
+    # ---------- INTERNALS ----------
+    def _merge(self, fields):
+        changed = False
+        for key, value in fields.items():
+            if self.data.get(key) != value:
+                self.data[key] = value
+                changed = True
+        return changed
+
+    def _jobs_per_hour(self, now):
+        """Applications in the last hour, extrapolated while the run is younger than an hour"""
+        cutoff = now - 3600
+        while self._apply_times and self._apply_times[0] < cutoff:
+            self._apply_times.popleft()
+        elapsed = now - self.data["started_at"]
+        if elapsed <= 0:
+            return 0.0
+        if elapsed < 3600:
+            return round(len(self._apply_times) * 3600.0 / max(elapsed, 60), 1)
+        return float(len(self._apply_times))
+
+    def _write(self, snapshot=None):
+        try:
+            write_json_atomic(self.path, snapshot or dict(self.data, totals=dict(self.data["totals"])))
+        except Exception as e:
+            # Never let status publishing break the bot
+            sys.stderr.write(f"[Status] Failed to publish status: {e}\n")
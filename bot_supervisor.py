@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Bot Supervisor for SeekMateAI
+A small daemon that owns the bot instance processes from bot_instances.json:
+- starts them as its own children and reaps them as soon as they exit
+- detects hung bots from the status heartbeat (bot_status.py) and restarts them
+- restarts crashed bots with exponential backoff, giving up after a crash loop
+- enforces optional per-instance CPU / memory ceilings (needs psutil)
+- serves its state on a local HTTP API for the dashboard, Slack responder and WhatsApp scheduler
+
+Usage:
+    python bot_supervisor.py
+    python multi_bot_launcher.py supervise
+"""
+import os
+import sys
+import json
+import time
+import signal
+import secrets
+import threading
+import subprocess
+import urllib.request
+import urllib.error
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from bot_status import read_status, instance_status_file, heartbeat_age, get_data_dir, STALE_AFTER
+from bot_control import write_control_file
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SUPERVISOR_HOST = "127.0.0.1"
+SUPERVISOR_PORT = int(os.getenv("SEEKMATE_SUPERVISOR_PORT", "8765"))
+TOKEN_HEADER = "X-SeekMate-Token"   # Commands need the token from the data dir (see supervisor_token)
+
+TICK_INTERVAL = 1.0             # Seconds between supervision passes
+STARTUP_GRACE = 180             # A new bot has this long to publish its first heartbeat
+HANG_AFTER = STALE_AFTER        # No heartbeat for this long -> hung, kill and restart
+STOP_GRACE = 15                 # Seconds between asking a bot to stop and killing it
+BACKOFF_BASE = 5                # First restart delay, doubled per consecutive crash
+BACKOFF_MAX = 300
+CRASH_LOOP_LIMIT = 5            # Crashes within CRASH_LOOP_WINDOW before giving up
+CRASH_LOOP_WINDOW = 15 * 60
+HEALTHY_AFTER = 10 * 60         # A run this long resets the backoff
+CPU_SUSTAIN_TICKS = 60          # CPU ceiling must be exceeded this many passes in a row
+
+
+def _log(msg):
+    print(f"[Supervisor] {datetime.now().strftime('%H:%M:%S')} {msg}", flush=True)
+
+
+def _abs(path):
+    return path if os.path.isabs(path) else os.path.join(SCRIPT_DIR, path)
+
+
+def supervisor_token():
+    """Shared secret for API commands, created on first use in the data dir (readable by this user only)"""
+    path = os.path.join(get_data_dir(), "supervisor_token")
+    try:
+        with open(path, "r") as f:
+            token = f.read().strip()
+        if token:
+            return token
+    except OSError:
+        pass
+    token = secrets.token_hex(16)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    return token
+
+
+def kill_process_tree(pid):
+    """Kill a bot and everything it spawned (chromedriver, Chrome)"""
+    try:
+        if PSUTIL_AVAILABLE:
+            parent = psutil.Process(pid)
+            procs = parent.children(recursive=True) + [parent]
+            for p in procs:
+                try:
+                    p.kill()
+                except psutil.Error:
+                    pass
+            psutil.wait_procs(procs, timeout=5)
+        elif sys.platform == "win32":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True)
+        else:
+            os.kill(pid, signal.SIGKILL)
+    except Exception:
+        pass
+
+
+def pid_alive(pid):
+    if not pid:
+        return False
+    try:
+        if PSUTIL_AVAILABLE:
+            return psutil.pid_exists(int(pid)) and psutil.Process(int(pid)).status() != psutil.STATUS_ZOMBIE
+        if sys.platform == "win32":
+            result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}"], capture_output=True, text=True,
+                                    timeout=5, creationflags=subprocess.CREATE_NO_WINDOW)
+            return str(pid) in result.stdout
+        os.kill(int(pid), 0)
+        return True
+    except Exception:
+        return False
+
+
+class ManagedBot:
+    """Runtime state of one supervised instance"""
+
+    def __init__(self, name):
+        self.name = name
+        self.state = "stopped"      # stopped | running | backoff | crash_loop | finished
+        self.want_running = False
+        self.process = None         # Popen for children we started
+        self.pid = None             # Also set for bots adopted from an earlier launcher run
+        self.started_at = None
+        self.restart_at = None
+        self.restarts = 0
+        self.crash_times = []
+        self.backoff = BACKOFF_BASE
+        self.last_exit = None
+        self.last_reason = ""
+        self.kill_reason = None     # Why we killed the current run (hang / ceiling / stop timeout)
+        self.stop_deadline = None
+        self.cpu_over = 0
+        self.cpu_percent = None
+        self.memory_mb = None
+        self._ps = None             # Cached psutil.Process objects (cpu_percent needs the same object)
+        self._children = {}
+
+    def to_dict(self):
+        return {
+            "state": self.state,
+            "pid": self.pid,
+            "started_at": self.started_at,
+            "uptime": round(time.time() - self.started_at) if self.started_at and self.pid else 0,
+            "restarts": self.restarts,
+            "restart_in": max(0, round(self.restart_at - time.time())) if self.restart_at else None,
+            "last_exit": self.last_exit,
+            "last_reason": self.last_reason,
+            "cpu_percent": self.cpu_percent,
+            "memory_mb": self.memory_mb,
+        }
+
+
+class Supervisor:
+    """Owns every bot process; all state changes happen under self.lock"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.bots = {}
+        self.running = True
+        self.started_at = time.time()
+
+    # ---------- REGISTRY ----------
+    def _instances(self):
+        # Imported here: multi_bot_launcher delegates to us, so avoid a circular import at load time
+        from multi_bot_launcher import load_instances
+        try:
+            return load_instances()
+        except Exception as e:
+            _log(f"Could not read instances: {e}")
+            return {}
+
+    def _sync_registry(self):
+        """Mirror runtime state into bot_instances.json for tools that still read it directly"""
+        from multi_bot_launcher import load_instances, save_instances
+        try:
+            current = load_instances()
+            changed = False
+            for name, bot in self.bots.items():
+                info = current.get(name)
+                if info is None or info.get("hosted"):
+                    continue  # session_host.py keeps its own sessions' entries
+                status = "running" if bot.pid else ("crashed" if bot.state in ("backoff", "crash_loop") else "stopped")
+                wanted = {"status": status, "process_id": bot.pid,
+                          "start_time": datetime.fromtimestamp(bot.started_at).isoformat() if bot.pid and bot.started_at else None}
+                for key, value in wanted.items():
+                    if value is None:
+                        if key in info:
+                            del info[key]
+                            changed = True
+                    elif info.get(key) != value:
+                        info[key] = value
+                        changed = True
+            if changed:
+                save_instances(current)
+        except Exception as e:
+            _log(f"Could not update instances file: {e}")
+
+    def adopt_running(self):
+        """Take over bots a previous launcher started (we can't reap them, but we can watch them)"""
+        with self.lock:
+            for name, info in self._instances().items():
+                if info.get("hosted"):
+                    continue  # A session inside session_host.py - killing its PID would stop every session
+                bot = self.bots.setdefault(name, ManagedBot(name))
+                pid = info.get("process_id")
+                if info.get("status") == "running" and pid_alive(pid):
+                    bot.pid = int(pid)
+                    bot.state = "running"
+                    bot.want_running = True
+                    try:
+                        bot.started_at = datetime.fromisoformat(info.get("start_time")).timestamp()
+                    except Exception:
+                        bot.started_at = time.time()
+                    _log(f"Adopted '{name}' (PID {pid})")
+
+    # ---------- COMMANDS ----------
+    @staticmethod
+    def _hosted_message(name):
+        return f"Instance '{name}' runs inside session_host.py - start/stop it there"
+
+    def start(self, name):
+        with self.lock:
+            instances = self._instances()
+            if name not in instances:
+                return False, f"Instance '{name}' not found"
+            if instances[name].get("hosted"):
+                return False, self._hosted_message(name)
+            bot = self.bots.setdefault(name, ManagedBot(name))
+            if bot.pid:
+                return False, f"Instance '{name}' is already running (PID {bot.pid})"
+            bot.want_running = True
+            bot.crash_times = []
+            bot.backoff = BACKOFF_BASE
+            bot.restart_at = None
+            # Clear a stop left over from the last run
+            try:
+                write_control_file(_abs(instances[name]["control_file"]), pause=False, stop=False)
+            except Exception:
+                pass
+            ok, msg = self._spawn(bot, instances[name])
+            self._sync_registry()
+            return ok, msg
+
+    def stop(self, name):
+        with self.lock:
+            if self._instances().get(name, {}).get("hosted"):
+                return False, self._hosted_message(name)
+            bot = self.bots.get(name)
+            if not bot or (not bot.pid and bot.state not in ("backoff", "crash_loop")):
+                return False, f"Instance '{name}' is not running"
+            bot.want_running = False
+            bot.restart_at = None
+            if not bot.pid:
+                bot.state = "stopped"
+                self._sync_registry()
+                return True, f"Instance '{name}' stopped"
+            # Ask nicely first; the tick loop kills it after STOP_GRACE
+            info = self._instances().get(name, {})
+            try:
+                write_control_file(_abs(info.get("control_file", f"control_{name}.json")), pause=False, stop=True)
+            except Exception:
+                pass
+            if bot.process:
+                try:
+                    bot.process.terminate()
+                except Exception:
+                    pass
+            bot.stop_deadline = time.time() + STOP_GRACE
+            return True, f"Instance '{name}' stopping"
+
+    def restart(self, name):
+        with self.lock:
+            if self._instances().get(name, {}).get("hosted"):
+                return False, self._hosted_message(name)
+            bot = self.bots.get(name)
+            if bot and bot.pid:
+                self._kill(bot, "restart requested")
+            return self.start(name)
+
+    def state(self):
+        with self.lock:
+            return {
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "psutil": PSUTIL_AVAILABLE,
+                "instances": {name: bot.to_dict() for name, bot in self.bots.items()},
+            }
+
+    # ---------- PROCESS HANDLING ----------
+    def _spawn(self, bot, info):
+        from multi_bot_launcher import build_instance_launch
+        try:
+            cmd, env, log_path = build_instance_launch(bot.name, info)
+            log_handle = open(log_path, "a", encoding="utf-8")
+            bot.process = subprocess.Popen(
+                cmd, cwd=SCRIPT_DIR, env=env, stdout=log_handle, stderr=subprocess.STDOUT,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+            )
+            log_handle.close()  # The child keeps its own handle
+        except Exception as e:
+            bot.state = "stopped"
+            bot.want_running = False
+            bot.last_reason = f"start failed: {e}"
+            _log(f"Failed to start '{bot.name}': {e}")
+            return False, f"Failed to start '{bot.name}': {e}"
+        bot.pid = bot.process.pid
+        bot.started_at = time.time()
+        bot.state = "running"
+        bot.stop_deadline = None
+        bot.cpu_over = 0
+        bot.kill_reason = None
+        bot._ps = None
+        bot._children = {}
+        _log(f"Started '{bot.name}' (PID {bot.pid})")
+        return True, f"Instance '{bot.name}' started (PID {bot.pid})"
+
+    def _kill(self, bot, reason):
+        _log(f"Killing '{bot.name}' (PID {bot.pid}): {reason}")
+        bot.kill_reason = reason
+        kill_process_tree(bot.pid)
+        if bot.process:
+            try:
+                bot.process.wait(timeout=5)  # Reap
+            except Exception:
+                pass
+
+    def _exit_code(self, bot):
+        """Exit code if the bot has exited (reaping it), else None"""
+        if bot.process:
+            return bot.process.poll()
+        return None if pid_alive(bot.pid) else -1
+
+    def _on_exit(self, bot, code, info):
+        snapshot = read_status(instance_status_file(bot.name, info, SCRIPT_DIR)) or {}
+        phase = snapshot.get("phase") if snapshot.get("pid") == bot.pid else None
+        bot.last_exit = code
+        bot.process = None
+        bot.pid = None
+        bot._ps = None
+        bot._children = {}
+        reason, bot.kill_reason = bot.kill_reason, None
+        run_time = time.time() - (bot.started_at or time.time())
+
+        if not bot.want_running:
+            bot.state = "stopped"
+            bot.last_reason = reason or ""
+            _log(f"'{bot.name}' stopped (exit {code})")
+            return
+        if phase in ("finished", "stopped") and not reason:
+            # Clean finish (MAX_JOBS reached or stopped from the control file) - don't restart
+            bot.state = "finished" if phase == "finished" else "stopped"
+            bot.want_running = False
+            bot.last_reason = ""
+            _log(f"'{bot.name}' {phase} (exit {code})")
+            return
+
+        now = time.time()
+        if run_time >= HEALTHY_AFTER:
+            bot.backoff = BACKOFF_BASE
+        bot.crash_times = [t for t in bot.crash_times if now - t < CRASH_LOOP_WINDOW] + [now]
+        if not reason:
+            reason = f"exited with code {code}"
+            if phase == "crashed" and snapshot.get("last_error"):
+                reason += f" ({snapshot['last_error'][:80]})"
+        bot.last_reason = reason
+
+        if len(bot.crash_times) >= CRASH_LOOP_LIMIT:
+            bot.state = "crash_loop"
+            bot.restart_at = None
+            _log(f"'{bot.name}' crashed {len(bot.crash_times)}x in {CRASH_LOOP_WINDOW // 60}m - giving up until started again")
+            return
+
+        bot.state = "backoff"
+        bot.restart_at = now + bot.backoff
+        _log(f"'{bot.name}' {bot.last_reason} - restarting in {bot.backoff}s")
+        bot.backoff = min(bot.backoff * 2, BACKOFF_MAX)
+
+    def _check_heartbeat(self, bot, info):
+        snapshot = read_status(instance_status_file(bot.name, info, SCRIPT_DIR))
+        now = time.time()
+        if not snapshot or snapshot.get("pid") != bot.pid:
+            # Nothing published by this run yet
+            if now - bot.started_at > STARTUP_GRACE:
+                return f"hung: no heartbeat {int(now - bot.started_at)}s after start"
+            return None
+        if snapshot.get("phase") == "paused":
+            return None
+        age = heartbeat_age(snapshot, now)
+        if age is not None and age > HANG_AFTER:
+            return f"hung: no heartbeat for {int(age)}s"
+        return None
+
+    def _check_resources(self, bot, info):
+        """Sample CPU/memory of the bot's process tree and enforce its ceilings"""
+        if not PSUTIL_AVAILABLE:
+            return None
+        try:
+            if bot._ps is None or bot._ps.pid != bot.pid:
+                bot._ps = psutil.Process(bot.pid)
+            # Keep the same Process objects across passes so cpu_percent() has a baseline
+            bot._children = {p.pid: bot._children.get(p.pid, p) for p in bot._ps.children(recursive=True)}
+            procs = [bot._ps] + list(bot._children.values())
+            rss = 0
+            cpu = 0.0
+            for p in procs:
+                try:
+                    rss += p.memory_info().rss
+                    cpu += p.cpu_percent(None)
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            return None
+        bot.memory_mb = round(rss / (1024 * 1024))
+        bot.cpu_percent = round(cpu, 1)
+
+        max_mem = info.get("max_memory_mb")
+        if max_mem and bot.memory_mb > float(max_mem):
+            return f"memory {bot.memory_mb}MB over {max_mem}MB limit"
+        max_cpu = info.get("max_cpu_percent")
+        if max_cpu and bot.cpu_percent > float(max_cpu):
+            bot.cpu_over += 1
+            if bot.cpu_over >= CPU_SUSTAIN_TICKS:
+                return f"cpu {bot.cpu_percent}% over {max_cpu}% limit for {CPU_SUSTAIN_TICKS}s"
+        else:
+            bot.cpu_over = 0
+        return None
+
+    def tick(self):
+        with self.lock:
+            instances = self._instances()
+            for name, info in instances.items():
+                if not info.get("hosted"):
+                    self.bots.setdefault(name, ManagedBot(name))
+
+            for name, bot in list(self.bots.items()):
+                info = instances.get(name)
+                if info is not None and info.get("hosted") and not bot.pid:
+                    del self.bots[name]   # Moved into session_host.py
+                    continue
+                if info is None:
+                    # Removed from the registry
+                    if bot.pid:
+                        bot.want_running = False
+                        self._kill(bot, "instance removed")
+                    del self.bots[name]
+                    continue
+
+                if bot.pid:
+                    code = self._exit_code(bot)
+                    if code is not None:
+                        self._on_exit(bot, code, info)
+                        continue
+                    if bot.stop_deadline and time.time() > bot.stop_deadline:
+                        self._kill(bot, "did not stop in time")
+                        continue
+                    if bot.stop_deadline:
+                        continue
+                    problem = self._check_heartbeat(bot, info) or self._check_resources(bot, info)
+                    if problem:
+                        self._kill(bot, problem)
+                        code = self._exit_code(bot)
+                        self._on_exit(bot, code if code is not None else -9, info)
+                elif bot.state == "backoff" and bot.restart_at and time.time() >= bot.restart_at:
+                    bot.restart_at = None
+                    bot.restarts += 1
+                    self._spawn(bot, info)
+
+            self._sync_registry()
+
+    def run(self):
+        self.adopt_running()
+        while self.running:
+            try:
+                self.tick()
+            except Exception as e:
+                _log(f"Tick failed: {e}")
+            time.sleep(TICK_INTERVAL)
+
+    def shutdown(self, stop_bots=False):
+        self.running = False
+        if stop_bots:
+            with self.lock:
+                for bot in self.bots.values():
+                    if bot.pid:
+                        bot.want_running = False
+                        self._kill(bot, "supervisor shutting down")
+
+
+# ============================================
+# LOCAL API
+# ============================================
+class _ApiHandler(BaseHTTPRequestHandler):
+    supervisor = None
+
+    def _send(self, code, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("", "/status"):
+            self._send(200, self.supervisor.state())
+        else:
+            self._send(404, {"ok": False, "message": "not found"})
+
+    def do_POST(self):
+        from urllib.parse import unquote
+        # Web pages (including the ones open in the bots' own Chrome) can POST to localhost too:
+        # browsers always send Origin, our clients never do, and only they can read the token
+        if self.headers.get("Origin") is not None:
+            self._send(403, {"ok": False, "message": "cross-origin requests are not allowed"})
+            return
+        if not secrets.compare_digest(self.headers.get(TOKEN_HEADER) or "", supervisor_token()):
+            self._send(403, {"ok": False, "message": "missing or wrong token"})
+            return
+        parts = [unquote(p) for p in self.path.strip("/").split("/", 1)]
+        action = parts[0]
+        name = parts[1] if len(parts) > 1 else ""
+        sup = self.supervisor
+
+        if action in ("start", "stop", "restart") and name:
+            ok, msg = getattr(sup, action)(name)
+        elif action in ("start-all", "stop-all"):
+            fn = sup.start if action == "start-all" else sup.stop
+            results = [fn(n) for n, info in list(sup._instances().items()) if not info.get("hosted")]
+            ok = all(r[0] for r in results) if results else False
+            msg = "\n".join(r[1] for r in results) or "No bot instances configured"
+        else:
+            self._send(404, {"ok": False, "message": "unknown command"})
+            return
+        self._send(200, {"ok": ok, "message": msg})
+
+    def log_message(self, format, *args):
+        pass  # Keep the supervisor log readable
+
+
+def supervisor_request(path, method="GET", timeout=2):
+    """Call the local supervisor API. Returns the decoded JSON, or None if it isn't running."""
+    url = f"http://{SUPERVISOR_HOST}:{SUPERVISOR_PORT}/{path.lstrip('/')}"
+    try:
+        headers = {TOKEN_HEADER: supervisor_token()} if method == "POST" else {}
+        req = urllib.request.Request(url, data=b"" if method == "POST" else None, method=method, headers=headers)
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+def supervisor_state(timeout=1):
+    """{name: state dict} from a running supervisor, or None"""
+    state = supervisor_request("status", timeout=timeout)
+    return state.get("instances", {}) if state else None
+
+
+def main():
+    # Instance paths in bot_instances.json are relative to the script directory
+    os.chdir(SCRIPT_DIR)
+    if supervisor_request("status"):
+        print(f"❌ A supervisor is already running on port {SUPERVISOR_PORT}")
+        return
+
+    sup = Supervisor()
+    _ApiHandler.supervisor = sup
+    server = ThreadingHTTPServer((SUPERVISOR_HOST, SUPERVISOR_PORT), _ApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _log(f"Listening on http://{SUPERVISOR_HOST}:{SUPERVISOR_PORT} (psutil: {'yes' if PSUTIL_AVAILABLE else 'no'})")
+
+    def handle_signal(signum, frame):
+        sup.running = False
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    try:
+        sup.run()
+    finally:
+        # Bots keep running; the next supervisor adopts them
+        sup.shutdown(stop_bots=False)
+        server.shutdown()
+        _log("Supervisor stopped")
+
+
+if __name__ == "__main__":
+    main()
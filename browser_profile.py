@@ -0,0 +1,211 @@
+"""
+Lean Browser Profile for SeekMateAI
+Memory is what limits the number of bots per VPS. With "BROWSER_PROFILE": "lean" in the config,
+init_browser starts Chrome with the switches below: no background networking or component
+updates, capped disk/media cache, a limit on renderer processes. Before launch it also deletes the
+profile's caches, so chrome_profile_<name> stops growing. Cookies, logins, local storage and
+preferences are kept. Site isolation stays on unless "BROWSER_SHARE_RENDERERS" is set as well - it
+keeps SEEK and Gmail pages in separate processes.
+
+psutil is optional - only the measure command needs it.
+
+Usage:
+    python browser_profile.py measure [--seconds 300] [--interval 5]
+        (peak and steady-state RSS of every running Chrome, per profile directory)
+    python browser_profile.py prune <profile dir>
+"""
+import os
+import sys
+import time
+import shutil
+import statistics
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+DEFAULT_CACHE_MB = 64
+DEFAULT_RENDERER_LIMIT = 4      # The bot uses the search tab plus one or two job tabs
+
+LEAN_SWITCHES = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-breakpad",
+    "--disable-domain-reliability",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--no-pings",
+    "--metrics-recording-only",
+    "--aggressive-cache-discard",
+    "--disable-back-forward-cache",
+]
+
+# Chrome honours only the last --disable-features, so they are passed as one switch
+LEAN_DISABLED_FEATURES = [
+    "Translate",
+    "OptimizationHints",
+    "OptimizationGuideModelDownloading",
+    "MediaRouter",
+    "AutofillServerCommunication",
+    "InterestFeedContentSuggestions",
+    "CalculateNativeWinOcclusion",
+]
+
+# Opt-in (share_renderers): without site isolation --renderer-process-limit can put different sites
+# in one renderer. That also means one compromised page can read another site's data in memory.
+SITE_ISOLATION_FEATURES = [
+    "site-per-process",
+    "IsolateOrigins",
+]
+
+# Deleted on startup, relative to the profile dir and to each profile inside it ("Default", ...)
+PRUNE_DIRS = [
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "DawnCache",
+    "DawnGraphiteCache",
+    "DawnWebGPUCache",
+    "ShaderCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "Service Worker/CacheStorage",
+    "Service Worker/ScriptCache",
+    "component_crx_cache",
+    "extensions_crx_cache",
+    "optimization_guide_model_store",
+    "OptimizationHints",
+    "BrowserMetrics",
+    "Crashpad",
+    "Safe Browsing",
+    "segmentation_platform",
+]
+
+
+def apply_lean_options(chrome_options, cache_mb=DEFAULT_CACHE_MB, renderer_limit=DEFAULT_RENDERER_LIMIT,
+                       share_renderers=False):
+    """Add the lean switches to a ChromeOptions (uc or plain Selenium)"""
+    for switch in LEAN_SWITCHES:
+        chrome_options.add_argument(switch)
+    features = LEAN_DISABLED_FEATURES + (SITE_ISOLATION_FEATURES if share_renderers else [])
+    chrome_options.add_argument(f"--disable-features={','.join(features)}")
+    chrome_options.add_argument(f"--disk-cache-size={int(cache_mb) * 1024 * 1024}")
+    chrome_options.add_argument(f"--media-cache-size={int(cache_mb) * 1024 * 1024 // 4}")
+    chrome_options.add_argument(f"--renderer-process-limit={int(renderer_limit)}")
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def prune_profile(profile_dir):
+    """Delete cache directories from a Chrome profile (keeps cookies and logins). Returns MB freed."""
+    if not os.path.isdir(profile_dir):
+        return 0.0
+    roots = [profile_dir] + [os.path.join(profile_dir, d) for d in os.listdir(profile_dir)
+                             if d == "Default" or d.startswith("Profile ")]
+    freed = 0
+    for root in roots:
+        for rel in PRUNE_DIRS:
+            path = os.path.join(root, rel)
+            if os.path.isdir(path):
+                size = _dir_size(path)
+                shutil.rmtree(path, ignore_errors=True)
+                freed += size - _dir_size(path)   # Files Chrome still holds open stay
+    return freed / (1024 * 1024)
+
+
+def _user_data_dir(cmdline):
+    for arg in cmdline:
+        if arg.startswith("--user-data-dir="):
+            return os.path.normpath(arg.split("=", 1)[1].strip('"'))
+    return None
+
+
+def chrome_trees():
+    """Profile dir -> browser (root) process of every running Chrome started with --user-data-dir"""
+    trees = {}
+    for p in psutil.process_iter(["name", "cmdline"]):
+        try:
+            cmdline = p.info["cmdline"] or []
+            if "chrome" not in (p.info["name"] or "").lower() or any(a.startswith("--type=") for a in cmdline):
+                continue
+            profile = _user_data_dir(cmdline)
+            if profile:
+                trees[profile] = p
+        except psutil.Error:
+            continue
+    return trees
+
+
+def tree_rss_mb(root):
+    """RSS of the browser process and all its children (renderers, GPU, utility) in MB"""
+    total = 0
+    try:
+        for p in [root] + root.children(recursive=True):
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                pass
+    except psutil.Error:
+        return None
+    return total / (1024 * 1024)
+
+
+def measure(seconds=300, interval=5):
+    """Sample every Chrome tree; steady state is the median of the second half of the samples"""
+    if not PSUTIL_AVAILABLE:
+        print("psutil is not installed (pip install psutil)")
+        return {}
+    samples = {}
+    deadline = time.time() + seconds
+    print(f"Sampling Chrome memory every {interval}s for {seconds}s...")
+    while time.time() < deadline:
+        for profile, root in chrome_trees().items():
+            rss = tree_rss_mb(root)
+            if rss is not None:
+                samples.setdefault(profile, []).append(rss)
+        time.sleep(interval)
+
+    results = {}
+    print(f"{'profile':<45}{'samples':>8}{'peak MB':>10}{'steady MB':>11}")
+    for profile, values in sorted(samples.items()):
+        steady = statistics.median(values[len(values) // 2:])
+        results[profile] = {"peak_mb": max(values), "steady_mb": steady, "samples": len(values)}
+        print(f"{os.path.basename(profile)[:44]:<45}{len(values):>8}{max(values):>10.0f}{steady:>11.0f}")
+    if not samples:
+        print("No Chrome with --user-data-dir running")
+    return results
+
+
+def _arg(name, default):
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "measure":
+        measure(float(_arg("--seconds", 300)), float(_arg("--interval", 5)))
+    elif command == "prune" and len(sys.argv) > 2:
+        print(f"Freed {prune_profile(sys.argv[2]):.0f} MB")
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main()
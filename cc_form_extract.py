@@ -9,7 +9,7 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_cache import plain_driver_path
 
 def resource_path(p):
     try: return os.path.join(sys._MEIPASS, p)
@@ -49,7 +49,7 @@ def init_browser():
             except: pass
     os.makedirs(profile_dir, exist_ok=True)
     chrome_options.add_argument(f"--user-data-dir={profile_dir}")
-    service = Service(ChromeDriverManager().install())
+    service = Service(plain_driver_path())
     try:
         return webdriver.Chrome(service=service, options=chrome_options)
     except:
@@ -68,7 +68,7 @@ def init_browser():
         if os.path.exists(chrome_path):
             opts2.binary_location = chrome_path
         opts2.add_argument(f"--user-data-dir={profile_dir}")
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts2)
+        return webdriver.Chrome(service=Service(plain_driver_path()), options=opts2)
 
 
 def get_label(driver, element):
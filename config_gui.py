@@ -8,22 +8,19 @@ import sys
 import time
 import webbrowser
 import re
+import queue
 import urllib.request
 import urllib.error
 import tempfile
 import shutil
 
-try:
-    import openpyxl
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+from bot_control import write_control_file
+from job_history import JobHistoryIndex, JOB_LOG_FILE, OPENPYXL_AVAILABLE
+from lazy_imports import LazyImport, module_available
 
-try:
-    from plyer import notification
-    NOTIFICATIONS_AVAILABLE = True
-except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
+# Imported on first use - see bench_startup.py
+notification = LazyImport("plyer", "notification")
+NOTIFICATIONS_AVAILABLE = module_available("plyer")
 
 # ================================
 # APP VERSION
@@ -158,6 +155,18 @@ def get_data_dir():
 
 LOG_FILE = os.path.join(get_data_dir(), "log.txt")
 
+# Console pipeline: the log tailer and any thread queue lines, the Tk loop drains them in batches
+CONSOLE_MAX_LINES = 5000      # Scrollback kept in the console
+CONSOLE_BATCH_LINES = 2000    # Most lines written per drain tick
+CONSOLE_DRAIN_MS = 50
+TAIL_BLOCK_SIZE = 64 * 1024
+
+_GPT_MESSAGE_RE = re.compile("|".join(re.escape(k) for k in [
+    "gpt", "chatgpt", "asking gpt", "gpt answered", "gpt selected",
+    "gpt fix", "using gpt", "ai", "validation errors detected"
+]))
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+
 
 # Check for config file from command line argument (for multi-bot instances)
 if len(sys.argv) > 1:
@@ -193,24 +202,7 @@ def save_config(data):
 
 
 def write_control(pause=None, stop=None, recommended=None):
-    data = {"pause": False, "stop": False, "recommended": False}
-    if os.path.exists(CONTROL_FILE):
-        try:
-            with open(CONTROL_FILE, "r") as f:
-                existing = json.load(f)
-                data.update(existing)
-        except:
-            pass
-
-    if pause is not None:
-        data["pause"] = pause
-    if stop is not None:
-        data["stop"] = stop
-    if recommended is not None:
-        data["recommended"] = recommended
-
-    with open(CONTROL_FILE, "w") as f:
-        json.dump(data, f)
+    write_control_file(CONTROL_FILE, pause=pause, stop=stop, recommended=recommended)
 
 
 # ============================================
@@ -719,6 +711,135 @@ class CollapsibleCard(tk.Frame):
         return self.content
 
 
+# ============================================
+# VIRTUAL JOB LIST WIDGET
+# ============================================
+class VirtualJobList(tk.Frame):
+    """
+    Scrollable job list that only draws the rows currently visible.
+    Rows come from fetch(offset, limit), so the list can be backed by any number of jobs.
+    """
+    ROW_HEIGHT = 64
+
+    def __init__(self, parent, height=200, **kwargs):
+        super().__init__(parent, bg=COLORS["bg_card"], **kwargs)
+        self.canvas = tk.Canvas(self, bg=COLORS["bg_dark"], highlightthickness=0, height=height)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.count = 0
+        self.fetch = lambda offset, limit: []
+        self.top = 0            # Scroll offset in pixels
+        self.visible = []       # (row index, job) currently drawn
+        self.hover_index = None
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_pixels(-self.ROW_HEIGHT))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_pixels(self.ROW_HEIGHT))
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self._set_hover(None))
+        self.canvas.bind("<Button-1>", self._on_click)
+
+    def set_rows(self, count, fetch):
+        """Show a new result set and scroll back to the top"""
+        self.count = count
+        self.fetch = fetch
+        self.top = 0
+        self.hover_index = None
+        self.redraw()
+
+    # ---------- SCROLLING ----------
+    def _content_height(self):
+        return self.count * self.ROW_HEIGHT
+
+    def _max_top(self):
+        return max(0, self._content_height() - self.canvas.winfo_height())
+
+    def _scroll_pixels(self, delta):
+        top = min(max(0, self.top + delta), self._max_top())
+        if top != self.top:
+            self.top = top
+            self.redraw()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self._scroll_pixels(int(-1 * (event.delta / 120)) * self.ROW_HEIGHT)
+
+    def yview(self, *args):
+        """Scrollbar command ("moveto", fraction) / ("scroll", n, "units"|"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.top = min(max(0, int(float(args[1]) * self._content_height())), self._max_top())
+            self.redraw()
+        elif args[0] == "scroll":
+            step = self.canvas.winfo_height() if args[2] == "pages" else self.ROW_HEIGHT
+            self._scroll_pixels(int(args[1]) * step)
+
+    # ---------- DRAWING ----------
+    def redraw(self):
+        c = self.canvas
+        c.delete("all")
+        height = c.winfo_height()
+        width = c.winfo_width()
+        total = self._content_height()
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + height) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+        if not self.count:
+            self.visible = []
+            c.create_text(width // 2, 30, text="No jobs found", fill=COLORS["text_muted"], font=FONT_NORMAL)
+            return
+
+        first = self.top // self.ROW_HEIGHT
+        rows = max(1, height // self.ROW_HEIGHT + 2)
+        self.visible = list(enumerate(self.fetch(first, rows), start=first))
+
+        for index, job in self.visible:
+            y = index * self.ROW_HEIGHT - self.top
+            bg = COLORS["bg_card_hover"] if index == self.hover_index else COLORS["bg_card"]
+            c.create_rectangle(5, y, width - 5, y + self.ROW_HEIGHT - 5, fill=bg, outline="")
+
+            # Job title / company and date / link
+            c.create_text(17, y + 8, anchor="nw", text=f"💼 {job['title'][:50]}",
+                          fill=COLORS["text_primary"], font=FONT_BOLD)
+            date_str = job["timestamp"][:10] if len(job["timestamp"]) >= 10 else job["timestamp"]
+            c.create_text(17, y + 26, anchor="nw", text=f"🏢 {job['company']} • 📅 {date_str}",
+                          fill=COLORS["text_secondary"], font=FONT_LABEL)
+            if job["url"]:
+                link = COLORS["accent_secondary"] if index == self.hover_index else COLORS["accent_primary"]
+                c.create_text(17, y + 42, anchor="nw", text="🔗 Click to view job",
+                              fill=link, font=FONT_LABEL)
+
+    # ---------- MOUSE ----------
+    def _index_at(self, y):
+        index = (self.top + y) // self.ROW_HEIGHT
+        return index if 0 <= index < self.count else None
+
+    def _set_hover(self, index):
+        if index != self.hover_index:
+            self.hover_index = index
+            self.redraw()
+
+    def _on_motion(self, event):
+        index = self._index_at(event.y)
+        self._set_hover(index)
+        job = dict(self.visible).get(index) if index is not None else None
+        self.canvas.config(cursor="hand2" if job and job["url"] else "")
+
+    def _on_click(self, event):
+        # Click anywhere on card to open URL
+        index = self._index_at(event.y)
+        job = dict(self.visible).get(index) if index is not None else None
+        if job and job["url"]:
+            webbrowser.open(job["url"])
+
+
 # ============================================
 # PREMIUM TAB BAR WIDGET
 # ============================================
@@ -979,6 +1100,11 @@ class SeekMateGUI:
         self.money_running = False
         self.money_saved = 0.0
 
+        # Console lines queued by log() from any thread, written on the Tk thread by _drain_console
+        self.console_queue = queue.Queue()
+        self._log_count_at = 0.0
+        self._tail_generation = 0
+
         # Configure style for ttk widgets
         self.style = ttk.Style()
         self.style.theme_use('clam')
@@ -2295,25 +2421,22 @@ class SeekMateGUI:
         self.console.tag_bind("link", "<Enter>", lambda e: self.console.config(cursor="hand2"))
         self.console.tag_bind("link", "<Leave>", lambda e: self.console.config(cursor=""))
         self.console.tag_bind("link", "<Button-1>", self.on_link_click)
-        
-        # Store URLs mapped to their position
-        self.link_urls = {}
+
+        # Start writing queued console lines
+        self.root.after(CONSOLE_DRAIN_MS, self._drain_console)
 
     def on_link_click(self, event):
         """Handle click on a link in the log"""
         # Get the index of the click
         index = self.console.index(f"@{event.x},{event.y}")
-        
-        # Find all link tags at this position
-        tags = self.console.tag_names(index)
-        
-        for tag in tags:
-            if tag.startswith("link_"):
-                url = self.link_urls.get(tag)
-                if url:
-                    webbrowser.open(url)
-                    self.log("INFO", f"Opening: {url}")
-                break
+
+        # The link is the "link"-tagged run of text around the click
+        link_range = self.console.tag_prevrange("link", f"{index}+1c")
+        if link_range:
+            url = self.console.get(*link_range)
+            if url:
+                webbrowser.open(url)
+                self.log("INFO", f"Opening: {url}")
 
     def toggle_log_collapse(self):
         """Toggle the log panel collapse state"""
@@ -2378,7 +2501,10 @@ class SeekMateGUI:
         self.history_card.pack(fill="both", expand=True, pady=(10, 0))
         
         self.history_expanded = False  # Start collapsed
-        self.history_data = []  # Store loaded job data
+        self.history_index = JobHistoryIndex(JOB_LOG_FILE)  # Loaded job data + search index
+        self.history_ids = []  # Row ids matching the current search
+        self.history_loading = False
+        self.history_search_job = None
         
         # Header
         header = tk.Frame(self.history_card, bg=COLORS["bg_card"])
@@ -2433,28 +2559,9 @@ class SeekMateGUI:
         self.history_search.bind("<KeyRelease>", self._filter_history)
         self.history_search.config(fg=COLORS["text_muted"])
         
-        # Job list (scrollable)
-        list_frame = tk.Frame(self.history_content, bg=COLORS["bg_card"])
-        list_frame.pack(fill="both", expand=True, padx=20, pady=(0, 15))
-        
-        self.history_canvas = tk.Canvas(list_frame, bg=COLORS["bg_dark"], 
-                                       highlightthickness=0, height=200)
-        history_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", 
-                                         command=self.history_canvas.yview)
-        self.history_list_frame = tk.Frame(self.history_canvas, bg=COLORS["bg_dark"])
-        
-        self.history_list_frame.bind("<Configure>", 
-            lambda e: self.history_canvas.configure(scrollregion=self.history_canvas.bbox("all")))
-        
-        self.history_canvas.create_window((0, 0), window=self.history_list_frame, anchor="nw")
-        self.history_canvas.configure(yscrollcommand=history_scrollbar.set)
-        
-        self.history_canvas.pack(side="left", fill="both", expand=True)
-        history_scrollbar.pack(side="right", fill="y")
-        
-        # Bind mousewheel
-        self.history_canvas.bind_all("<MouseWheel>", 
-            lambda e: self.history_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        # Job list (virtualized - only visible rows are drawn)
+        self.history_list = VirtualJobList(self.history_content, height=200)
+        self.history_list.pack(fill="both", expand=True, padx=20, pady=(0, 15))
         
         # Load initial data
         self.load_job_history()
@@ -2472,11 +2579,18 @@ class SeekMateGUI:
             self.history_search.config(fg=COLORS["text_muted"])
     
     def _filter_history(self, event=None):
-        """Filter displayed jobs based on search"""
+        """Filter displayed jobs based on search (debounced while typing)"""
+        if self.history_search_job:
+            self.root.after_cancel(self.history_search_job)
+        self.history_search_job = self.root.after(150, self._apply_history_filter)
+    
+    def _history_query(self):
         query = self.history_search.get().strip().lower()
-        if query == "search jobs...":
-            query = ""
-        self._display_jobs(query)
+        return "" if query == "search jobs..." else query
+    
+    def _apply_history_filter(self):
+        self.history_search_job = None
+        self._display_jobs(self._history_query())
     
     def toggle_history_collapse(self):
         """Toggle history panel collapse"""
@@ -2491,129 +2605,49 @@ class SeekMateGUI:
             self.history_content.pack_forget()
     
     def load_job_history(self):
-        """Load job history from job_log.xlsx"""
-        self.history_data = []
-        
+        """Load job history from job_log.xlsx in the background (only re-read when the file changed)"""
         if not OPENPYXL_AVAILABLE:
             self.history_count_label.config(text="(openpyxl not installed)")
             return
-        
-        job_log_path = "job_log.xlsx"
-        if not os.path.exists(job_log_path):
-            self.history_count_label.config(text="(no jobs yet)")
-            self._display_jobs()
+        if self.history_loading:
             return
         
-        try:
-            wb = openpyxl.load_workbook(job_log_path)
-            ws = wb.active
-            
-            # Skip header row, load all data
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if row[0]:  # Has timestamp
-                    self.history_data.append({
-                        "timestamp": str(row[0]) if row[0] else "",
-                        "title": str(row[1]) if row[1] else "Unknown",
-                        "company": str(row[2]) if row[2] else "Unknown",
-                        "url": str(row[3]) if row[3] else ""
-                    })
-            
-            wb.close()
-            
-            # Sort by timestamp descending (newest first)
-            self.history_data.sort(key=lambda x: x["timestamp"], reverse=True)
-            
-            self.history_count_label.config(text=f"({len(self.history_data)} jobs)")
-            self._display_jobs()
-            
-        except Exception as e:
-            self.history_count_label.config(text=f"(error loading)")
-            print(f"Error loading job history: {e}")
-    
-    def _display_jobs(self, filter_query=""):
-        """Display job cards in the history list"""
-        # Clear existing items
-        for widget in self.history_list_frame.winfo_children():
-            widget.destroy()
+        self.history_loading = True
+        if not len(self.history_index):
+            self.history_count_label.config(text="(loading...)")
         
-        # Filter jobs
-        if filter_query:
-            filtered = [j for j in self.history_data 
-                       if filter_query in j["title"].lower() or filter_query in j["company"].lower()]
-        else:
-            filtered = self.history_data
+        def worker():
+            try:
+                self.history_index.load()
+                error = None
+            except Exception as e:
+                error = e
+            self.root.after(0, lambda: self._on_history_loaded(error))
         
-        if not filtered:
-            no_jobs = tk.Label(self.history_list_frame, text="No jobs found",
-                              bg=COLORS["bg_dark"], fg=COLORS["text_muted"],
-                              font=FONT_NORMAL)
-            no_jobs.pack(pady=20)
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_history_loaded(self, error):
+        self.history_loading = False
+        if error:
+            self.history_count_label.config(text=f"(error loading)")
+            print(f"Error loading job history: {error}")
             return
         
-        # Create job cards
-        for job in filtered[:100]:  # Limit to 100 for performance
-            self._create_job_card(job)
+        total = len(self.history_index)
+        self.history_count_label.config(text=f"({total} jobs)" if total else "(no jobs yet)")
+        self._display_jobs(self._history_query())
     
-    def _create_job_card(self, job):
-        """Create a single job card in the history"""
-        card = tk.Frame(self.history_list_frame, bg=COLORS["bg_card"], cursor="hand2")
-        card.pack(fill="x", pady=(0, 5), padx=5)
-        
-        inner = tk.Frame(card, bg=COLORS["bg_card"])
-        inner.pack(fill="x", padx=12, pady=10)
-        
-        # Job title
-        title_label = tk.Label(inner, text=f"💼 {job['title'][:50]}",
-                              bg=COLORS["bg_card"], fg=COLORS["text_primary"],
-                              font=FONT_BOLD, anchor="w")
-        title_label.pack(fill="x")
-        
-        # Company and date
-        date_str = job["timestamp"][:10] if len(job["timestamp"]) >= 10 else job["timestamp"]
-        info_label = tk.Label(inner, text=f"🏢 {job['company']} • 📅 {date_str}",
-                             bg=COLORS["bg_card"], fg=COLORS["text_secondary"],
-                             font=FONT_LABEL, anchor="w")
-        info_label.pack(fill="x")
-        
-        # URL link
-        if job["url"]:
-            url_label = tk.Label(inner, text="🔗 Click to view job",
-                                bg=COLORS["bg_card"], fg=COLORS["accent_primary"],
-                                font=FONT_LABEL, anchor="w", cursor="hand2")
-            url_label.pack(fill="x")
-            url_label.bind("<Button-1>", lambda e, url=job["url"]: webbrowser.open(url))
-            
-            # Hover effects
-            def on_enter(e, lbl=url_label):
-                lbl.config(fg=COLORS["accent_secondary"])
-            def on_leave(e, lbl=url_label):
-                lbl.config(fg=COLORS["accent_primary"])
-            url_label.bind("<Enter>", on_enter)
-            url_label.bind("<Leave>", on_leave)
-        
-        # Card hover effect
-        def card_enter(e, c=card, i=inner, t=title_label, inf=info_label):
-            c.config(bg=COLORS["bg_card_hover"])
-            i.config(bg=COLORS["bg_card_hover"])
-            t.config(bg=COLORS["bg_card_hover"])
-            inf.config(bg=COLORS["bg_card_hover"])
-        def card_leave(e, c=card, i=inner, t=title_label, inf=info_label):
-            c.config(bg=COLORS["bg_card"])
-            i.config(bg=COLORS["bg_card"])
-            t.config(bg=COLORS["bg_card"])
-            inf.config(bg=COLORS["bg_card"])
-        
-        card.bind("<Enter>", card_enter)
-        card.bind("<Leave>", card_leave)
-        inner.bind("<Enter>", card_enter)
-        inner.bind("<Leave>", card_leave)
+    def _display_jobs(self, filter_query=""):
+        """Show the jobs matching the search; the list fetches visible rows on demand"""
+        self.history_ids = self.history_index.search(filter_query)
+        ids = self.history_ids
+        self.history_list.set_rows(len(ids),
+                                   lambda offset, limit: self.history_index.page(ids, offset, limit))
         
-        # Click anywhere on card to open URL
-        if job["url"]:
-            card.bind("<Button-1>", lambda e, url=job["url"]: webbrowser.open(url))
-            inner.bind("<Button-1>", lambda e, url=job["url"]: webbrowser.open(url))
-            title_label.bind("<Button-1>", lambda e, url=job["url"]: webbrowser.open(url))
-            info_label.bind("<Button-1>", lambda e, url=job["url"]: webbrowser.open(url))
+        if filter_query:
+            self.history_count_label.config(text=f"({len(ids)} of {len(self.history_index)} jobs)")
+        elif len(self.history_index):
+            self.history_count_label.config(text=f"({len(self.history_index)} jobs)")
 
     # ============================================================
     # FORM HELPERS
@@ -3106,55 +3140,69 @@ rm "$0"
     # LOGGING SYSTEM
     # ============================================================
     def log(self, level, message):
-        timestamp = time.strftime("[%H:%M:%S]")
-        
-        # Check if this is a GPT-related message
-        is_gpt_message = any(keyword in message.lower() for keyword in [
-            "gpt", "chatgpt", "asking gpt", "gpt answered", "gpt selected", 
-            "gpt fix", "using gpt", "ai", "validation errors detected"
-        ])
-        
-        # Insert timestamp with muted color
-        self.console.insert(tk.END, f"{timestamp} ", "timestamp")
-        
-        # Insert level and message with appropriate color
-        level_text = f"{level.upper()}: "
-        
-        if is_gpt_message:
-            # Use vibrant GPT color for the entire line
-            self.console.insert(tk.END, "🤖 ", "GPT")
-            self.console.insert(tk.END, level_text, "GPT")
-        else:
-            self.console.insert(tk.END, level_text, level.upper())
-        
-        # Check for URLs in the message and make them clickable
-        url_pattern = r'(https?://[^\s]+)'
-        parts = re.split(url_pattern, message)
-        
-        for part in parts:
-            if re.match(url_pattern, part):
-                # This is a URL - make it clickable
-                link_tag = f"link_{len(self.link_urls)}"
-                self.link_urls[link_tag] = part
-                start_index = self.console.index(tk.END)
-                self.console.insert(tk.END, part, ("link", link_tag))
+        """Queue a console line. Safe from any thread; written by _drain_console on the Tk thread."""
+        self.console_queue.put([(time.strftime("[%H:%M:%S]"), level, str(message))])
+
+    def _drain_console(self):
+        entries = []
+        try:
+            while len(entries) < CONSOLE_BATCH_LINES:
+                entries.extend(self.console_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if entries:
+            try:
+                self._write_console(entries)
+            except Exception as e:
+                print(f"Console error: {e}")
+        self.root.after(CONSOLE_DRAIN_MS, self._drain_console)
+
+    def _write_console(self, entries):
+        """Write a batch of (timestamp, level, message) lines with one insert, then trim the scrollback"""
+        args = []
+        submissions = None
+        for timestamp, level, message in entries:
+            # GPT-related messages get the vibrant GPT color for the entire line
+            is_gpt_message = _GPT_MESSAGE_RE.search(message.lower()) is not None
+            args.extend((f"{timestamp} ", "timestamp"))
+            level_text = f"{level.upper()}: "
+            if is_gpt_message:
+                args.extend((f"🤖 {level_text}", "GPT"))
             else:
-                # Regular text - use GPT color if it's a GPT message
-                if is_gpt_message:
-                    self.console.insert(tk.END, part, "GPT")
+                args.extend((level_text, level.upper()))
+
+            # URLs are clickable (odd parts of the split are the URLs)
+            for i, part in enumerate(_URL_RE.split(message)):
+                if not part:
+                    continue
+                if i % 2:
+                    args.extend((part, "link"))
                 else:
-                    self.console.insert(tk.END, part)
+                    args.extend((part, "GPT" if is_gpt_message else ()))
+            args.extend(("\n", ()))
 
-        self.console.insert(tk.END, "\n")
+            if "Successful submissions:" in message:
+                try:
+                    submissions = int(message.split(":")[-1].strip())
+                except ValueError:
+                    pass
+
+        self.console.insert(tk.END, *args)
+        line_count = int(self.console.index("end-1c").split(".")[0])
+        if line_count > CONSOLE_MAX_LINES:
+            self.console.delete("1.0", f"{line_count - CONSOLE_MAX_LINES + 1}.0")
         self.console.see(tk.END)
-        
-        # Update line count (every 10 logs to avoid slowdown)
-        try:
-            line_count = int(self.console.index('end-1c').split('.')[0])
-            if line_count % 10 == 0:
-                self.update_log_count()
-        except:
-            pass
+
+        if submissions is not None:
+            self.counter_label.config(text=str(submissions))
+            # Update time saved (2 mins per application)
+            self.update_time_saved(submissions)
+
+        # Line count indicator at most once a second during bursts
+        now = time.time()
+        if now - self._log_count_at >= 1:
+            self._log_count_at = now
+            self.update_log_count()
 
     def apply_filter(self):
         keyword = self.filter_var.get().strip().lower()
@@ -3176,7 +3224,6 @@ rm "$0"
 
     def clear_log(self):
         self.console.delete("1.0", tk.END)
-        self.link_urls = {}  # Reset link tracking
         self.update_log_count()
 
     # ============================================================
@@ -3545,35 +3592,44 @@ rm "$0"
     # LOG TAILING
     # ============================================================
     def tail_log(self):
+        """
+        Producer side of the console: reads the bot log in blocks and queues whole lines.
+        A newer tail_log (bot restarted) makes this one exit.
+        """
+        self._tail_generation += 1
+        generation = self._tail_generation
+
         # Wait for log file to be created by bot
         while not os.path.exists(LOG_FILE):
+            if generation != self._tail_generation:
+                return
             time.sleep(0.2)
 
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
+        partial = ""
+        with open(LOG_FILE, "r", encoding="utf-8", errors="ignore") as f:
             f.seek(0)
-            while True:
-                line = f.readline()
-                if not line:
+            while generation == self._tail_generation:
+                block = f.read(TAIL_BLOCK_SIZE)
+                if not block:
                     time.sleep(0.1)
                     continue
 
-                clean = line.strip()
-                if "ERROR" in clean.upper():
-                    self.log("ERROR", clean)
-                elif "SUCCESS" in clean.upper():
-                    self.log("SUCCESS", clean)
-                else:
-                    self.log("INFO", clean)
-
-                if "Successful submissions:" in clean:
-                    try:
-                        num = int(clean.split(":")[-1].strip())
-                        self.counter_label.config(text=str(num))
-                        # Update time saved (2 mins per application)
-                        self.update_time_saved(num)
-                        # Notification sounds removed per user request
-                    except:
-                        pass
+                lines = (partial + block).split("\n")
+                partial = lines.pop()  # Incomplete last line, finished by the next block
+                batch = []
+                timestamp = time.strftime("[%H:%M:%S]")
+                for line in lines:
+                    clean = line.strip()
+                    upper = clean.upper()
+                    if "ERROR" in upper:
+                        level = "ERROR"
+                    elif "SUCCESS" in upper:
+                        level = "SUCCESS"
+                    else:
+                        level = "INFO"
+                    batch.append((timestamp, level, clean))
+                if batch:
+                    self.console_queue.put(batch)
 
     # ============================================================
     # SYSTEM TEST
@@ -0,0 +1,220 @@
+"""
+Chromedriver Cache for SeekMateAI
+uc.Chrome() and ChromeDriverManager().install() resolve (and uc downloads and binary-patches)
+chromedriver on every browser start - in every bot instance, sometimes at the same moment on the same
+file. Here each driver is prepared once per Chrome major version under a cross-process lock, published
+atomically into <data dir>/drivers/<major>/ and then only read by every process that starts Chrome.
+
+StartupTimer gives the breakdown of a browser start (driver preparation, Chrome launch, first page).
+
+Usage:
+    python driver_cache.py            (show the installed Chrome version and cached drivers)
+    python driver_cache.py prepare    (prepare the drivers now, e.g. after a Chrome update)
+"""
+import os
+import re
+import sys
+import time
+import shutil
+import threading
+import subprocess
+
+from bot_status import get_data_dir
+
+LOCK_STALE_SECONDS = 300    # A lock older than this was left by a crashed process
+LOCK_WAIT_SECONDS = 600
+
+_EXE = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+_process_lock = threading.Lock()
+_resolved = {}
+
+
+def cache_dir():
+    return os.path.join(get_data_dir(), "drivers")
+
+
+def _chrome_version_windows():
+    import winreg
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def _chrome_binary():
+    try:
+        import undetected_chromedriver as uc
+        return uc.find_chrome_executable()
+    except Exception:
+        pass
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        path = shutil.which(name)
+        if path:
+            return path
+    if sys.platform == "darwin":
+        return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+    return None
+
+
+def chrome_major_version():
+    """Major version of the installed Chrome (e.g. 131), or None if it can't be found"""
+    version = None
+    try:
+        if sys.platform == "win32":
+            version = _chrome_version_windows()
+        else:
+            binary = _chrome_binary()
+            if binary:
+                version = subprocess.run([binary, "--version"], capture_output=True, text=True,
+                                         timeout=15).stdout
+    except Exception:
+        version = None
+    match = re.search(r"(\d+)\.\d+", version or "")
+    return int(match.group(1)) if match else None
+
+
+class _FileLock:
+    """Cross-process lock: a lock file created with O_EXCL (stale after LOCK_STALE_SECONDS)"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        deadline = time.time() + LOCK_WAIT_SECONDS
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > LOCK_STALE_SECONDS:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                time.sleep(0.5)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _publish(source, dest):
+    """Copy `source` next to `dest`, make it read-only executable, then os.replace() it into place"""
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    shutil.copyfile(source, tmp)
+    if sys.platform != "win32":
+        os.chmod(tmp, 0o555)
+    os.replace(tmp, dest)
+
+
+def _is_patched(path):
+    try:
+        import undetected_chromedriver as uc
+        return uc.Patcher(executable_path=path).is_binary_patched(path)
+    except Exception:
+        return False
+
+
+def _cached(kind, major, prepare, is_valid=os.path.exists):
+    """Path of the `kind` driver for Chrome `major`, preparing it (once, under the lock) if needed"""
+    key = (kind, major)
+    if key in _resolved:
+        return _resolved[key]
+    directory = os.path.join(cache_dir(), str(major))
+    dest = os.path.join(directory, _EXE if kind == "patched" else f"plain-{_EXE}")
+    with _process_lock:
+        if not is_valid(dest):
+            os.makedirs(directory, exist_ok=True)
+            with _FileLock(os.path.join(directory, f"{kind}.lock")):
+                # Another process may have finished it while we waited for the lock
+                if not is_valid(dest):
+                    started = time.time()
+                    _publish(prepare(), dest)
+                    print(f"[BROWSER] Prepared {kind} chromedriver for Chrome {major} "
+                          f"in {time.time() - started:.1f}s -> {dest}")
+        _resolved[key] = dest
+    return dest
+
+
+def patched_driver_path(major=None):
+    """
+    undetected_chromedriver-patched chromedriver for the installed Chrome, or None when the Chrome
+    version can't be determined (then uc.Chrome() prepares its own driver as before)
+    """
+    major = major or chrome_major_version()
+    if not major:
+        return None
+
+    def prepare():
+        import undetected_chromedriver as uc
+        patcher = uc.Patcher(version_main=major)
+        patcher.auto()
+        return patcher.executable_path
+
+    try:
+        return _cached("patched", major, prepare, is_valid=lambda p: os.path.exists(p) and _is_patched(p))
+    except Exception as e:
+        print(f"[BROWSER] Driver cache unavailable, uc will patch its own driver: {e}")
+        return None
+
+
+def plain_driver_path(major=None):
+    """Unpatched chromedriver for plain Selenium (ChromeDriverManager resolved once per Chrome version)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    major = major or chrome_major_version()
+    if not major:
+        return ChromeDriverManager().install()
+    try:
+        return _cached("plain", major, lambda: ChromeDriverManager().install())
+    except Exception as e:
+        print(f"[BROWSER] Driver cache unavailable: {e}")
+        return ChromeDriverManager().install()
+
+
+class StartupTimer:
+    """Durations of the steps of one browser start: timer.mark("driver") after each step"""
+
+    def __init__(self):
+        self.started = self._last = time.time()
+        self.steps = []
+
+    def mark(self, step):
+        now = time.time()
+        self.steps.append((step, now - self._last))
+        self._last = now
+
+    def has(self, step):
+        return any(name == step for name, _ in self.steps)
+
+    def summary(self):
+        parts = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.steps)
+        return f"{parts} (total {self._last - self.started:.1f}s)"
+
+
+def main():
+    major = chrome_major_version()
+    print(f"Installed Chrome: {major or 'not found'}")
+    if len(sys.argv) > 1 and sys.argv[1] == "prepare":
+        if not major:
+            return
+        print(f"Patched: {patched_driver_path(major)}")
+        print(f"Plain:   {plain_driver_path(major)}")
+        return
+    root = cache_dir()
+    for version in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+        files = [f for f in os.listdir(os.path.join(root, version)) if not f.endswith((".lock", ".tmp"))]
+        print(f"  Chrome {version}: {', '.join(files) or '(empty)'}")
+
+
+if __name__ == "__main__":
+    main()
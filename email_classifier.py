@@ -0,0 +1,306 @@
+"""
+Local Email Triage Classifier for SeekMateAI
+Gmail cleanup mail is extremely repetitive ("Acme has viewed your application for Developer"), so
+most verdicts can be made locally instead of with a GPT call per email. Two models, both trained
+incrementally from the verdicts GPT already gave (every decision is appended to email_verdicts.jsonl):
+  1. subject templates - names and numbers replaced by "*"; a template seen often enough with one
+     verdict decides directly
+  2. a small logistic regression over word 1-2 grams of subject + snippet
+Only confident predictions are used - everything else still goes to GPT. The preserve-pattern safety
+net in gmail_rules runs before either model.
+
+Usage:
+    python email_classifier.py eval [--log PATH] [--split 0.8]   (offline accuracy / coverage on the log)
+    python email_classifier.py train [--log PATH]                (rebuild the model from the log)
+    python email_classifier.py check "<subject>" ["<snippet>"]
+"""
+import os
+import re
+import sys
+import json
+import math
+import time
+import threading
+
+from bot_status import get_data_dir, write_json_atomic
+
+MODEL_VERSION = 1
+MIN_TRAINED = 30            # Examples before any local decision is made
+TEMPLATE_MIN_COUNT = 3      # Times a template must be seen...
+TEMPLATE_PURITY = 0.95      # ...with (nearly) one verdict
+TEMPLATE_MIN_LITERALS = 3   # Literal words a template needs to decide ("* has viewed your ...", not "*")
+DELETE_THRESHOLD = 0.97     # Logistic probability needed to delete without GPT
+KEEP_THRESHOLD = 0.05       # ...or to keep without GPT
+MIN_KNOWN_FEATURES = 0.5    # Share of the email's features the model must have seen
+LEARNING_RATE = 0.2
+L2 = 1e-4
+SAVE_EVERY = 20             # Updates between model saves
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_EMAIL_RE = re.compile(r"\S+@\S+")
+_NUMBER_RE = re.compile(r"\d[\d,.:/-]*")
+_WORD_RE = re.compile(r"[A-Za-z<>']+")
+
+
+def default_model_file():
+    return os.path.join(get_data_dir(), "email_classifier.json")
+
+
+def default_log_file():
+    return os.path.join(get_data_dir(), "email_verdicts.jsonl")
+
+
+def _words(text):
+    text = _URL_RE.sub(" <url> ", text or "")
+    text = _EMAIL_RE.sub(" <email> ", text)
+    text = _NUMBER_RE.sub(" <n> ", text)
+    return _WORD_RE.findall(text)
+
+
+def subject_template(subject, first_is_name=False):
+    """
+    "Acme Corp has viewed your application for Senior Developer" -> "acme * has viewed your application for *"
+    Capitalised words after the first (names, companies, job titles) and numbers become "*";
+    first_is_name=True treats a capitalised first word the same way ("* has viewed ...").
+    """
+    out = []
+    for i, word in enumerate(_words(subject)):
+        slot = word == "<n>" or ((i > 0 or first_is_name) and word[:1].isupper())
+        token = "*" if slot else word.lower()
+        if not (token == "*" and out and out[-1] == "*"):
+            out.append(token)
+    return " ".join(out)
+
+
+def literal_words(template):
+    return sum(1 for token in template.split() if token != "*")
+
+
+def subject_templates(subject):
+    """
+    Exact-first-word template, plus the variant where the first word is a name if they differ.
+    The named variant of a Title Case subject ("Welcome Aboard" -> "*") has no literal word left
+    and would match every such subject, so it is dropped.
+    """
+    templates = [subject_template(subject)]
+    named = subject_template(subject, first_is_name=True)
+    if named != templates[0] and literal_words(named):
+        templates.append(named)
+    return templates
+
+
+def features(subject, snippet=""):
+    words = [w.lower() for w in _words(subject)]
+    feats = {"t:" + t for t in subject_templates(subject)}
+    feats.update("w:" + w for w in words)
+    feats.update(f"b:{a}_{b}" for a, b in zip(words, words[1:]))
+    feats.update("s:" + w.lower() for w in _words(snippet)[:40])
+    return feats
+
+
+def _sigmoid(z):
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+class EmailClassifier:
+    """Template table + logistic model. predict() -> True (delete) / False (keep) / None (ask GPT)"""
+
+    def __init__(self, model_file=None, log_file=None):
+        self.model_file = model_file or default_model_file()
+        self.log_file = log_file or default_log_file()
+        self.weights = {}
+        self.bias = 0.0
+        self.templates = {}      # template -> [keep count, delete count]
+        self.trained = 0
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, model_file=None, log_file=None):
+        """Saved model if there is one, otherwise trained from the verdict log (if any)"""
+        model = cls(model_file, log_file)
+        try:
+            with open(model.model_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MODEL_VERSION:
+                model.weights = data.get("weights", {})
+                model.bias = data.get("bias", 0.0)
+                model.templates = data.get("templates", {})
+                model.trained = data.get("trained", 0)
+                return model
+        except (OSError, ValueError):
+            pass
+        model.train_from_log()
+        return model
+
+    # ---------- PREDICTION ----------
+    def probability(self, subject, snippet=""):
+        """(P(delete), share of features the model knows)"""
+        feats = features(subject, snippet)
+        known = [f for f in feats if f in self.weights]
+        z = self.bias + sum(self.weights[f] for f in known)
+        return _sigmoid(z), len(known) / len(feats)
+
+    def predict(self, subject, snippet=""):
+        """(verdict, how) - verdict None means not confident enough to skip GPT"""
+        if self.trained < MIN_TRAINED or not (subject or snippet):
+            return None, "untrained"
+        for template in subject_templates(subject):
+            if literal_words(template) < TEMPLATE_MIN_LITERALS:
+                continue    # "reference * *" says too little about the email to skip GPT
+            counts = self.templates.get(template)
+            if counts and sum(counts) >= TEMPLATE_MIN_COUNT:
+                keep, delete = counts
+                if delete / (keep + delete) >= TEMPLATE_PURITY:
+                    return True, "template"
+                if keep / (keep + delete) >= TEMPLATE_PURITY:
+                    return False, "template"
+                break   # Template seen with both verdicts - let the model weigh the words
+        p, known = self.probability(subject, snippet)
+        if known >= MIN_KNOWN_FEATURES:
+            if p >= DELETE_THRESHOLD:
+                return True, f"model {p:.2f}"
+            if p <= KEEP_THRESHOLD:
+                return False, f"model {p:.2f}"
+        return None, f"unsure {p:.2f}"
+
+    # ---------- TRAINING ----------
+    def _update(self, subject, snippet, delete):
+        for template in subject_templates(subject):
+            self.templates.setdefault(template, [0, 0])[1 if delete else 0] += 1
+        feats = features(subject, snippet)
+        z = self.bias + sum(self.weights.get(f, 0.0) for f in feats)
+        grad = (1.0 if delete else 0.0) - _sigmoid(z)
+        self.bias += LEARNING_RATE * grad
+        for f in feats:
+            w = self.weights.get(f, 0.0)
+            self.weights[f] = w + LEARNING_RATE * (grad - L2 * w)
+        self.trained += 1
+
+    def learn(self, subject, snippet, delete, source="gpt"):
+        """Add one verdict (from GPT) to the model and the log"""
+        if not (subject or snippet):
+            return
+        with self._lock:
+            self._update(subject, snippet, delete)
+            self._unsaved += 1
+            try:
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"subject": subject, "snippet": snippet,
+                                        "verdict": "DELETE" if delete else "KEEP",
+                                        "source": source, "at": int(time.time())}) + "\n")
+            except OSError as e:
+                print(f"[Gmail] Could not log verdict: {e}")
+        if self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    def train_from_log(self, entries=None):
+        entries = read_log(self.log_file) if entries is None else entries
+        for entry in entries:
+            self._update(entry["subject"], entry.get("snippet", ""), entry["verdict"] == "DELETE")
+        return len(entries)
+
+    def save(self):
+        with self._lock:
+            if not self._unsaved and os.path.exists(self.model_file):
+                return
+            data = {"version": MODEL_VERSION, "trained": self.trained, "bias": self.bias,
+                    "weights": self.weights, "templates": self.templates}
+            self._unsaved = 0
+        try:
+            write_json_atomic(self.model_file, data)
+        except Exception as e:
+            print(f"[Gmail] Could not save email classifier: {e}")
+
+
+def read_log(path=None):
+    """Verdict log entries, oldest first (unreadable lines skipped)"""
+    entries = []
+    try:
+        with open(path or default_log_file(), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if entry.get("verdict") in ("KEEP", "DELETE"):
+                        entries.append(entry)
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
+def evaluate(entries, split=0.8):
+    """
+    Train on the first `split` of the log, then go through the rest in order: predict, score against
+    the logged GPT verdict, learn it (as the bot would). Returns a dict of counts.
+    """
+    cut = int(len(entries) * split)
+    model = EmailClassifier(model_file=os.devnull, log_file=os.devnull)
+    model.train_from_log(entries[:cut])
+    stats = {"train": cut, "test": len(entries) - cut, "local": 0, "correct": 0,
+             "false_delete": 0, "false_keep": 0, "template": 0}
+    for entry in entries[cut:]:
+        delete = entry["verdict"] == "DELETE"
+        verdict, how = model.predict(entry["subject"], entry.get("snippet", ""))
+        if verdict is not None:
+            stats["local"] += 1
+            stats["template"] += how == "template"
+            if verdict == delete:
+                stats["correct"] += 1
+            elif verdict:
+                stats["false_delete"] += 1
+            else:
+                stats["false_keep"] += 1
+        model._update(entry["subject"], entry.get("snippet", ""), delete)
+    return stats
+
+
+def _arg(name, default=None):
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    log_file = _arg("--log", default_log_file())
+
+    if command == "eval":
+        entries = read_log(log_file)
+        if not entries:
+            print(f"No verdicts in {log_file}")
+            return
+        s = evaluate(entries, float(_arg("--split", "0.8")))
+        test = s["test"] or 1
+        local = s["local"] or 1
+        print(f"Verdict log: {len(entries)} entries ({s['train']} train / {s['test']} test)")
+        print(f"Decided locally: {s['local']}/{s['test']} ({100 * s['local'] / test:.1f}%), "
+              f"{s['template']} by template")
+        print(f"Accuracy of local decisions: {100 * s['correct'] / local:.1f}%")
+        print(f"Wrongly deleted: {s['false_delete']}   Wrongly kept: {s['false_keep']}")
+        print(f"GPT calls saved: {s['local']} of {s['test']}")
+    elif command == "train":
+        model = EmailClassifier(log_file=log_file)
+        count = model.train_from_log()
+        model._unsaved = count
+        model.save()
+        print(f"Trained on {count} verdicts -> {model.model_file}")
+    elif command == "check" and len(sys.argv) > 2:
+        model = EmailClassifier.load(log_file=log_file)
+        subject = sys.argv[2]
+        snippet = sys.argv[3] if len(sys.argv) > 3 else ""
+        verdict, how = model.predict(subject, snippet)
+        label = "ask GPT" if verdict is None else ("DELETE" if verdict else "KEEP")
+        print(f"{label} ({how}) - template: {subject_template(subject)}")
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main()
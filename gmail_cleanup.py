@@ -2,42 +2,202 @@
 Gmail Email Cleanup Selector
 Deletes emails matching certain patterns while preserving action-required emails
 Uses GPT Vision to analyze emails via screenshots and intelligently decide what to delete
-Runs in a separate browser window to avoid interfering with Seek/Indeed bots
+Runs in a separate browser window to avoid interfering with Seek/Indeed bots - either a second
+Chrome, or (attach_to=<bot driver>) a background window of the bot's own Chrome driven by its own
+WebDriver session, which saves a whole browser per profile
 """
 import time
 import re
-import base64
 import os
 import sys
+import urllib.parse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_cache import plain_driver_path, patched_driver_path
 
-# Try to import OpenAI
+from lazy_imports import module_available
+
+# Clients come from llm_gateway.make_openai_client - only check the SDK is there
+OPENAI_AVAILABLE = module_available("openai")
+
+# Memory reporting for the two browser modes
 try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
+    import psutil
+    PSUTIL_AVAILABLE = True
 except ImportError:
-    OPENAI_AVAILABLE = False
+    PSUTIL_AVAILABLE = False
+
+# Cleanup is the lowest priority class on the shared LLM gateway
+from llm_gateway import make_openai_client, priority_headers
+from gmail_rules import EmailTriage, SeenThreads, compile_search_queries
+from vision_image import prepare_screenshot, record_call
+
+# Stop scanning the inbox after this many rows in a row that were already classified KEEP
+SEEN_STOP_RUN = 5
+
+_MONTH_PREFIXES = ('Jan ', 'Feb ', 'Mar ', 'Apr ', 'May ', 'Jun ', 'Jul ', 'Aug ', 'Sep ', 'Oct ', 'Nov ', 'Dec ')
+
+# One round trip for the whole inbox: every visible row with its thread ID, sender, subject and
+# snippet. Rows are tagged data-seekmate-row=<index> so SELECT_ROWS_SCRIPT can find them again.
+SNAPSHOT_SCRIPT = """
+var main = document.querySelector("div[role='main']") || document.body;
+var old = main.querySelectorAll('[data-seekmate-row]');
+for (var k = 0; k < old.length; k++) old[k].removeAttribute('data-seekmate-row');
+var rows = main.querySelectorAll("tr.zA");
+if (rows.length === 0) rows = main.querySelectorAll("tr[role='row']");
+var top = main.getBoundingClientRect().top;
+var idSel = '[data-legacy-thread-id], [data-thread-id]';
+function text(row, sel) {
+    var el = row.querySelector(sel);
+    return el ? (el.innerText || '').trim() : '';
+}
+var out = [];
+for (var i = 0; i < rows.length && out.length < arguments[0]; i++) {
+    var row = rows[i];
+    var rect = row.getBoundingClientRect();
+    if (rect.height === 0 || row.offsetParent === null) continue;
+    var all = (row.innerText || '').trim();
+    if (all.length <= 5 || (all.toLowerCase().indexOf('inbox') >= 0 && all.length <= 20)) continue;
+    var idEl = row.matches(idSel) ? row : row.querySelector(idSel);
+    var senderEl = row.querySelector('span[email]');
+    row.setAttribute('data-seekmate-row', out.length);
+    out.push({
+        index: out.length,
+        thread_id: idEl ? (idEl.getAttribute('data-legacy-thread-id') || idEl.getAttribute('data-thread-id')) : null,
+        sender: senderEl ? (senderEl.getAttribute('name') || senderEl.innerText || '').trim() : '',
+        subject: text(row, '.bog') || text(row, '.bqe') || text(row, '.bA4'),
+        snippet: text(row, '.y2').replace(/^[\\s\u2013-]+/, ''),
+        text: all.slice(0, 400),
+        bottom: rect.bottom - top
+    });
+}
+return out;
+"""
+
+# Tick the checkbox of every tagged row in the list (one round trip). Arguments are
+# [index, thread_id, text] from the snapshot: Gmail reuses <tr> nodes when mail arrives, so a row
+# is only ticked if it still shows that thread (or that text, without an ID). Returns [ticked, moved].
+SELECT_ROWS_SCRIPT = """
+var ticked = 0, moved = 0;
+var idSel = '[data-legacy-thread-id], [data-thread-id]';
+arguments[0].forEach(function(want) {
+    var row = document.querySelector('[data-seekmate-row="' + want[0] + '"]');
+    if (!row) { moved++; return; }
+    var idEl = row.matches(idSel) ? row : row.querySelector(idSel);
+    var id = idEl ? (idEl.getAttribute('data-legacy-thread-id') || idEl.getAttribute('data-thread-id')) : null;
+    var same = want[1] ? id === want[1] : (row.innerText || '').trim().slice(0, 400) === want[2];
+    if (!same) { moved++; return; }
+    var box = row.querySelector("div[role='checkbox'], td .T-Jo, input[type='checkbox']");
+    if (!box) return;
+    var isChecked = function() {
+        return box.getAttribute('aria-checked') === 'true' || box.checked === true ||
+               box.classList.contains('T-Jo-Jp') || row.classList.contains('x7');
+    };
+    if (!isChecked()) box.click();
+    if (isChecked()) ticked++;
+});
+return [ticked, moved];
+"""
+
+# Toolbar Delete button (acts on the ticked rows)
+DELETE_BUTTON_SCRIPT = """
+var bar = document.querySelector("div[gh='tm']") || document;
+var btn = bar.querySelector("div[act='10'], div[role='button'][aria-label='Delete'], div[role='button'][data-tooltip='Delete']");
+if (!btn) return false;
+['mousedown', 'mouseup', 'click'].forEach(function(type) {
+    btn.dispatchEvent(new MouseEvent(type, {view: window, bubbles: true, cancelable: true, button: 0}));
+});
+return true;
+"""
 
 
-class GmailCleanup:
+def split_row_text(all_text, subject=""):
+    """(subject, snippet) from a row's text lines when the subject/snippet elements aren't found"""
+    lines = [line.strip() for line in all_text.split('\n') if line.strip()]
+    if not subject and lines:
+        # First line is usually subject (skip empty/date lines)
+        for line in lines[:3]:
+            if len(line) > 10 and not line.startswith(_MONTH_PREFIXES):
+                subject = line
+                break
+    snippet = ""
+    # Get snippet (usually 2nd or 3rd line)
+    if lines and len(lines) > 1:
+        snippet_lines = [l for l in lines[1:4] if l != subject and len(l) > 5]
+        snippet = ' '.join(snippet_lines[:2])  # First 2 snippet lines
+    return subject, snippet
+
+
+def process_tree_mb(pid):
+    """RSS of a process and all its children in MB (None without psutil or if it's gone)"""
+    if not PSUTIL_AVAILABLE or not pid:
+        return None
+    try:
+        root = psutil.Process(pid)
+        total = 0
+        for p in [root] + root.children(recursive=True):
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+def _browser_pid(driver):
+    """Chrome's PID for an undetected_chromedriver or plain Selenium driver"""
+    pid = getattr(driver, "browser_pid", None)
+    if pid:
+        return pid
+    if PSUTIL_AVAILABLE:
+        try:
+            # Plain Selenium: Chrome is the child of the chromedriver service process
+            for child in psutil.Process(driver.service.process.pid).children():
+                if "chrom" in child.name().lower():
+                    return child.pid
+        except Exception:
+            pass
+    return None
+
+
+class GmailCleanup(EmailTriage):
     """Handles Gmail email deletion based on patterns and GPT analysis - runs in separate window"""
     
-    def __init__(self, driver=None, openai_api_key=None, openai_client=None, create_separate_window=True):
+    def __init__(self, driver=None, openai_api_key=None, openai_client=None, create_separate_window=True,
+                 seen_file=None, local_classifier=True, attach_to=None, search_delete=False,
+                 delete_senders=None, search_older_than=None):
         """
         Initialize Gmail cleanup
         If create_separate_window is True, creates its own browser instance
         Otherwise uses the provided driver (for backward compatibility)
+        attach_to: the bot's driver - open a background window in that Chrome instead of a second browser
+        search_delete: before each scan, bulk-delete everything Gmail search finds for delete_patterns
+            (and delete_senders, optionally only mail older than search_older_than, e.g. "1d")
+        seen_file: where thread verdicts are remembered between passes (see gmail_rules.SeenThreads)
+        local_classifier: decide confident cases with the local model learned from GPT verdicts
         """
         self.own_driver = None
         self.driver = driver
         self.gmail_tab_handle = None
         self.create_separate_window = create_separate_window
+        self.host_driver = None         # Bot driver whose Chrome we share (attach_to mode)
+        self.host_memory_before = None
+        
+        if attach_to is not None:
+            self.driver = self._attach_to_browser(attach_to)
+            if self.driver:
+                self.own_driver = self.driver
+                self.host_driver = attach_to
+                self.create_separate_window = True   # Own window and session, like a separate browser
+                create_separate_window = False
+            else:
+                print("[Gmail] Could not attach to the bot's Chrome, starting a separate browser")
+                create_separate_window = self.create_separate_window = True
         
         # Create separate browser window if requested
         if create_separate_window:
@@ -56,32 +216,19 @@ class GmailCleanup:
             self.openai_client = openai_client
         elif openai_api_key and OPENAI_AVAILABLE:
             try:
-                self.openai_client = OpenAI(api_key=openai_api_key)
+                self.openai_client = make_openai_client(openai_api_key, priority="cleanup")
                 print("[Gmail] GPT analysis enabled")
             except Exception as e:
                 print(f"[Gmail] Failed to initialize OpenAI: {e}")
         
-        # Patterns to DELETE (fallback if GPT unavailable)
-        self.delete_patterns = [
-            r"has viewed your application for",
-            r"has viewed your application",
-            r"application update",
-            r"application status",
-            r"viewed your profile",
-            r"viewed your application",
-        ]
-        
-        # Patterns to PRESERVE (do NOT delete) - safety net
-        self.preserve_patterns = [
-            r"needs action",
-            r"action required",
-            r"requires your attention",
-            r"please respond",
-            r"interview",
-            r"next steps",
-            r"schedule",
-            r"meeting",
-        ]
+        # delete_patterns / preserve_patterns and the keep/delete decision come from EmailTriage
+        self.seen = SeenThreads(seen_file)
+        self.init_classifier(local_classifier)
+        self.search_queries = []
+        if search_delete:
+            self.search_queries = compile_search_queries(self.delete_patterns, self.preserve_patterns,
+                                                         delete_senders, search_older_than)
+            print(f"[Gmail] Search delete enabled ({len(self.search_queries)} queries)")
     
     def _create_separate_browser(self):
         """Create a separate browser instance for Gmail cleanup"""
@@ -140,7 +287,7 @@ class GmailCleanup:
             
             # Create driver
             try:
-                service = Service(ChromeDriverManager().install())
+                service = Service(plain_driver_path())
                 driver = webdriver.Chrome(service=service, options=chrome_options)
                 print("[Gmail] Chrome driver created successfully")
             except Exception as e:
@@ -172,8 +319,76 @@ class GmailCleanup:
             traceback.print_exc()
             return None
     
+    def _attach_to_browser(self, host_driver):
+        """
+        Second WebDriver session on the bot's running Chrome (via its DevTools address), working in a
+        background window of its own - the bot's session and window are never touched.
+        """
+        try:
+            address = (host_driver.capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+            if not address:
+                print("[Gmail] Bot's Chrome has no DevTools address to attach to")
+                return None
+            self.host_memory_before = process_tree_mb(_browser_pid(host_driver))
+            
+            chrome_options = Options()
+            chrome_options.add_experimental_option("debuggerAddress", address)
+            # A stock chromedriver would undo uc's patches on the bot's page - use the same driver as uc
+            driver_path = None
+            if type(host_driver).__module__.startswith("undetected_chromedriver"):
+                driver_path = patched_driver_path()
+            service = Service(driver_path or plain_driver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # New window in the background so it never takes focus from the application tab
+            target = driver.execute_cdp_cmd("Target.createTarget", {
+                "url": "about:blank", "newWindow": True, "background": True
+            })
+            driver.switch_to.window(target["targetId"])
+            # The window is also one of the bot's window_handles - the bot skips it by this handle
+            self.gmail_tab_handle = target["targetId"]
+            print(f"[Gmail] Attached to the bot's Chrome at {address} (background window)")
+            return driver
+        except Exception as e:
+            print(f"[Gmail] Failed to attach to the bot's Chrome: {e}")
+            return None
+    
+    def report_memory(self):
+        """Log what Gmail cleanup costs in memory for the current mode"""
+        if not PSUTIL_AVAILABLE or not self.own_driver:
+            return None
+        try:
+            driver_mb = process_tree_mb(self.own_driver.service.process.pid) or 0
+        except AttributeError:
+            driver_mb = 0
+        if self.host_driver is not None:
+            # Shared: our chromedriver + whatever the Gmail window added to the bot's Chrome
+            host_now = process_tree_mb(_browser_pid(self.host_driver))
+            if host_now is None or self.host_memory_before is None:
+                return None
+            added = max(0.0, host_now - self.host_memory_before) + driver_mb
+            print(f"[Gmail] Memory (shared Chrome): +{added:.0f} MB "
+                  f"(bot's Chrome {self.host_memory_before:.0f} -> {host_now:.0f} MB, chromedriver {driver_mb:.0f} MB)")
+        else:
+            # Separate: the chromedriver process tree includes the whole second Chrome
+            added = driver_mb
+            print(f"[Gmail] Memory (separate browser): {added:.0f} MB")
+        return added
+    
     def close(self):
         """Close the separate browser window if we created it"""
+        if self.host_driver is not None:
+            # Shared Chrome: close only our window and stop our chromedriver - never quit the bot's browser
+            try:
+                self.own_driver.close()
+            except Exception:
+                pass
+            try:
+                self.own_driver.service.stop()
+            except Exception:
+                pass
+            print("[Gmail] Closed Gmail window in the bot's Chrome")
+            return
         if self.own_driver:
             try:
                 self.own_driver.quit()
@@ -198,6 +413,7 @@ class GmailCleanup:
                     time.sleep(2)
                     print("[Gmail] ✅ Opened Gmail in separate window")
                     self.gmail_tab_handle = self.driver.current_window_handle
+                    self.report_memory()
                     return True
                 except Exception as e:
                     print(f"[Gmail] ⚠️ Gmail page may not have loaded fully: {e}")
@@ -261,101 +477,6 @@ class GmailCleanup:
             print(f"[Gmail] Error switching to Gmail: {e}")
             return False
     
-    def gpt_analyze_email(self, subject_text, snippet_text=""):
-        """Use GPT to analyze if email is important or just an update to delete"""
-        if not self.openai_client:
-            return None  # GPT not available, use pattern matching
-        
-        try:
-            combined_text = f"{subject_text} {snippet_text}".strip()
-            if len(combined_text) < 10:
-                return None  # Not enough text to analyze
-            
-            prompt = f"""You are analyzing job application emails. Decide if this email should be DELETED (just a passive notification) or KEPT (requires action or is important).
-
-EMAIL SUBJECT: {subject_text}
-EMAIL PREVIEW/SNIPPET: {snippet_text}
-
-DELETE these types (passive notifications, no action needed):
-- "has viewed your application" / "viewed your application for [job]"
-- "application update" (generic status updates)
-- "viewed your profile" / "someone viewed your profile"
-- "new activity on your application" (if it's just a view)
-- "application received" confirmations (already submitted)
-- Generic automated notifications that don't need response
-- Emails that are purely informational with no next steps
-
-KEEP these types (important, requires action):
-- Interview invitations: "interview", "schedule", "meeting", "call"
-- Action required: "next steps", "action required", "please respond", "requires your attention"
-- Job offers or decisions: "offer", "congratulations", "decision", "selected"
-- Important updates: "application status changed" (if it's a decision, not just a view)
-- Response needed: "please reply", "respond by", "confirmation needed"
-- Any email asking you to do something or respond
-
-IMPORTANT: When in doubt, always choose KEEP. Better to keep an unimportant email than delete an important one.
-
-Reply with ONLY one word: "DELETE" or "KEEP"."""
-
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",  # Fast and cost-effective
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an email filtering assistant. Analyze emails and decide if they are important (KEEP) or just passive notifications (DELETE). Be conservative - when in doubt, KEEP the email."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=10,
-                temperature=0.1  # Low temperature for consistent decisions
-            )
-            
-            decision = response.choices[0].message.content.strip().upper()
-            
-            if "DELETE" in decision:
-                return True
-            elif "KEEP" in decision:
-                return False
-            else:
-                # If GPT response is unclear, default to keeping
-                return False
-                
-        except Exception as e:
-            print(f"[Gmail] GPT analysis error: {e}")
-            return None  # Fall back to pattern matching
-    
-    def should_delete_email(self, subject_text, snippet_text=""):
-        """Check if email should be deleted - uses GPT if available, otherwise patterns"""
-        combined_text = f"{subject_text} {snippet_text}".lower()
-        
-        # First check preserve patterns - if any match, DON'T delete (safety net)
-        for pattern in self.preserve_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                print(f"[Gmail] PRESERVED (safety pattern): {subject_text[:50]}...")
-                return False
-        
-        # Try GPT analysis first if available
-        if self.openai_client:
-            gpt_decision = self.gpt_analyze_email(subject_text, snippet_text)
-            if gpt_decision is not None:
-                if gpt_decision:
-                    print(f"[Gmail] GPT says DELETE: {subject_text[:50]}...")
-                else:
-                    print(f"[Gmail] GPT says KEEP: {subject_text[:50]}...")
-                return gpt_decision
-        
-        # Fallback to pattern matching if GPT unavailable or failed
-        for pattern in self.delete_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                print(f"[Gmail] DELETE (pattern match): {subject_text[:50]}...")
-                return True
-        
-        # Default: keep the email if no patterns match
-        return False
-    
     def get_email_elements(self):
         """Get all email elements from Gmail inbox - improved selectors"""
         try:
@@ -422,6 +543,139 @@ Reply with ONLY one word: "DELETE" or "KEEP"."""
             traceback.print_exc()
             return []
     
+    def snapshot_inbox(self, limit=100, fallback=True):
+        """
+        Every visible inbox row as a dict (index, thread_id, sender, subject, snippet, bottom) from one
+        execute_script call. Falls back to the per-element scan (rows then carry their "element").
+        """
+        try:
+            time.sleep(2)  # Wait for emails to load
+            self.driver.execute_script("window.scrollTo(0, 0);")
+            rows = self.driver.execute_script(SNAPSHOT_SCRIPT, limit) or []
+            if rows:
+                for row in rows:
+                    if not row.get("subject") or not row.get("snippet"):
+                        subject, snippet = split_row_text(row.get("text", ""), row.get("subject", ""))
+                        row["subject"] = subject
+                        row["snippet"] = row.get("snippet") or snippet
+                print(f"[Gmail] Inbox snapshot: {len(rows)} visible rows")
+                return rows
+        except Exception as e:
+            print(f"[Gmail] Inbox snapshot script failed: {e}")
+        
+        if not fallback:
+            return []
+        print("[Gmail] Falling back to per-row scan...")
+        emails = self.get_email_elements()
+        rows = []
+        for index, (email, thread_id) in enumerate(zip(emails, self.get_thread_ids(emails))):
+            subject, snippet = self.get_email_text(email)
+            rows.append({"index": index, "thread_id": thread_id, "sender": "", "subject": subject,
+                         "snippet": snippet, "bottom": None, "element": email})
+        return rows
+    
+    def select_rows(self, rows):
+        """Tick the checkboxes of these snapshot rows - one script call; returns how many are selected"""
+        tagged = [[row["index"], row.get("thread_id"), row.get("text", "")] for row in rows if "element" not in row]
+        selected = 0
+        if tagged:
+            try:
+                selected, moved = self.driver.execute_script(SELECT_ROWS_SCRIPT, tagged) or (0, 0)
+                if moved:
+                    print(f"[Gmail] {moved} row(s) changed since the snapshot (new mail?) - left unselected")
+            except Exception as e:
+                print(f"[Gmail] Bulk select failed: {e}")
+        # Rows from the fallback scan are clicked one by one
+        for row in rows:
+            if "element" in row and self.select_email(row["element"]):
+                selected += 1
+        return selected
+    
+    def _is_preserved(self, row):
+        text = f"{row.get('subject', '')} {row.get('snippet', '')}"
+        return any(re.search(p, text, re.IGNORECASE) for p in self.preserve_patterns)
+    
+    def delete_by_search(self, query, max_rounds=20):
+        """
+        Open a Gmail search and delete its results a page at a time: every row on the page is checked
+        against the preserve patterns, the others are ticked and deleted in one click. Gmail's
+        "select all conversations" is never used - search terms match whole words only, so it would
+        delete mail ("rescheduled", "meetings") the substring preserve patterns are meant to keep.
+        Returns the number of conversations deleted.
+        """
+        started = time.time()
+        self.driver.get("https://mail.google.com/mail/u/0/#search/" + urllib.parse.quote(query))
+        time.sleep(3)
+        deleted = 0
+        for _ in range(max_rounds):
+            # Empty search results are the normal way out - no per-row fallback scan here
+            rows = self.snapshot_inbox(fallback=False)
+            if not rows:
+                break
+            
+            targets = [row for row in rows if not self._is_preserved(row)]
+            if len(targets) < len(rows):
+                print(f"[Gmail] {len(rows) - len(targets)} search result(s) look important - selecting the others only")
+            selected = self.select_rows(targets) if targets else 0
+            if not selected:
+                break
+            
+            time.sleep(0.3)
+            if not (self.driver.execute_script(DELETE_BUTTON_SCRIPT) or self.delete_selected_emails()):
+                print("[Gmail] Could not delete the selected search results")
+                break
+            deleted += selected
+            time.sleep(2)   # Let the next page of results load in
+        
+        print(f"[Gmail] Search [{query[:60]}]: deleted {deleted} conversation(s) in {time.time() - started:.1f}s")
+        return deleted
+    
+    def bulk_delete_by_search(self):
+        """Run every compiled search query, then go back to the inbox"""
+        total = 0
+        for query in self.search_queries:
+            try:
+                total += self.delete_by_search(query)
+            except Exception as e:
+                print(f"[Gmail] Search delete failed for [{query[:60]}]: {e}")
+        self.driver.get("https://mail.google.com/mail/u/0/#inbox")
+        time.sleep(3)
+        return total
+    
+    def get_thread_ids(self, emails):
+        """Gmail thread ID of each row (None where the row has none) - one script call for all rows"""
+        try:
+            return self.driver.execute_script("""
+                var sel = '[data-legacy-thread-id], [data-thread-id]';
+                return arguments[0].map(function(row) {
+                    var el = row.matches(sel) ? row : row.querySelector(sel);
+                    if (!el) return null;
+                    return el.getAttribute('data-legacy-thread-id') || el.getAttribute('data-thread-id');
+                });
+            """, emails) or [None] * len(emails)
+        except Exception as e:
+            print(f"[Gmail] Could not read thread IDs: {e}")
+            return [None] * len(emails)
+    
+    def find_new_rows(self, thread_ids, max_emails=50):
+        """
+        Indexes of rows that still need a verdict, newest first. Rows already classified KEEP are
+        skipped, and scanning stops after SEEN_STOP_RUN of them in a row - older mail was seen.
+        """
+        new_rows = []
+        seen_run = 0
+        for index, thread_id in enumerate(thread_ids):
+            if self.seen.is_kept(thread_id):
+                seen_run += 1
+                if seen_run >= SEEN_STOP_RUN:
+                    break
+                continue
+            seen_run = 0
+            new_rows.append(index)
+            if len(new_rows) >= max_emails:
+                break
+        return new_rows
+    
     def get_email_text(self, email_element):
         """Extract subject and snippet text from email element - faster method"""
         try:
@@ -431,11 +685,7 @@ Reply with ONLY one word: "DELETE" or "KEEP"."""
             if not all_text:
                 return "", ""
             
-            # Split by newline
-            lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-            
             subject = ""
-            snippet = ""
             
             # Try to find subject using selectors (quick check)
             subject_selectors = [
@@ -456,20 +706,7 @@ Reply with ONLY one word: "DELETE" or "KEEP"."""
                     continue
             
             # If no subject found via selector, use first meaningful line
-            if not subject and lines:
-                # First line is usually subject (skip empty/date lines)
-                for line in lines[:3]:
-                    if len(line) > 10 and not line.startswith(('Jan ', 'Feb ', 'Mar ', 'Apr ', 'May ', 'Jun ', 
-                                                               'Jul ', 'Aug ', 'Sep ', 'Oct ', 'Nov ', 'Dec ')):
-                        subject = line
-                        break
-            
-            # Get snippet (usually 2nd or 3rd line)
-            if lines and len(lines) > 1:
-                snippet_lines = [l for l in lines[1:4] if l != subject and len(l) > 5]
-                snippet = ' '.join(snippet_lines[:2])  # First 2 snippet lines
-            
-            return subject, snippet
+            return split_row_text(all_text, subject)
             
         except Exception as e:
             print(f"[Gmail] Error getting email text: {e}")
@@ -668,8 +905,11 @@ Reply with ONLY one word: "DELETE" or "KEEP"."""
             print(f"[Gmail] Error deleting emails: {e}")
             return False
     
-    def analyze_emails_with_vision(self, emails):
-        """Use GPT Vision to analyze visible emails from screenshot - cheaper than per-email"""
+    def analyze_emails_with_vision(self, emails, rows=None):
+        """
+        Use GPT Vision to analyze visible emails from screenshot - cheaper than per-email
+        emails: snapshot rows (snapshot_inbox); rows: 1-based row numbers to classify (default: all)
+        """
         if not self.openai_client:
             return []
         
@@ -678,10 +918,16 @@ Reply with ONLY one word: "DELETE" or "KEEP"."""
             self.driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
             
-            # Take screenshot of the entire page (Gmail inbox)
-            # This is more reliable than trying to screenshot a specific element
-            screenshot = self.driver.get_screenshot_as_png()
-            screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
+            # Screenshot just the message list, cut below the last row asked about, grayscale JPEG
+            # (prepare_screenshot falls back to the whole window if the element can't be captured)
+            inbox_list, crop_height = None, None
+            try:
+                inbox_list = self.driver.find_element(By.CSS_SELECTOR, "div[role='main']")
+                if rows and max(rows) <= len(emails) and emails[max(rows) - 1].get("bottom"):
+                    crop_height = emails[max(rows) - 1]["bottom"] + 4
+            except Exception:
+                pass
+            image = prepare_screenshot(self.driver, inbox_list, crop_height=crop_height, grayscale=True)
             
             print("[Gmail] Analyzing emails with GPT Vision...")
             
@@ -726,9 +972,13 @@ Example format:
 ]
 
 Only analyze emails that are clearly visible in the screenshot. If you can't read an email clearly, mark it as KEEP for safety."""
+            if rows:
+                prompt += f"\n\nOnly report these rows (the others were already checked): {', '.join(str(r) for r in rows)}"
 
+            started = time.time()
             response = self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",  # Cost-effective vision model
+                extra_headers=priority_headers("cleanup"),
                 messages=[
                     {
                         "role": "system",
@@ -741,18 +991,14 @@ Only analyze emails that are clearly visible in the screenshot. If you can't rea
                                 "type": "text",
                                 "text": prompt
                             },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{screenshot_b64}"
-                                }
-                            }
+                            image.image_part()
                         ]
                     }
                 ],
                 max_tokens=2000,
                 temperature=0.1
             )
+            record_call("gmail_inbox", image, started, response, model="gpt-4o-mini")
             
             result_text = response.choices[0].message.content.strip()
             
@@ -766,6 +1012,8 @@ Only analyze emails that are clearly visible in the screenshot. If you can't rea
             
             try:
                 analysis = json.loads(result_text)
+                if rows:
+                    analysis = [item for item in analysis if item.get("row_number") in rows]
                 print(f"[Gmail] GPT Vision analyzed {len(analysis)} emails")
                 return analysis
             except json.JSONDecodeError as e:
@@ -805,22 +1053,49 @@ Only analyze emails that are clearly visible in the screenshot. If you can't rea
             
             time.sleep(3)
             
-            # Get email elements
-            emails = self.get_email_elements()
+            # Known notification templates first: Gmail search + bulk delete, no LLM involved
+            if self.search_queries:
+                self.bulk_delete_by_search()
+            
+            # Whole inbox in one script call
+            emails = self.snapshot_inbox()
             if not emails:
                 print("[Gmail] No emails found")
                 return False
             
-            print(f"[Gmail] Found {len(emails)} emails to check")
+            # Only rows without a verdict from an earlier pass get classified
+            new_rows = self.find_new_rows([row["thread_id"] for row in emails], max_emails)
+            if not new_rows:
+                print(f"[Gmail] No new emails since last pass ({len(emails)} rows already checked)")
+                return True
+            
+            print(f"[Gmail] Found {len(new_rows)} new emails to check ({len(emails)} rows visible)")
+            new_emails = [emails[i] for i in new_rows]
             
             emails_to_delete = []
             
             # Use GPT Vision if available (cheaper than per-email analysis)
             if self.openai_client:
-                print("[Gmail] Using GPT Vision to analyze emails from screenshot...")
-                vision_analysis = self.analyze_emails_with_vision(emails[:max_emails])
+                # Safety net + local classifier first; only the rows it isn't sure about go to Vision
+                vision_rows = []
+                for row in new_emails:
+                    subject, snippet = row["subject"], row["snippet"]
+                    verdict = self.local_verdict(subject, snippet) if (subject or snippet) else None
+                    if verdict is None:
+                        vision_rows.append(row["index"])
+                        continue
+                    self.seen.record(row["thread_id"], "DELETE" if verdict else "KEEP", subject)
+                    if verdict:
+                        emails_to_delete.append(row)
                 
-                # Map vision analysis to actual email elements
+                vision_analysis = []
+                if vision_rows:
+                    print(f"[Gmail] Using GPT Vision to analyze {len(vision_rows)} emails from screenshot...")
+                    vision_analysis = self.analyze_emails_with_vision(emails, rows=[i + 1 for i in vision_rows])
+                else:
+                    print("[Gmail] All new emails decided locally - no GPT call")
+                
+                # Map vision analysis to the snapshot rows
                 for analysis_item in vision_analysis:
                     try:
                         row_num = analysis_item.get("row_number", 0)
@@ -831,10 +1106,14 @@ Only analyze emails that are clearly visible in the screenshot. If you can't rea
                         
                         # Row numbers are 1-indexed, array is 0-indexed
                         if 1 <= row_num <= len(emails):
-                            email_element = emails[row_num - 1]
+                            row = emails[row_num - 1]
+                            self.seen.record(row["thread_id"], "DELETE" if action == "DELETE" else "KEEP",
+                                             subject or sender)
+                            # Train the local classifier on the row's own text (what it will see next time)
+                            self.learn_verdict(row["subject"], row["snippet"], action == "DELETE", source="vision")
                             
                             if action == "DELETE":
-                                emails_to_delete.append((email_element, subject or sender))
+                                emails_to_delete.append(row)
                                 print(f"[Gmail] Vision says DELETE (row {row_num}): {subject[:50]}... - {reason}")
                             else:
                                 print(f"[Gmail] Vision says KEEP (row {row_num}): {subject[:50]}... - {reason}")
@@ -842,120 +1121,59 @@ Only analyze emails that are clearly visible in the screenshot. If you can't rea
                         print(f"[Gmail] Error processing vision analysis item: {e}")
                         continue
                 
+                self.seen.save()
+                if self.classifier:
+                    self.classifier.save()
                 if not emails_to_delete:
                     print("[Gmail] GPT Vision found no emails to delete")
                     return True
             
-            # Fallback to text-based analysis if Vision didn't work or isn't available
-            if not emails_to_delete and self.openai_client:
-                print("[Gmail] Falling back to text-based GPT analysis...")
-                for email in emails[:max_emails]:
-                    try:
-                        subject, snippet = self.get_email_text(email)
-                        
-                        if not subject and not snippet:
-                            continue
-                        
-                        if self.should_delete_email(subject, snippet):
-                            emails_to_delete.append((email, subject))
-                            print(f"[Gmail] Text GPT says DELETE: {subject[:50]}...")
-                    except Exception as e:
-                        continue
-            
-            # Final fallback to pattern matching
+            # Fallback to pattern matching when GPT isn't available
             if not emails_to_delete:
                 print("[Gmail] Using pattern matching fallback...")
-                for email in emails[:max_emails]:
-                    try:
-                        subject, snippet = self.get_email_text(email)
-                        
-                        if not subject and not snippet:
-                            continue
-                        
-                        # Use pattern matching
-                        combined_text = f"{subject} {snippet}".lower()
-                        
-                        # Check preserve patterns first
-                        should_preserve = False
-                        for pattern in self.preserve_patterns:
-                            if re.search(pattern, combined_text, re.IGNORECASE):
-                                should_preserve = True
-                                break
-                        
-                        if should_preserve:
-                            continue
-                        
-                        # Check delete patterns
-                        should_delete = False
-                        for pattern in self.delete_patterns:
-                            if re.search(pattern, combined_text, re.IGNORECASE):
-                                should_delete = True
-                                break
-                        
-                        if should_delete:
-                            emails_to_delete.append((email, subject))
-                            print(f"[Gmail] Pattern match DELETE: {subject[:50]}...")
-                    except Exception as e:
+                for row in new_emails:
+                    subject, snippet = row["subject"], row["snippet"]
+                    if not subject and not snippet:
                         continue
+                    
+                    combined_text = f"{subject} {snippet}".lower()
+                    
+                    # Check preserve patterns first, then delete patterns
+                    should_preserve = any(re.search(p, combined_text, re.IGNORECASE) for p in self.preserve_patterns)
+                    should_delete = not should_preserve and any(
+                        re.search(p, combined_text, re.IGNORECASE) for p in self.delete_patterns)
+                    
+                    self.seen.record(row["thread_id"], "DELETE" if should_delete else "KEEP", subject)
+                    if should_delete:
+                        emails_to_delete.append(row)
+                        print(f"[Gmail] Pattern match DELETE: {subject[:50]}...")
             
+            self.seen.save()
             if not emails_to_delete:
                 print("[Gmail] No emails match deletion criteria")
                 return True
             
-            print(f"[Gmail] Found {len(emails_to_delete)} emails to delete")
-            
-            # Select emails in batches for faster processing
-            deleted_count = 0
-            batch_size = 10  # Select 10 at a time
-            
-            print(f"[Gmail] Starting batch deletion of {len(emails_to_delete)} emails...")
-            
-            for i in range(0, len(emails_to_delete), batch_size):
-                batch = emails_to_delete[i:i+batch_size]
-                batch_selected = 0
-                
-                print(f"[Gmail] Processing batch {i//batch_size + 1} ({len(batch)} emails)...")
-                
-                # Select batch
-                for email_element, subject in batch:
-                    try:
-                        if self.select_email(email_element):
-                            batch_selected += 1
-                            print(f"[Gmail] ✓ Selected: {subject[:40]}...")
-                        else:
-                            print(f"[Gmail] ✗ Failed to select: {subject[:40]}...")
-                    except Exception as e:
-                        print(f"[Gmail] ✗ Error selecting email: {e}")
-                        continue
-                
-                print(f"[Gmail] Selected {batch_selected} out of {len(batch)} emails in this batch")
-                
-                # Delete batch if any selected
-                if batch_selected > 0:
-                    time.sleep(0.2)  # Brief pause to let selection register
-                    if self.delete_selected_emails():
-                        deleted_count += batch_selected
-                        print(f"[Gmail] ✓ Successfully deleted batch: {batch_selected} emails")
-                        time.sleep(0.5)  # Brief pause between batches
-                    else:
-                        print(f"[Gmail] ✗ Failed to delete batch of {batch_selected} emails - trying again...")
-                        # Try once more
-                        time.sleep(0.3)
-                        if self.delete_selected_emails():
-                            deleted_count += batch_selected
-                            print(f"[Gmail] ✓ Successfully deleted batch on retry: {batch_selected} emails")
-                        else:
-                            print(f"[Gmail] ✗ Failed to delete batch after retry")
-                else:
-                    print(f"[Gmail] No emails selected in this batch, skipping deletion")
+            # Tick every checkbox in one call, then a single delete
+            print(f"[Gmail] Selecting {len(emails_to_delete)} emails to delete...")
+            selected = self.select_rows(emails_to_delete)
+            print(f"[Gmail] Selected {selected} out of {len(emails_to_delete)} emails")
+            if not selected:
+                print("[Gmail] No emails were selected, skipping deletion")
+                return False
             
-            if deleted_count > 0:
-                print(f"[Gmail] Successfully deleted {deleted_count} email(s) total")
+            time.sleep(0.2)  # Brief pause to let selection register
+            if self.delete_selected_emails():
+                print(f"[Gmail] Successfully deleted {selected} email(s) total")
                 time.sleep(1)
                 return True
-            else:
-                print("[Gmail] No emails were deleted")
-                return False
+            
+            print(f"[Gmail] ✗ Failed to delete {selected} emails - trying again...")
+            time.sleep(0.3)
+            if self.delete_selected_emails():
+                print(f"[Gmail] ✓ Successfully deleted on retry: {selected} emails")
+                return True
+            print("[Gmail] No emails were deleted")
+            return False
             
         except Exception as e:
             print(f"[Gmail] Error during cleanup: {e}")
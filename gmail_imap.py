@@ -0,0 +1,542 @@
+"""
+IMAP Backend for SeekMateAI Gmail cleanup
+Does the same job as gmail_cleanup.GmailCleanup without a browser. Each pass fetches only the
+headers and a short snippet of new messages in bulk (one UID FETCH per 200 messages), runs them
+through the same keep/delete rules (gmail_rules.EmailTriage), then deletes or archives everything
+it picked with one server-side command. The last UID checked is kept in the data dir
+(gmail_imap_state[_<instance>].json), so a restarted bot carries on where it stopped and works
+through a backlog batch by batch.
+
+Gmail needs IMAP enabled and an app password (Google account -> Security -> App passwords).
+Config: "GMAIL_BACKEND": "imap", "GMAIL_IMAP_USER", "GMAIL_IMAP_PASSWORD" (or env GMAIL_IMAP_PASSWORD),
+optional "GMAIL_IMAP_HOST", "GMAIL_IMAP_PORT", "GMAIL_IMAP_SSL", "GMAIL_IMAP_ACTION" ("delete" | "archive").
+
+Usage:
+    python gmail_imap.py mock [--port 1143] [--messages 200]        (local IMAP stand-in for testing)
+    python gmail_imap.py --host 127.0.0.1 --port 1143 --no-ssl --user test --password test [--dry-run]
+"""
+import os
+import re
+import sys
+import json
+import time
+import email
+import quopri
+import random
+import imaplib
+import threading
+import socketserver
+from datetime import datetime
+from email.header import decode_header, make_header
+
+from bot_status import get_data_dir, write_json_atomic
+from gmail_rules import EmailTriage
+
+IMAP_HOST = "imap.gmail.com"
+IMAP_PORT = 993
+SNIPPET_BYTES = 2048    # Start of the body fetched per message for the snippet
+SNIPPET_CHARS = 200
+FETCH_CHUNK = 200       # UIDs per FETCH command
+
+_FETCH_ITEMS = f"(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT)] BODY.PEEK[TEXT]<0.{SNIPPET_BYTES}>)"
+_UID_RE = re.compile(rb"UID (\d+)")
+_LIST_RE = re.compile(rb'\((?P<flags>[^)]*)\) "?(?P<sep>[^" ]*)"? (?P<name>.+)$')
+_TAG_RE = re.compile(r"<[^>]+>")
+_MIME_LINE_RE = re.compile(r"^(--\S+|Content-[\w-]+:.*|MIME-Version:.*)$", re.IGNORECASE | re.MULTILINE)
+
+
+def _log(msg):
+    print(f"[Gmail IMAP] {msg}")
+
+
+def uid_set(uids):
+    """Compact IMAP sequence set: [1, 2, 3, 7, 9, 10] -> "1:3,7,9:10" """
+    parts = []
+    run_start = prev = None
+    for uid in sorted(set(uids)):
+        if prev is not None and uid == prev + 1:
+            prev = uid
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == prev else f"{run_start}:{prev}")
+        run_start = prev = uid
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == prev else f"{run_start}:{prev}")
+    return ",".join(parts)
+
+
+def default_state_file(instance=None):
+    """gmail_imap_state[_<instance>].json in the data dir"""
+    instance = instance or os.getenv("BOT_INSTANCE_NAME")
+    name = f"gmail_imap_state_{instance}.json" if instance else "gmail_imap_state.json"
+    return os.path.join(get_data_dir(), name)
+
+
+def _header(value):
+    try:
+        return str(make_header(decode_header(value or ""))).strip()
+    except Exception:
+        return (value or "").strip()
+
+
+def _snippet(raw):
+    """Readable start of a message body from the first bytes of BODY[TEXT]"""
+    if b"=\r\n" in raw or b"=\n" in raw or b"=3D" in raw:
+        try:
+            raw = quopri.decodestring(raw)
+        except Exception:
+            pass
+    text = raw.decode("utf-8", errors="ignore")
+    text = _MIME_LINE_RE.sub(" ", text)
+    text = _TAG_RE.sub(" ", text)
+    text = re.sub(r"&nbsp;|&#\d+;|&\w+;", " ", text)
+    return " ".join(text.split())[:SNIPPET_CHARS]
+
+
+class GmailImapCleanup(EmailTriage):
+    """
+    Browser-free cleanup. Offers the methods the bots' cleanup loop calls on GmailCleanup
+    (open_gmail_tab, switch_to_gmail_tab, cleanup_emails, close) so either backend can be plugged in.
+    """
+
+    def __init__(self, user, password, host=IMAP_HOST, port=IMAP_PORT, use_ssl=True, mailbox="INBOX",
+                 action="delete", openai_client=None, dry_run=False, local_classifier=True, state_file=None):
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.mailbox = mailbox
+        self.action = action
+        self.openai_client = openai_client
+        self.dry_run = dry_run
+        self.conn = None
+        self.capabilities = set()
+        self.trash_mailbox = None
+        self.state_file = state_file or default_state_file()
+        self._uidvalidity = None
+        self._last_uid = 0      # Highest UID already classified in this mailbox
+        self._load_state()
+        self.init_classifier(local_classifier)
+
+    @classmethod
+    def from_config(cls, config, openai_client=None):
+        return cls(
+            user=config.get("GMAIL_IMAP_USER") or config.get("GMAIL_EMAIL", ""),
+            password=os.getenv("GMAIL_IMAP_PASSWORD") or config.get("GMAIL_IMAP_PASSWORD", ""),
+            host=config.get("GMAIL_IMAP_HOST", IMAP_HOST),
+            port=int(config.get("GMAIL_IMAP_PORT", IMAP_PORT)),
+            use_ssl=config.get("GMAIL_IMAP_SSL", True),
+            action=config.get("GMAIL_IMAP_ACTION", "delete"),
+            openai_client=openai_client,
+            local_classifier=config.get("GMAIL_LOCAL_CLASSIFIER", True),
+        )
+
+    # ---------- CONNECTION ----------
+    def connect(self):
+        """Log in and select the mailbox. Returns True on success."""
+        self.close()
+        try:
+            if self.use_ssl:
+                self.conn = imaplib.IMAP4_SSL(self.host, self.port)
+            else:
+                self.conn = imaplib.IMAP4(self.host, self.port)
+            self.conn.login(self.user, self.password)
+            self.capabilities = {c.upper() for c in self.conn.capabilities}
+            self.trash_mailbox = self._find_trash()
+            typ, _ = self.conn.select(self.mailbox)
+            if typ != "OK":
+                raise imaplib.IMAP4.error(f"cannot select {self.mailbox}")
+            validity = (self.conn.response("UIDVALIDITY")[1] or [None])[0]
+            validity = validity.decode() if isinstance(validity, bytes) else validity
+            if validity != self._uidvalidity:
+                # Mailbox was recreated - UIDs from before mean nothing now
+                self._uidvalidity = validity
+                self._last_uid = 0
+                self._save_state()
+            _log(f"Connected to {self.host} as {self.user} ({self.mailbox})")
+            return True
+        except Exception as e:
+            _log(f"Connection failed: {e}")
+            self.conn = None
+            return False
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.logout()
+            except Exception:
+                pass
+            self.conn = None
+
+    # ---------- STATE ----------
+    def _state_key(self):
+        return f"{self.user}@{self.host}/{self.mailbox}"
+
+    def _load_state(self):
+        """UIDVALIDITY and last classified UID of this account's mailbox from the previous run"""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                entry = json.load(f).get(self._state_key()) or {}
+            self._uidvalidity = entry.get("uidvalidity")
+            self._last_uid = int(entry.get("last_uid", 0))
+        except (OSError, ValueError, AttributeError, TypeError):
+            pass
+
+    def _save_state(self):
+        if self.dry_run:
+            return      # Nothing was removed - a real run has to see these messages again
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state[self._state_key()] = {"uidvalidity": self._uidvalidity, "last_uid": self._last_uid}
+        try:
+            write_json_atomic(self.state_file, state)
+        except Exception as e:
+            _log(f"Could not save state: {e}")
+
+    def switch_to_gmail_tab(self):
+        """Make sure the connection is still alive (name kept for the shared cleanup loop)"""
+        if self.conn is None:
+            return False
+        try:
+            return self.conn.noop()[0] == "OK"
+        except Exception:
+            self.conn = None
+            return False
+
+    # The bots' cleanup loop "opens the Gmail tab" - for IMAP that is logging in
+    open_gmail_tab = connect
+
+    def _find_trash(self):
+        """Mailbox flagged \\Trash (Gmail: "[Gmail]/Trash"), or None"""
+        try:
+            typ, data = self.conn.list()
+        except Exception:
+            return None
+        for line in data or []:
+            if not isinstance(line, bytes):
+                continue
+            m = _LIST_RE.match(line)
+            if m and b"\\TRASH" in m.group("flags").upper():
+                # Keep the quotes: the name is passed straight back to MOVE
+                return m.group("name").strip().decode("utf-8", errors="ignore")
+        return None
+
+    # ---------- FETCH ----------
+    def fetch_new(self, max_emails=50):
+        """[(uid, sender, subject, snippet)] for messages not classified yet, oldest first"""
+        if self._last_uid:
+            typ, data = self.conn.uid("SEARCH", None, f"UID {self._last_uid + 1}:*")
+            uids = [int(u) for u in (data[0] or b"").split() if int(u) > self._last_uid]
+            uids = uids[:max_emails]           # Catch up over the next passes, oldest first
+        else:
+            typ, data = self.conn.uid("SEARCH", None, "ALL")
+            uids = [int(u) for u in (data[0] or b"").split()][-max_emails:]   # First pass: newest only
+        if typ != "OK" or not uids:
+            return []
+
+        messages = []
+        for i in range(0, len(uids), FETCH_CHUNK):
+            typ, data = self.conn.uid("FETCH", uid_set(uids[i:i + FETCH_CHUNK]), _FETCH_ITEMS)
+            if typ != "OK":
+                continue
+            messages.extend(self._parse_fetch(data))
+        messages.sort()
+        return messages
+
+    def _parse_fetch(self, data):
+        """imaplib FETCH data (tuples of (prefix, literal) and b")") -> [(uid, sender, subject, snippet)]"""
+        parsed = {}
+        uid = None
+        for item in data:
+            if not isinstance(item, tuple):
+                continue
+            prefix, literal = item
+            m = _UID_RE.search(prefix)
+            if m:
+                uid = int(m.group(1))
+            if uid is None:
+                continue
+            entry = parsed.setdefault(uid, {"header": b"", "text": b""})
+            if b"HEADER" in prefix.upper():
+                entry["header"] = literal
+            elif b"TEXT" in prefix.upper():
+                entry["text"] = literal
+
+        messages = []
+        for uid, entry in parsed.items():
+            headers = email.message_from_bytes(entry["header"])
+            messages.append((uid, _header(headers.get("From")), _header(headers.get("Subject")),
+                             _snippet(entry["text"])))
+        return messages
+
+    # ---------- CLEANUP ----------
+    def cleanup_emails(self, max_emails=50):
+        """
+        One pass: classify new mail in batches of max_emails, deleting/archiving each batch's picks
+        with one command, until no new mail is left
+        """
+        if not self.switch_to_gmail_tab() and not self.connect():
+            return False
+        started = time.time()
+        checked = removed = 0
+        while True:
+            try:
+                messages = self.fetch_new(max_emails)
+            except Exception as e:
+                _log(f"Fetch failed: {e}")
+                self.conn = None
+                return False
+            if not messages:
+                break
+
+            to_delete = []
+            for uid, sender, subject, snippet in messages:
+                if self.should_delete_email(subject or sender, snippet):
+                    to_delete.append(uid)
+            if self.classifier:
+                self.classifier.save()
+
+            done = self._apply(to_delete) if to_delete else 0
+            if done is None:
+                # Not marked as checked - the batch is picked up again next pass
+                _log(f"Stopping after {checked} email(s): the {len(messages)} in this batch are checked again next pass")
+                return False
+            # Only advanced once the picks are really gone, so a failed command never loses them
+            self._last_uid = max(self._last_uid, max(uid for uid, _, _, _ in messages))
+            self._save_state()
+            removed += done
+            checked += len(messages)
+            if len(messages) < max_emails:
+                break
+
+        if not checked:
+            _log("No new emails")
+        else:
+            _log(f"Checked {checked} new email(s), {self.action}d {removed} in {time.time() - started:.1f}s")
+        return True
+
+    def _apply(self, uids):
+        """
+        Delete (to Trash) or archive (out of the inbox) every UID with one server-side command.
+        Returns how many were removed, or None if the command failed.
+        """
+        uids_text = uid_set(uids)
+        if self.dry_run:
+            _log(f"Dry run - would {self.action} UIDs {uids_text}")
+            return 0
+        try:
+            if self.action == "delete" and self.trash_mailbox and "MOVE" in self.capabilities:
+                typ, _ = self.conn.uid("MOVE", uids_text, self.trash_mailbox)
+            else:
+                # On Gmail, expunging from INBOX removes the Inbox label (archive)
+                typ, _ = self.conn.uid("STORE", uids_text, "+FLAGS.SILENT", r"(\Deleted)")
+                if typ == "OK":
+                    if "UIDPLUS" in self.capabilities:
+                        typ, _ = self.conn.uid("EXPUNGE", uids_text)
+                    else:
+                        typ, _ = self.conn.expunge()
+            if typ != "OK":
+                _log(f"Batch {self.action} refused by the server")
+                return None
+            return len(uids)
+        except Exception as e:
+            _log(f"Batch {self.action} failed: {e}")
+            self.conn = None
+            return None
+
+    def run_periodic_cleanup(self, interval_seconds=300):
+        """Run cleanup periodically (every 5 minutes by default)"""
+        try:
+            while True:
+                self.cleanup_emails()
+                time.sleep(interval_seconds)
+        except Exception as e:
+            _log(f"Periodic cleanup stopped: {e}")
+
+
+# ============================================
+# LOCAL MOCK IMAP SERVER FOR TESTING
+# ============================================
+_MOCK_TEMPLATES = [
+    ("SEEK <noreply@s.seek.com.au>", "{company} has viewed your application for {title}"),
+    ("SEEK <noreply@s.seek.com.au>", "Application update: {title}"),
+    ("Indeed <alert@indeed.com>", "Someone viewed your profile"),
+    ("{company} Talent <talent@example.com>", "Interview invitation - {title} at {company}"),
+    ("{company} HR <hr@example.com>", "Action required: next steps for your {title} application"),
+    ("Newsletter <news@example.com>", "Your weekly digest"),
+]
+_MOCK_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli"]
+_MOCK_TITLES = ["Operations Manager", "Project Director", "Program Manager", "Head of Delivery"]
+
+
+class _MockMailbox:
+    def __init__(self, count):
+        rng = random.Random(42)
+        self.lock = threading.Lock()
+        self.next_uid = 1
+        self.folders = {"INBOX": [], "[Gmail]/Trash": []}
+        for _ in range(count):
+            sender, subject = rng.choice(_MOCK_TEMPLATES)
+            fields = {"company": rng.choice(_MOCK_COMPANIES), "title": rng.choice(_MOCK_TITLES)}
+            self.add("INBOX", sender.format(**fields), subject.format(**fields),
+                     f"Hi there,\r\n\r\n{subject.format(**fields)}. Log in to see more details.\r\n")
+
+    def add(self, folder, sender, subject, body):
+        self.folders[folder].append({"uid": self.next_uid, "from": sender, "subject": subject,
+                                     "body": body.encode(), "flags": set()})
+        self.next_uid += 1
+
+
+class _MockImapHandler(socketserver.StreamRequestHandler):
+    """Just enough IMAP4rev1 (+ UIDPLUS, MOVE) for imaplib and GmailImapCleanup"""
+    mailbox = None
+
+    def send(self, line):
+        self.wfile.write(line if isinstance(line, bytes) else line.encode() + b"\r\n")
+
+    def handle(self):
+        selected = None
+        self.send("* OK [CAPABILITY IMAP4rev1 UIDPLUS MOVE] SeekMateAI mock IMAP ready")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            parts = raw.decode(errors="ignore").strip().split(" ", 2)
+            if len(parts) < 2:
+                continue
+            tag, cmd, args = parts[0], parts[1].upper(), (parts[2] if len(parts) > 2 else "")
+            with self.mailbox.lock:
+                if cmd == "CAPABILITY":
+                    self.send("* CAPABILITY IMAP4rev1 UIDPLUS MOVE")
+                elif cmd == "LOGOUT":
+                    self.send("* BYE logging out")
+                    self.send(f"{tag} OK LOGOUT completed")
+                    return
+                elif cmd == "LIST":
+                    self.send('* LIST (\\HasNoChildren) "/" "INBOX"')
+                    self.send('* LIST (\\HasNoChildren \\Trash) "/" "[Gmail]/Trash"')
+                elif cmd in ("SELECT", "EXAMINE"):
+                    selected = args.strip('"')
+                    msgs = self.mailbox.folders.setdefault(selected, [])
+                    self.send(f"* {len(msgs)} EXISTS")
+                    self.send("* OK [UIDVALIDITY 1] UIDs valid")
+                    self.send(f"* OK [UIDNEXT {self.mailbox.next_uid}] next UID")
+                    self.send(f"{tag} OK [READ-WRITE] {cmd} completed")
+                    continue
+                elif cmd == "UID" and selected:
+                    sub, _, rest = args.partition(" ")
+                    self._uid(sub.upper(), rest, self.mailbox.folders[selected])
+                elif cmd == "EXPUNGE" and selected:
+                    self._expunge(self.mailbox.folders[selected], None)
+            self.send(f"{tag} OK {cmd} completed")
+
+    def _uids(self, spec, msgs):
+        top = max((m["uid"] for m in msgs), default=0)
+        wanted = set()
+        for part in spec.split(","):
+            lo, _, hi = part.partition(":")
+            lo = top if lo == "*" else int(lo)
+            hi = lo if not hi else (top if hi == "*" else int(hi))
+            wanted.update(range(min(lo, hi), max(lo, hi) + 1))
+        return wanted
+
+    def _uid(self, sub, rest, msgs):
+        if sub == "SEARCH":
+            criteria = rest.upper().split()
+            if "UID" in criteria:
+                wanted = self._uids(criteria[criteria.index("UID") + 1], msgs)
+                found = [m["uid"] for m in msgs if m["uid"] in wanted]
+            else:
+                found = [m["uid"] for m in msgs]
+            self.send("* SEARCH" + "".join(f" {u}" for u in found))
+        elif sub == "FETCH":
+            spec = rest.split(" ", 1)[0]
+            wanted = self._uids(spec, msgs)
+            for seq, m in enumerate(msgs, 1):
+                if m["uid"] not in wanted:
+                    continue
+                header = f"From: {m['from']}\r\nSubject: {m['subject']}\r\n\r\n".encode()
+                text = m["body"][:SNIPPET_BYTES]
+                self.send(f"* {seq} FETCH (UID {m['uid']} BODY[HEADER.FIELDS (FROM SUBJECT)] {{{len(header)}}}\r\n".encode()
+                          + header + f" BODY[TEXT]<0> {{{len(text)}}}\r\n".encode() + text + b")\r\n")
+        elif sub == "STORE":
+            spec = rest.split(" ", 1)[0]
+            wanted = self._uids(spec, msgs)
+            for m in msgs:
+                if m["uid"] in wanted and "\\DELETED" in rest.upper():
+                    m["flags"].add("\\Deleted")
+        elif sub == "EXPUNGE":
+            self._expunge(msgs, self._uids(rest.strip(), msgs))
+        elif sub == "MOVE":
+            spec, _, target = rest.partition(" ")
+            wanted = self._uids(spec, msgs)
+            target = self.mailbox.folders.setdefault(target.strip('"'), [])
+            for seq in range(len(msgs), 0, -1):
+                if msgs[seq - 1]["uid"] in wanted:
+                    target.append(msgs.pop(seq - 1))
+                    self.send(f"* {seq} EXPUNGE")
+
+    def _expunge(self, msgs, only):
+        for seq in range(len(msgs), 0, -1):
+            m = msgs[seq - 1]
+            if "\\Deleted" in m["flags"] and (only is None or m["uid"] in only):
+                msgs.pop(seq - 1)
+                self.send(f"* {seq} EXPUNGE")
+
+
+class _MockImapServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_mock_server(port=1143, messages=200):
+    """Start the stand-in on 127.0.0.1 in a background thread. Returns (server, mailbox)."""
+    mailbox = _MockMailbox(messages)
+    handler = type("_Handler", (_MockImapHandler,), {"mailbox": mailbox})
+    server = _MockImapServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, mailbox
+
+
+def _arg(name, default=None):
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "mock":
+        port = int(_arg("--port", "1143"))
+        server, mailbox = start_mock_server(port, int(_arg("--messages", "200")))
+        _log(f"Mock IMAP server on 127.0.0.1:{port} with {len(mailbox.folders['INBOX'])} messages (any login works)")
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+
+    cleanup = GmailImapCleanup(
+        user=_arg("--user", ""),
+        password=_arg("--password", os.getenv("GMAIL_IMAP_PASSWORD", "")),
+        host=_arg("--host", IMAP_HOST),
+        port=int(_arg("--port", str(IMAP_PORT))),
+        use_ssl="--no-ssl" not in sys.argv,
+        action=_arg("--action", "delete"),
+        dry_run="--dry-run" in sys.argv,
+    )
+    if not cleanup.connect():
+        sys.exit(1)
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] Running one cleanup pass...")
+    cleanup.cleanup_emails(max_emails=int(_arg("--max", "50")))
+    cleanup.close()
+
+
+if __name__ == "__main__":
+    main()
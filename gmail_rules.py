@@ -0,0 +1,262 @@
+"""
+Email Triage Rules for SeekMateAI Gmail cleanup
+The keep/delete decision shared by every cleanup backend (Gmail web UI in gmail_cleanup.py,
+IMAP in gmail_imap.py): the preserve-pattern safety net first, then GPT, then the delete patterns.
+Nothing here touches a browser or a mailbox. SeenThreads remembers the verdicts between passes.
+"""
+import os
+import re
+import json
+import time
+from collections import OrderedDict
+
+from bot_status import get_data_dir, write_json_atomic
+from email_classifier import EmailClassifier
+from llm_gateway import priority_headers
+
+SEEN_MAX_THREADS = 5000   # Oldest verdicts are forgotten past this
+
+# Patterns to DELETE (fallback if GPT unavailable)
+DELETE_PATTERNS = [
+    r"has viewed your application for",
+    r"has viewed your application",
+    r"application update",
+    r"application status",
+    r"viewed your profile",
+    r"viewed your application",
+]
+
+# Patterns to PRESERVE (do NOT delete) - safety net
+PRESERVE_PATTERNS = [
+    r"needs action",
+    r"action required",
+    r"requires your attention",
+    r"please respond",
+    r"interview",
+    r"next steps",
+    r"schedule",
+    r"meeting",
+]
+
+
+
+def pattern_phrase(pattern):
+    """Plain phrase a regex pattern stands for ("has viewed your application"), or None if it's real regex"""
+    if re.search(r"[\\^$.*+?()\[\]{}|]", re.sub(r"\\\W", "", pattern)):
+        return None
+    text = " ".join(re.sub(r"\\(\W)", r"\1", pattern).split())
+    return text or None
+
+
+def _term(phrase):
+    return f'"{phrase}"' if " " in phrase else phrase
+
+
+def compile_search_queries(delete_patterns=DELETE_PATTERNS, preserve_patterns=PRESERVE_PATTERNS,
+                           senders=None, older_than=None):
+    """
+    Gmail search queries that find what delete_patterns would delete, one per subject phrase (plus one
+    for known notification senders). The preserve patterns are excluded too, but only as a pre-filter:
+    Gmail matches whole words while the patterns match substrings, so every result still has to be
+    checked against them before it is deleted.
+    """
+    phrases = sorted({p.lower() for p in map(pattern_phrase, delete_patterns) if p}, key=len)
+    # "viewed your application" already matches "has viewed your application for"
+    minimal = []
+    for phrase in phrases:
+        if not any(shorter in phrase for shorter in minimal):
+            minimal.append(phrase)
+    
+    exclude = " ".join(f"-{_term(p.lower())}" for p in map(pattern_phrase, preserve_patterns) if p)
+    suffix = " ".join(part for part in (f"older_than:{older_than}" if older_than else "", exclude) if part)
+    
+    queries = [f'in:inbox subject:"{phrase}" {suffix}'.strip() for phrase in minimal]
+    if senders:
+        queries.append(f"in:inbox from:({' OR '.join(senders)}) {suffix}".strip())
+    return queries
+
+
+class EmailTriage:
+    """Mixin: expects self.openai_client (or None); patterns can be overridden per instance"""
+
+    delete_patterns = DELETE_PATTERNS
+    preserve_patterns = PRESERVE_PATTERNS
+    openai_client = None
+    classifier = None       # Local EmailClassifier - decides the confident cases without GPT
+
+    def init_classifier(self, enabled=True):
+        self.classifier = None
+        if enabled:
+            try:
+                self.classifier = EmailClassifier.load()
+                print(f"[Gmail] Local classifier loaded ({self.classifier.trained} verdicts learned)")
+            except Exception as e:
+                print(f"[Gmail] Local classifier unavailable: {e}")
+
+    def local_verdict(self, subject_text, snippet_text=""):
+        """Safety net, then the local classifier: True (delete) / False (keep) / None (ask GPT)"""
+        combined_text = f"{subject_text} {snippet_text}".lower()
+        
+        # First check preserve patterns - if any match, DON'T delete (safety net)
+        for pattern in self.preserve_patterns:
+            if re.search(pattern, combined_text, re.IGNORECASE):
+                print(f"[Gmail] PRESERVED (safety pattern): {subject_text[:50]}...")
+                return False
+        
+        if self.classifier:
+            verdict, how = self.classifier.predict(subject_text, snippet_text)
+            if verdict is not None:
+                print(f"[Gmail] Local model says {'DELETE' if verdict else 'KEEP'} ({how}): {subject_text[:50]}...")
+                return verdict
+        return None
+    
+    def learn_verdict(self, subject_text, snippet_text, delete, source="gpt"):
+        """Teach the local classifier a verdict GPT made"""
+        if self.classifier:
+            self.classifier.learn(subject_text, snippet_text, delete, source)
+
+    def gpt_analyze_email(self, subject_text, snippet_text=""):
+        """Use GPT to analyze if email is important or just an update to delete"""
+        if not self.openai_client:
+            return None  # GPT not available, use pattern matching
+        
+        try:
+            combined_text = f"{subject_text} {snippet_text}".strip()
+            if len(combined_text) < 10:
+                return None  # Not enough text to analyze
+            
+            prompt = f"""You are analyzing job application emails. Decide if this email should be DELETED (just a passive notification) or KEPT (requires action or is important).
+
+EMAIL SUBJECT: {subject_text}
+EMAIL PREVIEW/SNIPPET: {snippet_text}
+
+DELETE these types (passive notifications, no action needed):
+- "has viewed your application" / "viewed your application for [job]"
+- "application update" (generic status updates)
+- "viewed your profile" / "someone viewed your profile"
+- "new activity on your application" (if it's just a view)
+- "application received" confirmations (already submitted)
+- Generic automated notifications that don't need response
+- Emails that are purely informational with no next steps
+
+KEEP these types (important, requires action):
+- Interview invitations: "interview", "schedule", "meeting", "call"
+- Action required: "next steps", "action required", "please respond", "requires your attention"
+- Job offers or decisions: "offer", "congratulations", "decision", "selected"
+- Important updates: "application status changed" (if it's a decision, not just a view)
+- Response needed: "please reply", "respond by", "confirmation needed"
+- Any email asking you to do something or respond
+
+IMPORTANT: When in doubt, always choose KEEP. Better to keep an unimportant email than delete an important one.
+
+Reply with ONLY one word: "DELETE" or "KEEP"."""
+
+            response = self.openai_client.chat.completions.create(
+                model="gpt-4o-mini",  # Fast and cost-effective
+                extra_headers=priority_headers("cleanup"),
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an email filtering assistant. Analyze emails and decide if they are important (KEEP) or just passive notifications (DELETE). Be conservative - when in doubt, KEEP the email."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                max_tokens=10,
+                temperature=0.1  # Low temperature for consistent decisions
+            )
+            
+            decision = response.choices[0].message.content.strip().upper()
+            
+            if "DELETE" in decision:
+                return True
+            elif "KEEP" in decision:
+                return False
+            else:
+                # If GPT response is unclear, default to keeping
+                return False
+                
+        except Exception as e:
+            print(f"[Gmail] GPT analysis error: {e}")
+            return None  # Fall back to pattern matching
+    
+    def should_delete_email(self, subject_text, snippet_text=""):
+        """Check if email should be deleted - safety net, local classifier, then GPT, then patterns"""
+        combined_text = f"{subject_text} {snippet_text}".lower()
+        
+        local = self.local_verdict(subject_text, snippet_text)
+        if local is not None:
+            return local
+        
+        # Ask GPT for the cases the local classifier isn't sure about
+        if self.openai_client:
+            gpt_decision = self.gpt_analyze_email(subject_text, snippet_text)
+            if gpt_decision is not None:
+                if gpt_decision:
+                    print(f"[Gmail] GPT says DELETE: {subject_text[:50]}...")
+                else:
+                    print(f"[Gmail] GPT says KEEP: {subject_text[:50]}...")
+                self.learn_verdict(subject_text, snippet_text, gpt_decision)
+                return gpt_decision
+        
+        # Fallback to pattern matching if GPT unavailable or failed
+        for pattern in self.delete_patterns:
+            if re.search(pattern, combined_text, re.IGNORECASE):
+                print(f"[Gmail] DELETE (pattern match): {subject_text[:50]}...")
+                return True
+        
+        # Default: keep the email if no patterns match
+        return False
+
+
+def default_seen_file(instance=None):
+    """gmail_seen[_<instance>].json in the data dir"""
+    instance = instance or os.getenv("BOT_INSTANCE_NAME")
+    name = f"gmail_seen_{instance}.json" if instance else "gmail_seen.json"
+    return os.path.join(get_data_dir(), name)
+
+
+class SeenThreads:
+    """
+    Thread ID -> verdict ("KEEP" / "DELETE") of every email already classified, kept on disk so a
+    cleanup pass (and a restarted bot) only sends new arrivals to GPT.
+    """
+
+    def __init__(self, path=None, max_threads=SEEN_MAX_THREADS):
+        self.path = path or default_seen_file()
+        self.max_threads = max_threads
+        self.threads = OrderedDict()
+        self.dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.threads.update(json.load(f).get("threads", {}))
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def verdict(self, thread_id):
+        entry = self.threads.get(thread_id) if thread_id else None
+        return entry["verdict"] if entry else None
+
+    def is_kept(self, thread_id):
+        """Already classified KEEP - a DELETE verdict still in the inbox gets another look"""
+        return self.verdict(thread_id) == "KEEP"
+
+    def record(self, thread_id, verdict, subject=""):
+        if not thread_id:
+            return
+        self.threads.pop(thread_id, None)
+        self.threads[thread_id] = {"verdict": verdict, "subject": subject[:80], "at": int(time.time())}
+        while len(self.threads) > self.max_threads:
+            self.threads.popitem(last=False)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            write_json_atomic(self.path, {"threads": self.threads})
+            self.dirty = False
+        except Exception as e:
+            print(f"[Gmail] Could not save seen threads: {e}")
@@ -17,9 +17,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_cache import plain_driver_path
+from browser_profile import DEFAULT_CACHE_MB, DEFAULT_RENDERER_LIMIT, apply_lean_options, prune_profile
 
-from openai import OpenAI
 import openpyxl
 from openpyxl import Workbook
 from datetime import datetime
@@ -35,6 +35,15 @@ except ImportError:
     GMAIL_CLEANUP_AVAILABLE = False
     print("    [!] Gmail cleanup module not available")
 
+# Live status snapshot read by the dashboard / Slack / WhatsApp monitors
+from bot_status import StatusPublisher
+from bot_control import ControlChannel
+from llm_gateway import make_openai_client, priority_headers
+from asset_proxy import chrome_proxy_args
+from text_entry import fill_text
+from title_matcher import TitleMatcher
+from vision_image import prepare_screenshot, record_call
+
 # 2Captcha for CAPTCHA solving
 try:
     from twocaptcha import TwoCaptcha
@@ -116,6 +125,9 @@ STEALTH_MODE = CONFIG.get("STEALTH_MODE", True)
 BLOCKED_COMPANIES = [c.lower().strip() for c in CONFIG.get("BLOCKED_COMPANIES", [])]
 BLOCKED_TITLES = [t.lower().strip() for t in CONFIG.get("BLOCKED_TITLES", [])]
 
+# Indeed only uses direct + reverse-word matching (no category expansion)
+MATCHER = TitleMatcher(JOB_TITLES, BLOCKED_TITLES, BLOCKED_COMPANIES, expand_categories=False)
+
 print(f"[INDEED BOT] Scan: {SCAN_SPEED}% | Apply: {APPLY_SPEED}% | Cooldown: {COOLDOWN_DELAY}s | Stealth: {'ON' if STEALTH_MODE else 'OFF'}")
 
 # ============================================
@@ -207,33 +219,20 @@ Great work! Your applications have been submitted."""
 # ============================================
 # CONTROL CHECK
 # ============================================
+CONTROL = ControlChannel(CONTROL_FILE)
+
+
 def check_control():
-    """Check control.json for pause/stop signals"""
-    try:
-        if os.path.exists(CONTROL_FILE):
-            with open(CONTROL_FILE, "r") as f:
-                data = json.load(f)
-                if data.get("stop", False):
-                    return "stop"
-                if data.get("pause", False):
-                    return "pause"
-    except:
-        pass
-    return "run"
+    """Check control.json for pause/stop signals (cached, re-read only when the file changes)"""
+    return CONTROL.check()
 
 
 def wait_while_paused():
     """Block while paused, return False if stopped"""
-    while True:
-        status = check_control()
-        if status == "stop":
-            print("[!] Stop signal received.")
-            return False
-        elif status == "pause":
-            time.sleep(0.5)
-            continue
-        else:
-            return True
+    if not CONTROL.wait_while_paused():
+        print("[!] Stop signal received.")
+        return False
+    return True
 
 
 # ============================================
@@ -275,32 +274,17 @@ def job_cooldown():
 # ============================================
 def title_matches(title: str) -> bool:
     """Check if job title matches user's target titles"""
-    allowed = [t.lower().strip() for t in JOB_TITLES]
-    title_clean = title.lower().strip()
-    
-    # Direct match
-    if any(a in title_clean for a in allowed):
-        return True
-    
-    # Reverse match
-    title_words = [w for w in title_clean.replace('-', ' ').split() if len(w) > 3]
-    for word in title_words:
-        if any(word in a for a in allowed):
-            return True
-    
-    return False
+    return MATCHER.matches(title)
 
 
 def is_title_blocked(title: str) -> bool:
     """Check if title is in blocklist"""
-    title_clean = title.lower().strip()
-    return any(blocked in title_clean for blocked in BLOCKED_TITLES)
+    return MATCHER.blocked_title_keyword(title) is not None
 
 
 def is_company_blocked(company: str) -> bool:
     """Check if company is in blocklist"""
-    company_clean = company.lower().strip()
-    return any(blocked in company_clean for blocked in BLOCKED_COMPANIES)
+    return MATCHER.blocked_company_keyword(company) is not None
 
 
 # ============================================
@@ -347,7 +331,24 @@ def init_browser():
     profile_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chrome_indeed_profile")
     chrome_options.add_argument(f"--user-data-dir={profile_path}")
     
-    service = Service(ChromeDriverManager().install())
+    # Lean profile: fewer processes and caches for more bots per VPS (browser_profile.py)
+    if CONFIG.get("BROWSER_PROFILE", "default") == "lean":
+        apply_lean_options(chrome_options,
+                           cache_mb=CONFIG.get("BROWSER_CACHE_MB", DEFAULT_CACHE_MB),
+                           renderer_limit=CONFIG.get("BROWSER_RENDERER_LIMIT", DEFAULT_RENDERER_LIMIT),
+                           share_renderers=CONFIG.get("BROWSER_SHARE_RENDERERS", False))
+        freed = prune_profile(profile_path)
+        print(f"[BROWSER] Lean profile: pruned {freed:.0f} MB of caches")
+    
+    # Route through the local asset proxy so bundles are downloaded once per machine (asset_proxy.py)
+    if CONFIG.get("ASSET_PROXY", False):
+        proxy_args = chrome_proxy_args()
+        for arg in proxy_args:
+            chrome_options.add_argument(arg)
+        print("[BROWSER] Using the local asset proxy" if proxy_args else
+              "[BROWSER] ASSET_PROXY is on but no asset proxy is running - connecting directly")
+    
+    service = Service(plain_driver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
     # Stealth tweaks
@@ -369,10 +370,15 @@ class IndeedBot:
         self.driver = driver
         self.successful_submits = 0
         self.wait = WebDriverWait(driver, 10)
+        self.status = StatusPublisher(bot="indeed", max_jobs=MAX_JOBS)
+        # The results tab and the tabs opened while applying - a shared-mode Gmail window lives
+        # in the same Chrome and must never be switched to or closed
+        self.main_handle = driver.current_window_handle
+        self.job_handles = []
         
         # OpenAI client
         if OPENAI_API_KEY:
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
+            self.client = make_openai_client(OPENAI_API_KEY, priority="apply")
         else:
             self.client = None
         
@@ -380,14 +386,25 @@ class IndeedBot:
         self.gmail_cleanup = None
         self.gmail_thread = None
         use_gmail_cleanup = CONFIG.get("USE_GMAIL_CLEANUP", False)
-        if GMAIL_CLEANUP_AVAILABLE and use_gmail_cleanup:
+        if use_gmail_cleanup and CONFIG.get("GMAIL_BACKEND", "browser") == "imap":
+            # No browser at all: IMAP fetch + one batched server-side delete per pass
+            from gmail_imap import GmailImapCleanup
+            self.gmail_cleanup = GmailImapCleanup.from_config(CONFIG, openai_client=self.client)
+            print("[Gmail] Gmail cleanup initialized over IMAP")
+        elif GMAIL_CLEANUP_AVAILABLE and use_gmail_cleanup:
             try:
                 # Create Gmail cleanup with separate window (doesn't interfere with main bot)
+                # "shared" mode: a background window in this bot's Chrome instead of a second browser
+                attach_to = driver if CONFIG.get("GMAIL_BROWSER_MODE", "separate") == "shared" else None
                 if self.client:
                     self.gmail_cleanup = GmailCleanup(
                         driver=None,  # Will create its own browser
                         openai_client=self.client,
-                        create_separate_window=True
+                        create_separate_window=True,
+                        attach_to=attach_to,
+                        search_delete=CONFIG.get("GMAIL_SEARCH_DELETE", False),
+                        delete_senders=CONFIG.get("GMAIL_DELETE_SENDERS"),
+                        search_older_than=CONFIG.get("GMAIL_SEARCH_OLDER_THAN")
                     )
                     print("[Gmail] Gmail cleanup initialized with GPT analysis in separate window")
                 else:
@@ -395,7 +412,11 @@ class IndeedBot:
                     self.gmail_cleanup = GmailCleanup(
                         driver=None,
                         openai_api_key=OPENAI_API_KEY,
-                        create_separate_window=True
+                        create_separate_window=True,
+                        attach_to=attach_to,
+                        search_delete=CONFIG.get("GMAIL_SEARCH_DELETE", False),
+                        delete_senders=CONFIG.get("GMAIL_DELETE_SENDERS"),
+                        search_older_than=CONFIG.get("GMAIL_SEARCH_OLDER_THAN")
                     )
                     print("[Gmail] Gmail cleanup initialized in separate window")
             except Exception as e:
@@ -429,7 +450,7 @@ class IndeedBot:
         if title not in self.applied_job_titles:
             self.applied_job_titles.append(title)
 
-    def gpt(self, system_prompt: str, user_prompt: str) -> str:
+    def gpt(self, system_prompt: str, user_prompt: str, priority: str = "apply") -> str:
         """Call GPT for cover letter or job check"""
         if not self.client:
             return ""
@@ -442,6 +463,7 @@ class IndeedBot:
                 ],
                 max_tokens=800,
                 temperature=0.4,
+                extra_headers=priority_headers(priority),
             )
             return res.choices[0].message.content.strip()
         except Exception as e:
@@ -568,7 +590,8 @@ Reply with ONLY "YES" or "NO" followed by a brief reason (max 15 words).
         try:
             response = self.gpt(
                 "You are a job matching assistant. Be strict about role relevance.",
-                prompt
+                prompt,
+                priority="triage"
             )
             print(f"    [🤖 GPT] Job check: {response}")
             return response.upper().startswith("YES")
@@ -753,8 +776,7 @@ Reply with ONLY the answer (Yes, No, or the text to fill in). Keep it brief.
                             # Only fill empty fields for other types
                             if current_val == "":
                                 answer = self.gpt_answer_question(question)
-                                inp.clear()
-                                inp.send_keys(answer)
+                                fill_text(self.driver, inp, answer)
                                 print(f"    [+] Filled: {question[:40]}... → {answer}")
                     except:
                         continue
@@ -934,6 +956,35 @@ Reply with ONLY the answer (Yes, No, or the text to fill in). Keep it brief.
         except:
             return False
 
+    def bot_handles(self):
+        """This bot's tabs, without the Gmail window a shared-mode cleanup keeps in the same Chrome"""
+        gmail = getattr(self.gmail_cleanup, "gmail_tab_handle", None)
+        return [h for h in self.driver.window_handles if h != gmail]
+
+    def switch_to_new_tab(self, handles_before):
+        """Switch to a tab opened since handles_before and remember it as a job tab. Returns the handle or None."""
+        new_handles = [h for h in self.bot_handles() if h not in handles_before]
+        if not new_handles:
+            return None
+        handle = new_handles[-1]
+        self.job_handles.append(handle)
+        self.driver.switch_to.window(handle)
+        return handle
+
+    def close_job_tabs(self):
+        """Close the tabs opened for the current job and go back to the results tab. True if any were closed."""
+        open_handles = self.bot_handles()
+        closed = False
+        for handle in self.job_handles:
+            if handle in open_handles and handle != self.main_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+                closed = True
+        self.job_handles = []
+        if self.main_handle in open_handles:
+            self.driver.switch_to.window(self.main_handle)
+        return closed
+
     def open_job(self, card):
         """Click on job card to open details"""
         try:
@@ -982,14 +1033,24 @@ Reply with ONLY the answer (Yes, No, or the text to fill in). Keep it brief.
                 continue
         return ""
 
+    def find_recaptcha_challenge_iframe(self):
+        """The reCAPTCHA challenge iframe (bframe), or None"""
+        for iframe in self.driver.find_elements(By.TAG_NAME, "iframe"):
+            src = iframe.get_attribute("src") or ""
+            title = iframe.get_attribute("title") or ""
+            # Look specifically for the bframe (challenge frame), not anchor frame
+            if "recaptcha" in src.lower() and "bframe" in src.lower():
+                return iframe
+            if "recaptcha challenge" in title.lower():
+                return iframe
+        return None
+
     def solve_recaptcha_with_gpt(self):
         """Use GPT-4 Vision to solve reCAPTCHA image challenges"""
-        import base64
-        
         try:
-            # Take screenshot of the page
-            screenshot = self.driver.get_screenshot_as_png()
-            screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
+            # Screenshot just the challenge frame (falls back to the window if it can't be found)
+            image = prepare_screenshot(self.driver, self.find_recaptcha_challenge_iframe(),
+                                       max_width=768, max_height=1024, quality=85, detail="high")
             
             # Ask GPT-4 Vision to analyze the CAPTCHA
             prompt = """You are solving a reCAPTCHA image challenge. Look at the popup with the blue header.
@@ -1032,6 +1093,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                 print("    [!] No OpenAI client - can't solve CAPTCHA with GPT")
                 return None
             
+            started = time.time()
             response = self.client.chat.completions.create(
                 model="gpt-4o",  # GPT-4 Vision model
                 messages=[
@@ -1043,19 +1105,14 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                         "role": "user",
                         "content": [
                             {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{screenshot_b64}",
-                                    "detail": "high"
-                                }
-                            }
+                            image.image_part()
                         ]
                     }
                 ],
                 max_tokens=150,
                 temperature=0.1  # Low temperature for more precise answers
             )
+            record_call("recaptcha", image, started, response, model="gpt-4o", log=lambda msg: print(f"    {msg}"))
             
             answer = response.choices[0].message.content.strip()
             print(f"    [🤖 GPT Vision] CAPTCHA answer: {answer}")
@@ -1078,19 +1135,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
         """Click on specific squares in the reCAPTCHA grid"""
         try:
             # Find the reCAPTCHA challenge iframe and switch to it
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            captcha_iframe = None
-            
-            for iframe in iframes:
-                src = iframe.get_attribute("src") or ""
-                title = iframe.get_attribute("title") or ""
-                # Look specifically for the bframe (challenge frame), not anchor frame
-                if "recaptcha" in src.lower() and "bframe" in src.lower():
-                    captcha_iframe = iframe
-                    break
-                if "recaptcha challenge" in title.lower():
-                    captcha_iframe = iframe
-                    break
+            captcha_iframe = self.find_recaptcha_challenge_iframe()
             
             if captcha_iframe:
                 self.driver.switch_to.frame(captcha_iframe)
@@ -2115,6 +2160,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
         
         if not apply_btn:
             print("    [-] No 'Apply now' button found (may be external site).")
+            self.status.incr("skipped")
             return False
         
         # GPT check before applying
@@ -2122,9 +2168,11 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
         if desc and OPENAI_API_KEY:
             if not self.gpt_should_apply(job_title, desc):
                 print(f"    [🤖 SKIP] GPT says job doesn't match your target roles")
+                self.status.incr("skipped")
                 return False
         
         # Click apply
+        handles_before = set(self.bot_handles())
         try:
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", apply_btn)
             time.sleep(1)
@@ -2133,6 +2181,8 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
             time.sleep(3)
         except Exception as e:
             print(f"    [-] Failed to click apply: {e}")
+            self.status.incr("failed")
+            self.status.error(f"Failed to click apply: {e}")
             return False
         
         # Handle Indeed's apply form (multi-step process)
@@ -2140,11 +2190,9 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
             # Check if it opened in new tab
             time.sleep(3)
             print("    [*] Checking for new windows...")
-            windows = self.driver.window_handles
-            print(f"    [*] Found {len(windows)} window(s)")
+            print(f"    [*] Found {len(self.bot_handles())} window(s)")
             
-            if len(windows) > 1:
-                self.driver.switch_to.window(windows[-1])
+            if self.switch_to_new_tab(handles_before):
                 print("    [*] Switched to apply window")
             
             # Handle Cloudflare verification if it appears
@@ -2153,8 +2201,10 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
             # Indeed apply form has multiple steps - keep clicking Continue/Submit
             max_steps = 10
             
+            self.status.set_phase("applying")
             for step in range(max_steps):
                 print(f"    [*] Form step {step + 1}...")
+                self.status.beat()
                 time.sleep(3)
                 
                 # Check for error popup and handle it
@@ -2173,13 +2223,12 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                     page_text = self.driver.page_source.lower()
                     if "thank you" in page_text or "application has been submitted" in page_text or "your application" in page_text:
                         self.successful_submits += 1
+                        self.status.incr("applied", event=f"Applied: {job_title} @ {company}")
                         self.log_job(job_title, company, self.driver.current_url)
                         print(f"    [+] SUBMITTED to Indeed!")
                         print(f"    [+] Successful submissions: {self.successful_submits}")
                         
-                        if len(self.driver.window_handles) > 1:
-                            self.driver.close()
-                            self.driver.switch_to.window(self.driver.window_handles[0])
+                        self.close_job_tabs()
                         
                         return True
                 
@@ -2298,32 +2347,28 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                 
             if is_success:
                 self.successful_submits += 1
+                self.status.incr("applied", event=f"Applied: {job_title} @ {company}")
                 self.log_job(job_title, company, self.driver.current_url)
                 print(f"    [+] SUBMITTED to Indeed!")
                 print(f"    [+] Successful submissions: {self.successful_submits}")
                 
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
+                self.close_job_tabs()
                 return True
             
             print("    [?] Indeed form incomplete - may need manual completion")
             print(f"    [?] Final URL: {current_url[:80]}...")
             
             # Close apply window if exists
-            if len(self.driver.window_handles) > 1:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+            self.close_job_tabs()
             
             return False
             
         except Exception as e:
             print(f"    [!] Indeed apply form error: {e}")
+            self.status.incr("failed")
+            self.status.error(f"Indeed apply form error: {e}")
             # Close any extra windows
-            while len(self.driver.window_handles) > 1:
-                self.driver.switch_to.window(self.driver.window_handles[-1])
-                self.driver.close()
-            self.driver.switch_to.window(self.driver.window_handles[0])
+            self.close_job_tabs()
             return False
 
     def go_to_next_page(self):
@@ -2367,6 +2412,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
 
     def send_summary_and_exit(self, run_start_time):
         """Helper to send WhatsApp summary and exit"""
+        self.status.finish("stopped" if check_control() == "stop" else "finished")
         duration_minutes = int((time.time() - run_start_time) / 60)
         full_name = CONFIG.get("FULL_NAME", "User")
         send_whatsapp_summary(full_name, self.successful_submits, duration_minutes, self.applied_job_titles)
@@ -2436,6 +2482,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
             self.gmail_thread.start()
             print("[Gmail] Gmail cleanup started - will open visible tab and run continuously")
         
+        self.status.set_phase("logging_in")
         self.ensure_logged_in()
         
         primary_location = LOCATION
@@ -2468,6 +2515,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
             print(f"\n==============================")
             print(f"🟣 INDEED: Searching for '{search_title}'")
             print(f"==============================\n")
+            self.status.set_phase("searching", title=search_title, location=primary_location, page=1)
             
             # Determine which locations to search
             locations_to_search = [primary_location]
@@ -2509,6 +2557,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                         break
                     
                     print(f"\n[*] 🔄 Trying alternative location: {location}")
+                    self.status.set_phase("searching", title=search_title, location=location, page=1)
                     search_url = build_indeed_url(search_title, location)
                     print(f"    URL: {search_url}")
                     
@@ -2534,6 +2583,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                         return
                     
                     print(f"\n===== PAGE {page} =====")
+                    self.status.update(page=page)
                     cards = self.get_job_cards()
                     
                     if not cards:
@@ -2544,43 +2594,54 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                     for idx, card in enumerate(cards):
                         status = check_control()
                         if status == "stop":
+                            self.status.finish("stopped")
                             return
                         elif status == "pause":
                             print("[*] Bot paused...")
+                            self.status.set_phase("paused")
                             if not wait_while_paused():
+                                self.status.finish("stopped")
                                 return
                             print("[*] Bot resumed.")
+                        self.status.set_phase("scanning")
                         
                         title = self.get_job_title(card)
                         company = self.get_company_name(card)
                         
                         if not title_matches(title):
                             print(f"    [-] SKIPPED (title mismatch): {title}")
+                            self.status.incr("skipped")
                             continue
                         
                         if is_title_blocked(title):
                             print(f"    [🚫] BLOCKED (title): {title}")
+                            self.status.incr("skipped")
                             continue
                         
                         if is_company_blocked(company):
                             print(f"    [🚫] BLOCKED (company): {company}")
+                            self.status.incr("skipped")
                             continue
                         
                         # Check for "Easily apply" badge BEFORE clicking
                         if not self.has_easily_apply(card):
                             print(f"    [-] SKIPPED (no Easily Apply): {title}")
+                            self.status.incr("skipped")
                             continue
                         
                         if self.successful_submits >= MAX_JOBS:
                             break
                         
                         print(f"\n[*] Indeed Job {idx + 1}: {title} | {company} ✓ Easily Apply")
+                        self.status.incr("scanned", event=f"{title} | {company}")
                         
                         stealth_random_pause()
                         
                         if self.open_job(card):
                             speed_sleep(2, "scan")
                             self.apply(title, company)
+                        else:
+                            self.status.incr("failed")
                         
                         job_cooldown()
                     
@@ -2598,6 +2659,7 @@ If no squares need clicking or you can't see the CAPTCHA clearly: SKIP"""
                     break
         
         print(f"\n[*] INDEED BOT COMPLETE — Successfully submitted {self.successful_submits} applications.")
+        self.status.finish()
         
         # Send WhatsApp summary
         duration_minutes = int((time.time() - run_start_time) / 60)
@@ -2614,12 +2676,16 @@ def main():
     
     print("[*] Starting Indeed bot...")
     driver = init_browser()
+    bot = None
     
     try:
         bot = IndeedBot(driver)
         bot.run()
     except Exception as e:
         print(f"[!] Indeed bot error: {e}")
+        if bot is not None:
+            bot.status.error(e)
+            bot.status.finish("crashed")
     finally:
         try:
             driver.quit()
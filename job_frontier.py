@@ -0,0 +1,226 @@
+"""
+Shared Job Frontier for SeekMateAI multi-bot instances
+Instead of every instance scraping the same SEEK result pages, each (title, location) search is
+discovered by one instance at a time, a few pages per claim, and the jobs it finds go into a
+shared queue (SQLite, so it works across processes without a server).
+Instances lease jobs from the queue that fit their own profile; leases expire, so work held by a
+dead or slow instance is picked up by whoever runs dry first.
+"""
+import os
+import re
+import time
+import sqlite3
+import threading
+
+FRONTIER_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_frontier.db")
+
+LEASE_SECONDS = 15 * 60         # A leased job returns to the queue if not completed by then
+SEARCH_LEASE_SECONDS = 10 * 60  # Same for a claimed search slice
+PAGES_PER_CLAIM = 3             # Result pages scraped per search claim before applying again
+REDISCOVER_AFTER = 6 * 3600     # An exhausted search is searched again after this long
+MAX_ATTEMPTS = 3                # Failed applies before a job is dropped
+
+_JOB_ID_RE = re.compile(r"/job/(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    title TEXT NOT NULL,
+    location TEXT NOT NULL,
+    next_page INTEGER NOT NULL DEFAULT 1,
+    claimed_by TEXT,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    exhausted_at REAL,
+    PRIMARY KEY (title, location)
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    discovered_by TEXT,
+    discovered_at REAL,
+    state TEXT NOT NULL DEFAULT 'open',
+    lease_owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    completed_by TEXT,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_open ON jobs (state, discovered_at);
+CREATE TABLE IF NOT EXISTS rejections (
+    job_id TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    at REAL NOT NULL,
+    PRIMARY KEY (job_id, instance)
+);
+"""
+
+
+def job_id_from_url(url):
+    """SEEK job id from a job URL (tracking query strings differ between searches)"""
+    m = _JOB_ID_RE.search(url or "")
+    return m.group(1) if m else (url or "").split("?")[0]
+
+
+def _norm(text):
+    return " ".join((text or "").lower().split())
+
+
+class JobFrontier:
+    """One instance's handle on the shared frontier"""
+
+    def __init__(self, instance, path=FRONTIER_DB):
+        self.instance = instance
+        self.path = path
+        # Rejections from earlier runs don't count - the profile/config may have changed since
+        self.since = time.time()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _txn(self):
+        """BEGIN IMMEDIATE so check-then-claim is atomic across processes"""
+        return _Transaction(self._conn, self._lock)
+
+    # ---------- SEARCHES ----------
+    def claim_search(self, searches):
+        """
+        Claim the first (title, location) in `searches` that nobody is discovering and that hasn't
+        been exhausted recently. Returns (title, location, page) or None.
+        """
+        now = time.time()
+        with self._txn() as db:
+            for title, location in searches:
+                key = (_norm(title), _norm(location))
+                db.execute("INSERT OR IGNORE INTO searches (title, location) VALUES (?, ?)", key)
+                row = db.execute("SELECT * FROM searches WHERE title = ? AND location = ?", key).fetchone()
+                if row["exhausted_at"] and now - row["exhausted_at"] < REDISCOVER_AFTER:
+                    continue
+                if row["claimed_by"] not in (None, self.instance) and row["claimed_until"] > now:
+                    continue
+                page = 1 if row["exhausted_at"] else row["next_page"]
+                db.execute("UPDATE searches SET claimed_by = ?, claimed_until = ?, next_page = ?, exhausted_at = NULL "
+                           "WHERE title = ? AND location = ?",
+                           (self.instance, now + SEARCH_LEASE_SECONDS, page) + key)
+                return title, location, page
+        return None
+
+    def release_search(self, title, location, next_page, exhausted=False):
+        """Hand the search back; the next claimer continues from next_page"""
+        with self._txn() as db:
+            db.execute("UPDATE searches SET claimed_by = NULL, claimed_until = 0, next_page = ?, exhausted_at = ? "
+                       "WHERE title = ? AND location = ?",
+                       (1 if exhausted else next_page, time.time() if exhausted else None, _norm(title), _norm(location)))
+
+    def searches_in_progress(self, searches):
+        """How many of these searches another live instance is discovering right now"""
+        now = time.time()
+        keys = {(_norm(t), _norm(l)) for t, l in searches}
+        with self._lock:
+            rows = self._conn.execute("SELECT title, location FROM searches WHERE claimed_by IS NOT NULL "
+                                      "AND claimed_by != ? AND claimed_until > ?", (self.instance, now)).fetchall()
+        return sum(1 for r in rows if (r["title"], r["location"]) in keys)
+
+    # ---------- JOBS ----------
+    def add_jobs(self, jobs, location=""):
+        """Publish discovered jobs ({"url", "title", "company"}). Returns how many were new."""
+        now = time.time()
+        added = 0
+        with self._txn() as db:
+            for job in jobs:
+                cur = db.execute(
+                    "INSERT OR IGNORE INTO jobs (job_id, url, title, company, location, discovered_by, discovered_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id_from_url(job["url"]), job["url"], job.get("title", ""), job.get("company", ""),
+                     location, self.instance, now))
+                added += cur.rowcount
+        return added
+
+    def lease(self, accept, limit=1):
+        """
+        Lease up to `limit` open jobs this instance is eligible for.
+        accept(job) is this profile's eligibility check; jobs it turns down are remembered for this run.
+        Jobs whose lease expired (instance died / hung) are handed out again - that's the work stealing.
+        """
+        now = time.time()
+        leased, rejected = [], []
+        # Candidates are read and checked without the write lock - accept() can be slow
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE (state = 'open' OR (state = 'leased' AND lease_until < ?)) "
+                "AND job_id NOT IN (SELECT job_id FROM rejections WHERE instance = ? AND at >= ?) "
+                "ORDER BY discovered_at", (now, self.instance, self.since)).fetchall()
+        for row in rows:
+            job = dict(row)
+            if not accept(job):
+                rejected.append((job["job_id"], self.instance, now))
+                continue
+            # Claim only if nobody else took it since the SELECT
+            claimed_at = time.time()
+            with self._txn() as db:
+                cur = db.execute("UPDATE jobs SET state = 'leased', lease_owner = ?, lease_until = ? "
+                                 "WHERE job_id = ? AND (state = 'open' OR (state = 'leased' AND lease_until < ?))",
+                                 (self.instance, claimed_at + LEASE_SECONDS, job["job_id"], claimed_at))
+            if cur.rowcount:
+                leased.append(job)
+                if len(leased) >= limit:
+                    break
+        if rejected:
+            with self._txn() as db:
+                db.executemany("INSERT OR REPLACE INTO rejections (job_id, instance, at) VALUES (?, ?, ?)", rejected)
+        return leased
+
+    def complete(self, job, outcome):
+        """
+        Finish a leased job:
+        - "applied": done for every instance
+        - "skipped": not for this profile, back to the queue for the others
+        - "failed": back to the queue, dropped after MAX_ATTEMPTS
+        """
+        now = time.time()
+        with self._txn() as db:
+            if outcome == "applied":
+                db.execute("UPDATE jobs SET state = 'applied', lease_owner = NULL, completed_by = ?, completed_at = ? "
+                           "WHERE job_id = ?", (self.instance, now, job["job_id"]))
+                return
+            db.execute("INSERT OR REPLACE INTO rejections (job_id, instance, at) VALUES (?, ?, ?)",
+                       (job["job_id"], self.instance, now))
+            # Only release our own lease - an expired one may have been handed to another instance
+            if outcome == "failed":
+                db.execute("UPDATE jobs SET attempts = attempts + 1 WHERE job_id = ? AND lease_owner = ?",
+                           (job["job_id"], self.instance))
+            db.execute("UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'dead' ELSE 'open' END, "
+                       "lease_owner = NULL, lease_until = 0 WHERE job_id = ? AND state = 'leased' AND lease_owner = ?",
+                       (MAX_ATTEMPTS, job["job_id"], self.instance))
+
+    def stats(self):
+        """{state: count} across the whole frontier"""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state").fetchall()
+        return {r["state"]: r["n"] for r in rows}
+
+
+class _Transaction:
+    def __init__(self, conn, lock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+        return False
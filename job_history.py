@@ -0,0 +1,145 @@
+"""
+Indexed Job History for SeekMateAI
+Loads job_log.xlsx once (read-only, streaming) and keeps it in memory with a token prefix index,
+so the history panel can page through and search tens of thousands of applications instantly.
+The workbook is only re-read when its stat signature changes.
+"""
+import os
+import re
+import bisect
+import threading
+
+from lazy_imports import module_available
+
+# openpyxl is only imported when the workbook is actually read
+OPENPYXL_AVAILABLE = module_available("openpyxl")
+
+JOB_LOG_FILE = "job_log.xlsx"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Lowercase word tokens used for both indexing and queries"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class JobHistoryIndex:
+    """In-memory job log (newest first) with a prefix-searchable token index"""
+
+    def __init__(self, path=JOB_LOG_FILE):
+        self.path = path
+        self.jobs = []            # [{"timestamp", "title", "company", "url"}], newest first
+        self._postings = {}       # token -> sorted list of row ids
+        self._tokens = []         # sorted token list for prefix range lookups
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.jobs)
+
+    # ---------- LOADING ----------
+    def load(self):
+        """
+        (Re)load the workbook if it changed since the last load. Safe to call from a worker thread.
+        Returns True if the data was reloaded.
+        """
+        signature = _file_signature(self.path)
+        if signature is not None and signature == self._signature:
+            return False
+        if signature is None:
+            jobs = []
+        else:
+            if not OPENPYXL_AVAILABLE:
+                raise RuntimeError("openpyxl not installed")
+            jobs = self._read_workbook()
+
+        postings = self._build_index(jobs)
+        with self._lock:
+            self.jobs = jobs
+            self._postings = postings
+            self._tokens = sorted(postings)
+            self._signature = signature
+        return True
+
+    def _read_workbook(self):
+        import openpyxl
+
+        # read_only streams rows instead of building the whole cell tree
+        wb = openpyxl.load_workbook(self.path, read_only=True)
+        try:
+            ws = wb.active
+            jobs = []
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row or not row[0]:  # Has timestamp
+                    continue
+                row = tuple(row) + (None,) * (4 - len(row))
+                jobs.append({
+                    "timestamp": str(row[0]),
+                    "title": str(row[1]) if row[1] else "Unknown",
+                    "company": str(row[2]) if row[2] else "Unknown",
+                    "url": str(row[3]) if row[3] else ""
+                })
+        finally:
+            wb.close()
+
+        # Sort by timestamp descending (newest first)
+        jobs.sort(key=lambda x: x["timestamp"], reverse=True)
+        return jobs
+
+    @staticmethod
+    def _build_index(jobs):
+        postings = {}
+        for i, job in enumerate(jobs):
+            for token in set(tokenize(f"{job['title']} {job['company']}")):
+                postings.setdefault(token, []).append(i)
+        return postings
+
+    # ---------- QUERIES ----------
+    def _prefix_ids(self, prefix):
+        """Row ids of every job with a token starting with prefix"""
+        tokens = self._tokens
+        i = bisect.bisect_left(tokens, prefix)
+        ids = set()
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            ids.update(self._postings[tokens[i]])
+            i += 1
+        return ids
+
+    def search(self, query=""):
+        """
+        Row ids (newest first) whose title/company has a word starting with every query word.
+        An empty query matches everything.
+        """
+        with self._lock:
+            terms = tokenize(query)
+            if not terms:
+                if query.strip():
+                    # Only punctuation typed - fall back to a plain substring scan
+                    q = query.strip().lower()
+                    return [i for i, j in enumerate(self.jobs)
+                            if q in j["title"].lower() or q in j["company"].lower()]
+                return range(len(self.jobs))
+
+            # Longest term first - usually the most selective
+            result = None
+            for term in sorted(set(terms), key=len, reverse=True):
+                ids = self._prefix_ids(term)
+                result = ids if result is None else result & ids
+                if not result:
+                    return []
+            return sorted(result)
+
+    def page(self, ids, offset, limit):
+        """The jobs for ids[offset:offset + limit]"""
+        jobs = self.jobs
+        # ids may briefly refer to the previous load while a reload is being swapped in
+        return [jobs[i] for i in ids[offset:offset + limit] if i < len(jobs)]
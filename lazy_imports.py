@@ -0,0 +1,52 @@
+"""
+Deferred imports for SeekMateAI entry points
+Selenium, undetected_chromedriver, openpyxl, the LLM SDKs and gmail_cleanup take a large share of
+process start-up. LazyImport stands in for a module (or one name from it) and only imports it the
+first time it is used, so launching a bot, importing main from config_gui or opening a dashboard
+doesn't pay for libraries that code path never touches.
+
+PyInstaller can't follow these string imports: a module loaded only through LazyImport has to be
+listed in the hidden imports of .github/workflows/build.yml and the .spec files.
+"""
+import importlib
+import importlib.util
+
+
+def module_available(name):
+    """True if `name` can be imported - checked without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyImport:
+    """
+    Placeholder for `import module` (attr=None) or `from module import attr`.
+    Attribute access and calls resolve the real object on first use; an ImportError surfaces
+    there instead of at start-up.
+    """
+
+    def __init__(self, module, attr=None):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            self._target = getattr(target, self._attr) if self._attr else target
+        return self._target
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {name} ({state})>"
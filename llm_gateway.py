@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Local LLM Gateway for SeekMateAI
+One process on the machine that every bot instance (main.py, indeed_bot.py, gmail_cleanup.py)
+sends its OpenAI / Anthropic calls through, instead of each process hitting the APIs on its own:
+- token-bucket limits per provider + model (requests/min and tokens/min), shared by the fleet
+- priority classes: an application in progress > job relevance triage > Gmail cleanup
+- identical requests already in flight are sent upstream once and the answer is shared
+- one pooled (HTTP/2 when available) connection set to each provider
+- a 429 pauses the whole bucket for Retry-After, then the request is retried from the queue
+
+The gateway speaks the providers' own APIs, so the SDKs just point their base_url at it:
+    OpenAI:    POST /v1/chat/completions   (any OpenAI-compatible endpoint upstream)
+    Anthropic: POST /v1/messages
+Priority comes from the X-SeekMate-Priority header: apply | triage | cleanup.
+
+Usage:
+    python llm_gateway.py                                   # run the gateway
+    python llm_gateway.py --openai-upstream http://127.0.0.1:8799/v1
+    python llm_gateway.py mock [--port 8799] [--fail-every N]   # local mock OpenAI API for testing
+"""
+import os
+import sys
+import json
+import time
+import heapq
+import hashlib
+import threading
+import itertools
+import urllib.request
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+GATEWAY_HOST = "127.0.0.1"
+GATEWAY_PORT = int(os.getenv("SEEKMATE_LLM_GATEWAY_PORT", "8766"))
+
+UPSTREAMS = {
+    "openai": os.getenv("LLM_GATEWAY_OPENAI_UPSTREAM", "https://api.openai.com/v1"),
+    "anthropic": os.getenv("LLM_GATEWAY_ANTHROPIC_UPSTREAM", "https://api.anthropic.com"),
+}
+
+# Requests / tokens per minute, per provider and model ("*" = any model without its own entry)
+DEFAULT_LIMITS = {
+    "openai": {"*": {"rpm": 500, "tpm": 200000}},
+    "anthropic": {"*": {"rpm": 50, "tpm": 40000}},
+}
+
+PRIORITIES = {"apply": 0, "triage": 1, "cleanup": 2}
+PRIORITY_HEADER = "X-SeekMate-Priority"
+
+MAX_RETRIES = 4             # 429 / 5xx retries inside the gateway before giving the error back
+UPSTREAM_TIMEOUT = 120
+PASS_HEADERS = ("authorization", "x-api-key", "anthropic-version", "anthropic-beta",
+                "openai-organization", "openai-project", "content-type")
+
+
+def _log(msg):
+    print(f"[LLM Gateway] {msg}", flush=True)
+
+
+def estimate_tokens(body):
+    """Rough prompt + completion token estimate for the token bucket (4 chars ~ 1 token)"""
+    chars = len(body.get("system") or "") if isinstance(body.get("system"), str) else 0
+    for m in body.get("messages") or []:
+        content = m.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict):
+                    # Screenshots (Gmail cleanup, CAPTCHA) cost roughly a fixed ~800 tokens each
+                    chars += 3200 if part.get("type") in ("image_url", "image") else len(part.get("text", ""))
+    return chars // 4 + int(body.get("max_tokens") or body.get("max_completion_tokens") or 256)
+
+
+# ============================================
+# RATE LIMITING + PRIORITY
+# ============================================
+class TokenBucket:
+    """requests/min + tokens/min bucket with a priority queue of waiters"""
+
+    def __init__(self, rpm, tpm):
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self.requests = self.rpm
+        self.tokens = self.tpm
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.waiters = []   # heap of (priority, seq, cost, event)
+
+    def refill(self, now):
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+
+    def grant(self, now):
+        """Release as many queued requests as the bucket allows, highest priority first"""
+        if now < self.paused_until:
+            return
+        while self.waiters:
+            priority, seq, cost, event = self.waiters[0]
+            # A single request bigger than the whole bucket still goes once the bucket is full
+            cost = min(cost, self.tpm)
+            if self.requests < 1 or self.tokens < cost:
+                return
+            heapq.heappop(self.waiters)
+            self.requests -= 1
+            self.tokens -= cost
+            event.set()
+
+
+class RateLimiter:
+    """All buckets plus one scheduler thread that hands out permits"""
+
+    def __init__(self, limits=None):
+        self.limits = limits or DEFAULT_LIMITS
+        self.buckets = {}
+        self.cond = threading.Condition()
+        self.seq = itertools.count()
+        threading.Thread(target=self._scheduler, daemon=True).start()
+
+    def _bucket(self, provider, model):
+        key = (provider, model)
+        if key not in self.buckets:
+            per_provider = self.limits.get(provider, {})
+            cfg = per_provider.get(model) or per_provider.get("*") or {"rpm": 60, "tpm": 60000}
+            self.buckets[key] = TokenBucket(cfg["rpm"], cfg["tpm"])
+        return self.buckets[key]
+
+    def acquire(self, provider, model, cost, priority):
+        """Block until this request may go upstream"""
+        event = threading.Event()
+        with self.cond:
+            bucket = self._bucket(provider, model)
+            heapq.heappush(bucket.waiters, (priority, next(self.seq), cost, event))
+            self.cond.notify()
+        event.wait()
+
+    def pause(self, provider, model, seconds):
+        """Upstream said 429: hold the whole bucket back so the fleet backs off together"""
+        with self.cond:
+            bucket = self._bucket(provider, model)
+            bucket.paused_until = max(bucket.paused_until, time.monotonic() + seconds)
+            bucket.requests = 0
+            self.cond.notify()
+
+    def queued(self):
+        with self.cond:
+            return {f"{p}:{m}": len(b.waiters) for (p, m), b in self.buckets.items() if b.waiters}
+
+    def _scheduler(self):
+        with self.cond:
+            while True:
+                now = time.monotonic()
+                for bucket in self.buckets.values():
+                    bucket.refill(now)
+                    bucket.grant(now)
+                waiting = any(b.waiters for b in self.buckets.values())
+                self.cond.wait(timeout=0.05 if waiting else None)
+
+
+# ============================================
+# UPSTREAM + COALESCING
+# ============================================
+class Upstream:
+    """Pooled HTTP client per provider (httpx with HTTP/2 if available, urllib otherwise)"""
+
+    def __init__(self):
+        self.client = None
+        if HTTPX_AVAILABLE:
+            self.client = httpx.Client(http2=HTTP2_AVAILABLE, timeout=UPSTREAM_TIMEOUT,
+                                       limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+
+    def post(self, url, headers, body):
+        """Returns (status, headers dict, body bytes)"""
+        if self.client:
+            resp = self.client.post(url, headers=headers, content=body)
+            return resp.status_code, dict(resp.headers), resp.content
+        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=UPSTREAM_TIMEOUT) as resp:
+                return resp.status, dict(resp.headers), resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers or {}), e.read()
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.waiters = 0
+
+
+class Gateway:
+    def __init__(self, limits=None, upstreams=None):
+        self.limiter = RateLimiter(limits)
+        self.upstream = Upstream()
+        self.upstreams = dict(upstreams or UPSTREAMS)
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "upstream": 0, "coalesced": 0, "rate_limited": 0, "errors": 0}
+
+    def handle(self, provider, path, headers, raw_body, priority):
+        """Forward one request (coalescing identical ones). Returns (status, headers, body)."""
+        headers = {k: v for k, v in headers.items() if k.lower() in PASS_HEADERS}
+        # Same credentials + same request = same answer
+        auth = headers.get("Authorization") or headers.get("authorization") or headers.get("x-api-key") or ""
+        key = hashlib.sha256(f"{provider}|{path}|{auth}|".encode() + raw_body).hexdigest()
+
+        with self.lock:
+            self.stats["requests"] += 1
+            flight = self.inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[key] = _InFlight()
+            else:
+                flight.waiters += 1
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.result
+
+        try:
+            flight.result = self._forward(provider, path, headers, raw_body, priority)
+        except Exception as e:
+            self.stats["errors"] += 1
+            flight.result = (502, {"Content-Type": "application/json"},
+                             json.dumps({"error": {"message": f"LLM gateway: {e}", "type": "gateway_error"}}).encode())
+        finally:
+            with self.lock:
+                del self.inflight[key]
+            flight.done.set()
+        return flight.result
+
+    def _forward(self, provider, path, headers, raw_body, priority):
+        body = json.loads(raw_body or b"{}")
+        model = body.get("model", "*")
+        cost = estimate_tokens(body)
+        url = self.upstreams[provider].rstrip("/") + path
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.acquire(provider, model, cost, priority)
+            status, resp_headers, content = self.upstream.post(url, headers, raw_body)
+            with self.lock:
+                self.stats["upstream"] += 1
+            if status == 429 or status >= 500:
+                retry_after = resp_headers.get("retry-after") or resp_headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = min(2 ** attempt, 30)
+                if status == 429:
+                    with self.lock:
+                        self.stats["rate_limited"] += 1
+                    self.limiter.pause(provider, model, delay)
+                if attempt < MAX_RETRIES:
+                    _log(f"{provider}/{model}: upstream {status}, retrying in {delay:.0f}s")
+                    if status != 429:
+                        time.sleep(delay)
+                    continue
+            break
+        keep = {k: v for k, v in resp_headers.items() if k.lower() in ("content-type", "retry-after")}
+        return status, keep, content
+
+
+# ============================================
+# HTTP FRONT END
+# ============================================
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive for the bots' SDK connection pools
+    gateway = None
+
+    def _send(self, status, headers, body):
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/health", "/v1/health"):
+            payload = dict(self.gateway.stats, queued=self.gateway.limiter.queued(), http2=HTTP2_AVAILABLE)
+            self._send(200, {"Content-Type": "application/json"}, json.dumps(payload).encode())
+        else:
+            self._send(404, {"Content-Type": "application/json"}, b'{"error": "not found"}')
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = self.path.split("?")[0]
+        if path.endswith("/messages"):
+            provider, upstream_path = "anthropic", "/v1/messages"
+        elif path.endswith("/chat/completions"):
+            provider, upstream_path = "openai", "/chat/completions"
+        else:
+            self._send(404, {"Content-Type": "application/json"}, b'{"error": "unsupported endpoint"}')
+            return
+        priority = PRIORITIES.get((self.headers.get(PRIORITY_HEADER) or "triage").lower(), PRIORITIES["triage"])
+        status, headers, body = self.gateway.handle(provider, upstream_path, dict(self.headers), raw, priority)
+        self._send(status, headers, body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# ============================================
+# CLIENT HELPERS (used by the bots)
+# ============================================
+_gateway_checked = {"at": 0.0, "up": False}
+
+
+def gateway_available(max_age=30):
+    """True if a gateway answers on this machine (cached for max_age seconds)"""
+    now = time.time()
+    if now - _gateway_checked["at"] > max_age:
+        try:
+            with urllib.request.urlopen(f"http://{GATEWAY_HOST}:{GATEWAY_PORT}/health", timeout=0.5):
+                _gateway_checked["up"] = True
+        except Exception:
+            _gateway_checked["up"] = False
+        _gateway_checked["at"] = now
+    return _gateway_checked["up"]
+
+
+def _gateway_down():
+    """Remember the gateway as unreachable until the next availability check"""
+    _gateway_checked.update(at=time.time(), up=False)
+
+
+class _GatewayFallback:
+    """
+    SDK client stand-in: each call goes through the gateway while it answers, and falls back to a
+    direct client (with the SDK's normal retries) when it doesn't - e.g. the gateway was restarted.
+    client.chat.completions.create(...) resolves the same attribute path on whichever client is used.
+    """
+
+    def __init__(self, gateway_client, direct_client, connection_error, timeout_error, path=()):
+        self._gateway = gateway_client
+        self._direct = direct_client
+        self._errors = (connection_error, timeout_error)
+        self._path = path
+
+    def __getattr__(self, name):
+        return _GatewayFallback(self._gateway, self._direct, *self._errors, self._path + (name,))
+
+    def _resolve(self, client):
+        for name in self._path:
+            client = getattr(client, name)
+        return client
+
+    def __call__(self, *args, **kwargs):
+        connection_error, timeout_error = self._errors
+        if gateway_available():
+            try:
+                return self._resolve(self._gateway)(*args, **kwargs)
+            except connection_error as e:
+                # A timeout may still be queued in the gateway - sending it again directly would double it
+                if isinstance(e, timeout_error):
+                    raise
+                _gateway_down()
+                _log(f"Gateway unreachable ({e}) - calling the API directly")
+        return self._resolve(self._direct)(*args, **kwargs)
+
+
+def priority_headers(priority):
+    """Per-call extra_headers for the SDKs (ignored by the real APIs when no gateway is running)"""
+    return {PRIORITY_HEADER: priority}
+
+
+def make_openai_client(api_key, priority="triage"):
+    """OpenAI client that goes through the local gateway whenever one is running (checked per call)"""
+    from openai import OpenAI, APIConnectionError, APITimeoutError
+    if not api_key:
+        return None
+    gateway = OpenAI(api_key=api_key, base_url=f"http://{GATEWAY_HOST}:{GATEWAY_PORT}/v1",
+                     default_headers=priority_headers(priority), max_retries=0)
+    return _GatewayFallback(gateway, OpenAI(api_key=api_key), APIConnectionError, APITimeoutError)
+
+
+def make_anthropic_client(api_key, priority="triage"):
+    """Anthropic client that goes through the local gateway whenever one is running (checked per call)"""
+    from anthropic import Anthropic, APIConnectionError, APITimeoutError
+    if not api_key:
+        return None
+    gateway = Anthropic(api_key=api_key, base_url=f"http://{GATEWAY_HOST}:{GATEWAY_PORT}",
+                        default_headers=priority_headers(priority), max_retries=0)
+    return _GatewayFallback(gateway, Anthropic(api_key=api_key), APIConnectionError, APITimeoutError)
+
+
+# ============================================
+# LOCAL MOCK (OpenAI-compatible) FOR TESTING
+# ============================================
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fail_every = 0
+    delay = 0.2
+    calls = itertools.count(1)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        n = next(self.calls)
+        if self.fail_every and n % self.fail_every == 0:
+            payload = json.dumps({"error": {"message": "mock rate limit", "type": "rate_limit"}}).encode()
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+        else:
+            time.sleep(self.delay)
+            last = (body.get("messages") or [{}])[-1].get("content", "")
+            payload = json.dumps({
+                "id": f"mock-{n}", "object": "chat.completion", "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": f"YES - mock reply to: {str(last)[:40]}"}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }).encode()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _arg(name, default=None):
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+
+def load_limits():
+    """DEFAULT_LIMITS overridden by LLM_GATEWAY_LIMITS in config.json, if present"""
+    limits = json.loads(json.dumps(DEFAULT_LIMITS))
+    try:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json"), "r") as f:
+            for provider, models in (json.load(f).get("LLM_GATEWAY_LIMITS") or {}).items():
+                limits.setdefault(provider, {}).update(models)
+    except Exception:
+        pass
+    return limits
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "mock":
+        port = int(_arg("--port", "8799"))
+        _MockHandler.fail_every = int(_arg("--fail-every", "0"))
+        _log(f"Mock OpenAI API on http://{GATEWAY_HOST}:{port}/v1")
+        ThreadingHTTPServer((GATEWAY_HOST, port), _MockHandler).serve_forever()
+        return
+
+    upstreams = dict(UPSTREAMS)
+    upstreams["openai"] = _arg("--openai-upstream", upstreams["openai"])
+    upstreams["anthropic"] = _arg("--anthropic-upstream", upstreams["anthropic"])
+
+    _GatewayHandler.gateway = Gateway(load_limits(), upstreams)
+    server = ThreadingHTTPServer((GATEWAY_HOST, GATEWAY_PORT), _GatewayHandler)
+    _log(f"Listening on http://{GATEWAY_HOST}:{GATEWAY_PORT} -> {upstreams['openai']} | {upstreams['anthropic']} "
+         f"(pool: {'httpx' + (' http2' if HTTP2_AVAILABLE else '') if HTTPX_AVAILABLE else 'urllib'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Incremental Log Tail for SeekMateAI dashboards
+Follows a bot log from a remembered byte offset, so each poll only reads what was appended.
+Every line is classified once (error / warn / success / skip / job header) and kept in bounded
+per-filter rings, so switching the Errors / Applications / Skipped filter never re-reads the file.
+"""
+import os
+import re
+from collections import deque
+
+INITIAL_BYTES = 256 * 1024   # How much of an existing log is read when the viewer first opens it
+MAX_LINES = 2000             # Lines kept per filter
+
+FILTERS = ("All", "Errors", "Applications", "Skipped")
+
+_JOB_HEADER_RE = re.compile(r'\[\*\].*?Job \d+:')
+
+
+def classify(line):
+    """(display tag, filters the line belongs to) - same rules the dashboard always used"""
+    if "[ERROR]" in line or "Error:" in line or "Traceback" in line or "Exception" in line:
+        tag = "error"
+    elif "[!]" in line or "WARN" in line or "Failed" in line:
+        tag = "warn"
+    elif "SUBMITTED" in line or "Successfully submitted" in line:
+        tag = "success"
+    elif "SKIPPED" in line or "BLOCKED" in line:
+        tag = "skip"
+    elif _JOB_HEADER_RE.search(line):
+        tag = "job_header"
+    else:
+        tag = ""
+
+    filters = ["All"]
+    if any(k in line for k in ["[ERROR]", "Error:", "Traceback", "Exception", "Failed", "[!]"]):
+        filters.append("Errors")
+    if any(k in line for k in ["SUBMITTED", "Successfully submitted", "Job ", "apply", "Applied"]):
+        filters.append("Applications")
+    if "SKIPPED" in line or "BLOCKED" in line or "blocked" in line:
+        filters.append("Skipped")
+    return tag, filters
+
+
+class LogTail:
+    """Tail of one log file with a per-filter index of (line, tag) entries"""
+
+    def __init__(self, path, max_lines=MAX_LINES, initial_bytes=INITIAL_BYTES):
+        self.path = path
+        self.max_lines = max_lines
+        self.initial_bytes = initial_bytes
+        self._offset = None      # Byte offset read up to (None = not opened yet)
+        self._inode = None
+        self._partial = b""      # Trailing bytes of a line still being written
+        self._reset_index()
+
+    def _reset_index(self):
+        self.index = {f: deque(maxlen=self.max_lines) for f in FILTERS}
+
+    def lines(self, filter_name="All", limit=None):
+        """The newest `limit` (line, tag) entries matching the filter"""
+        entries = self.index.get(filter_name, self.index["All"])
+        if limit is None or limit >= len(entries):
+            return list(entries)
+        return list(entries)[-limit:]
+
+    def poll(self):
+        """
+        Read whatever was appended since the last poll.
+        Returns (reset, new_entries); reset is True when the file was truncated, replaced or
+        opened for the first time, meaning the caller should redraw from lines().
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False, []
+
+        reset = False
+        if self._offset is None or st.st_ino != self._inode or st.st_size < self._offset:
+            # First open, log rotated/recreated, or truncated by a new run
+            reset = True
+            self._reset_index()
+            self._partial = b""
+            self._inode = st.st_ino
+            self._offset = max(0, st.st_size - self.initial_bytes)
+            skip_first = self._offset > 0   # Started mid-line
+        else:
+            skip_first = False
+
+        if st.st_size == self._offset:
+            return reset, []
+
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(st.st_size - self._offset)
+        except OSError:
+            return reset, []
+        self._offset += len(data)
+
+        data = self._partial + data
+        raw_lines = data.split(b"\n")
+        self._partial = raw_lines.pop()  # Incomplete last line (empty if data ended with newline)
+        if skip_first and raw_lines:
+            raw_lines = raw_lines[1:]
+
+        new_entries = []
+        for raw in raw_lines:
+            line = raw.decode("utf-8", errors="ignore").rstrip("\r") + "\n"
+            tag, filters = classify(line)
+            entry = (line, tag, filters)
+            for f in filters:
+                self.index[f].append((line, tag))
+            new_entries.append(entry)
+        return reset, new_entries
@@ -8,105 +8,57 @@ import threading
 import urllib.request
 import urllib.parse
 
-from dotenv import load_dotenv
-load_dotenv()
-
-import undetected_chromedriver as uc
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-from openai import OpenAI
-import openpyxl
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-from openpyxl import Workbook
 from datetime import datetime, timedelta
 
-# Shared job tracking for multi-bot duplicate prevention
-try:
-    from multi_bot_launcher import is_job_applied, register_applied_job
-    SHARED_JOBS_AVAILABLE = True
-except ImportError:
-    SHARED_JOBS_AVAILABLE = False
+# Heavy dependencies are imported on first use (see lazy_imports.py / bench_startup.py)
+from lazy_imports import LazyImport, module_available
+
+uc = LazyImport("undetected_chromedriver")
+By = LazyImport("selenium.webdriver.common.by", "By")
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+openpyxl = LazyImport("openpyxl")
+Workbook = LazyImport("openpyxl", "Workbook")
+ANTHROPIC_AVAILABLE = module_available("anthropic")
+PSUTIL_AVAILABLE = module_available("psutil")
 
-# Gmail cleanup
-try:
-    from gmail_cleanup import GmailCleanup
-    GMAIL_CLEANUP_AVAILABLE = True
-except ImportError:
-    GMAIL_CLEANUP_AVAILABLE = False
-    print("[!] Gmail cleanup module not available")
+# Shared job tracking for multi-bot duplicate prevention
+SHARED_JOBS_AVAILABLE = module_available("multi_bot_launcher")
+is_job_applied = LazyImport("multi_bot_launcher", "is_job_applied")
+register_applied_job = LazyImport("multi_bot_launcher", "register_applied_job")
+
+# LLM calls go through the local gateway (llm_gateway.py) when one is running
+# (loaded on first use - llm_gateway pulls in http.server)
+make_openai_client = LazyImport("llm_gateway", "make_openai_client")
+make_anthropic_client = LazyImport("llm_gateway", "make_anthropic_client")
+priority_headers = LazyImport("llm_gateway", "priority_headers")
+# Shared static-asset cache for every bot's Chrome on this machine (asset_proxy.py)
+chrome_proxy_args = LazyImport("asset_proxy", "chrome_proxy_args")
+
+# Live status snapshot read by the dashboard / Slack / WhatsApp monitors
+from bot_status import StatusPublisher
+from job_frontier import JobFrontier, PAGES_PER_CLAIM, job_id_from_url
+from run_checkpoint import RunCheckpoint, CHECKPOINT_MAX_AGE_HOURS
+from metrics_store import MetricsStore
+from driver_cache import StartupTimer, chrome_major_version, patched_driver_path
+from browser_profile import DEFAULT_CACHE_MB, DEFAULT_RENDERER_LIMIT, apply_lean_options, prune_profile
+from text_entry import fill_text
+
+METRICS_SAMPLE_INTERVAL = 60   # Seconds between browser memory samples
+
+# Per-profile state (config values, matcher, instance files) - see bot_session.py / session_host.py
+from bot_session import BotSession, SESSION, activate, current_session, set_default_session, start_thread, shared
+
+# Gmail cleanup (imported when a bot with USE_GMAIL_CLEANUP starts)
+GmailCleanup = LazyImport("gmail_cleanup", "GmailCleanup")
+GmailImapCleanup = LazyImport("gmail_imap", "GmailImapCleanup")
+default_seen_file = LazyImport("gmail_rules", "default_seen_file")
 
 
 # ============================================
 # SMART CATEGORY + STRICT TITLE MATCHING
 # ============================================
-
-def detect_category(titles):
-    """Detects which preset category user is targeting."""
-    titles_norm = [t.lower().strip() for t in titles]
-
-    # GOVERNMENT / EXEC / EL / SES (APS REMOVED)
-    gov_keywords = [
-        "el1", "el 1", "el2", "el 2",
-        "ses", "ses1", "ses 1", "ses2", "ses 2",
-        "policy", "governance", "compliance", "public sector",
-        "principal", "advisor"
-    ]
-    if any(k in t for t in titles_norm for k in gov_keywords):
-        return "gov"
-
-    # DIRECTOR / LEADERSHIP
-    if any(t in titles_norm for t in [
-        "director", "program director", "operations director",
-        "project director", "head of", "general manager",
-        "executive", "principal", "portfolio manager", "gm"
-    ]):
-        return "leadership"
-
-    # PROJECT / PROGRAM
-    if any(t in titles_norm for t in [
-        "project manager", "program manager", "agile",
-        "scrum master", "project lead", "delivery manager"
-    ]):
-        return "project"
-
-    # SALES / BDM
-    if any(t in titles_norm for t in [
-        "bdm", "business development", "sales", "account manager",
-        "relationship manager", "client", "growth", "partnership"
-    ]):
-        return "sales"
-
-    # SOCIAL / RESEARCH
-    if any(t in titles_norm for t in [
-        "research", "policy", "community", "anthropology",
-        "program officer", "stakeholder engagement"
-    ]):
-        return "social"
-
-    # ADMIN
-    if any(t in titles_norm for t in [
-        "admin", "coordinator", "ea", "executive assistant"
-    ]):
-        return "admin"
-
-    # IT
-    if any(t in titles_norm for t in [
-        "it", "developer", "engineer", "software", "cyber",
-        "cloud", "data"
-    ]):
-        return "it"
-
-    return "generic"
-
-
-# title_matches function is defined later with smart category expansion
+# Matching rules are compiled once per config load (see reload_config / title_matcher.py)
+from title_matcher import TitleMatcher
 
 
 # ============================================
@@ -140,18 +92,20 @@ def get_data_dir():
 # Check for multi-bot instance log file first
 if os.getenv("BOT_LOG_FILE"):
     LOG_FILE = os.getenv("BOT_LOG_FILE")
-    print(f"[INSTANCE] Using log file: {LOG_FILE}")
 else:
     LOG_FILE = os.path.join(get_data_dir(), "log.txt")
 _orig_print = builtins.print
 
 def print(*args, **kwargs):
+    session = current_session()
     text = " ".join(str(a) for a in args)
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
+        with open(session.log_file, "a", encoding="utf-8") as f:
             f.write(text + "\n")
     except:
         pass
+    if session.console_prefix:
+        args = (session.console_prefix + text,)
     _orig_print(*args, **kwargs)
 
 
@@ -161,161 +115,171 @@ def print(*args, **kwargs):
 # Check for multi-bot instance config file first
 if os.getenv("BOT_CONFIG_FILE"):
     CONFIG_FILE = os.getenv("BOT_CONFIG_FILE")
-    print(f"[INSTANCE] Using config file: {CONFIG_FILE}")
 else:
     CONFIG_FILE = resource_path("config.json")
 
 # Check for multi-bot instance control file
 if os.getenv("BOT_CONTROL_FILE"):
     CONTROL_FILE = os.getenv("BOT_CONTROL_FILE")
-    print(f"[INSTANCE] Using control file: {CONTROL_FILE}")
 else:
     CONTROL_FILE = resource_path("control.json")
 
-if not os.path.exists(CONFIG_FILE):
-    raise FileNotFoundError(
-        f"Config file not found: {CONFIG_FILE}. Run config_gui.exe first to create it."
-    )
-
+# Session for this process (a plain run or one launched by multi_bot_launcher / bot_supervisor).
+# session_host.py binds its own sessions per thread instead.
+set_default_session(BotSession(
+    name=os.getenv("BOT_INSTANCE_NAME"),
+    config_file=CONFIG_FILE,
+    log_file=LOG_FILE,
+    control_file=CONTROL_FILE,
+    chrome_profile=os.getenv("BOT_CHROME_PROFILE"),
+    status_file=os.getenv("BOT_STATUS_FILE"),
+    checkpoint_file=os.getenv("BOT_CHECKPOINT_FILE"),
+))
+
+# Each session has a cached control channel: re-parses control.json only when the file changes
 def check_control():
     """Check control.json for pause/stop signals. Returns: 'run', 'pause', or 'stop'"""
-    try:
-        if os.path.exists(CONTROL_FILE):
-            with open(CONTROL_FILE, "r") as f:
-                data = json.load(f)
-                if data.get("stop", False):
-                    return "stop"
-                if data.get("pause", False):
-                    return "pause"
-    except:
-        pass
-    return "run"
+    return SESSION.control.check()
 
 def is_recommended_mode():
     """Check if running in Recommended Jobs mode"""
-    try:
-        if os.path.exists(CONTROL_FILE):
-            with open(CONTROL_FILE, "r") as f:
-                data = json.load(f)
-                return data.get("recommended", False)
-    except:
-        pass
-    return False
+    return SESSION.control.is_recommended()
 
 def wait_while_paused():
     """Block execution while paused, return False if stopped"""
-    while True:
-        status = check_control()
-        if status == "stop":
-            print("[!] Stop signal received.")
-            return False
-        elif status == "pause":
-            time.sleep(0.5)  # Check every 500ms while paused
-            continue
-        else:
-            return True  # Continue running
+    if not SESSION.control.wait_while_paused():
+        print("[!] Stop signal received.")
+        return False
+    return True  # Continue running
 
 def write_control(pause=None, stop=None, recommended=None):
-    """Write control flags to control.json"""
-    data = {"pause": False, "stop": False, "recommended": False}
-    
-    if os.path.exists(CONTROL_FILE):
-        try:
-            with open(CONTROL_FILE, "r") as f:
-                data.update(json.load(f))
-        except:
-            pass
-    
-    if pause is not None:
-        data["pause"] = pause
-    if stop is not None:
-        data["stop"] = stop
-    if recommended is not None:
-        data["recommended"] = recommended
-    
-    with open(CONTROL_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+    """Write control flags to control.json (atomic replace)"""
+    SESSION.control.write(pause=pause, stop=stop, recommended=recommended)
 
 # ============================================
 # CONFIG LOADING (DYNAMIC - RELOADS ON EACH RUN)
 # ============================================
-CONFIG = {}
-SEEK_EMAIL = ""
-JOB_TITLE = ""
-CV_PATH = ""
-MAX_JOBS = 100
-EXPECTED_SALARY = "100000"
-LOCATION = "Brisbane, Australia"
-SCAN_SPEED = 50
-APPLY_SPEED = 50
-COOLDOWN_DELAY = 5
-STEALTH_MODE = False
+# Config values live on the session (SESSION.CONFIG, SESSION.MAX_JOBS, ...) so several
+# profiles can run in one process
+OPENAI_MODEL = "gpt-4.1-mini"
+
+_ENV_LOADED = False
+
+def init():
+    """
+    One-time start-up of the current session: load .env, check the config exists and load it.
+    Importing main has no side effects; main() / run_session() call this first.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _ENV_LOADED = True
+
+    session = current_session()
+    if session.initialized:
+        return
+    if session.name:
+        print(f"[INSTANCE] Using log file: {session.log_file}")
+        print(f"[INSTANCE] Using config file: {session.config_file}")
+        print(f"[INSTANCE] Using control file: {session.control_file}")
+
+    if not os.path.exists(session.config_file):
+        raise FileNotFoundError(
+            f"Config file not found: {session.config_file}. Run config_gui.exe first to create it."
+        )
+    session.initialized = True
+
+    reload_config()
+
+    # Print blocklist info on startup
+    if session.BLOCKED_COMPANIES:
+        print(f"[BLOCKLIST] Companies: {', '.join(session.BLOCKED_COMPANIES)}")
+    if session.BLOCKED_TITLES:
+        print(f"[BLOCKLIST] Titles: {', '.join(session.BLOCKED_TITLES)}")
+
+def _shared_matcher(config):
+    """Compiled TitleMatcher, shared by every session with the same titles and blocklists"""
+    key = ("matcher",) + tuple(tuple(config.get(k, [])) for k in ("JOB_TITLES", "BLOCKED_TITLES", "BLOCKED_COMPANIES"))
+    return shared(key, lambda: TitleMatcher.from_config(config))
 
 def reload_config():
     """Reload config from file - call this at start of each run to get latest settings"""
-    global CONFIG, SEEK_EMAIL, JOB_TITLE, CV_PATH, MAX_JOBS, EXPECTED_SALARY
-    global LOCATION, SCAN_SPEED, APPLY_SPEED, COOLDOWN_DELAY, STEALTH_MODE
+    s = current_session()
     
     try:
-        with open(CONFIG_FILE, "r") as f:
-            CONFIG = json.load(f)
+        with open(s.config_file, "r") as f:
+            s.CONFIG = json.load(f)
     except Exception as e:
         print(f"[!] Failed to load config: {e}")
-        CONFIG = {}
+        s.CONFIG = {}
+    config = s.CONFIG
     
     # Reload all config values
-    SEEK_EMAIL = CONFIG.get("SEEK_EMAIL", "")
-    JOB_TITLE = CONFIG.get("JOB_TITLE", "")
-    CV_PATH = CONFIG.get("CV_PATH", "")
-    MAX_JOBS = CONFIG.get("MAX_JOBS", 100)
-    EXPECTED_SALARY = CONFIG.get("EXPECTED_SALARY", "100000")
-    LOCATION = CONFIG.get("LOCATION", "Brisbane, Australia")
-    SCAN_SPEED = CONFIG.get("SCAN_SPEED", 50)
-    APPLY_SPEED = CONFIG.get("APPLY_SPEED", 50)
-    COOLDOWN_DELAY = CONFIG.get("COOLDOWN_DELAY", 5)
-    STEALTH_MODE = CONFIG.get("STEALTH_MODE", False)
+    s.SEEK_EMAIL = config.get("SEEK_EMAIL", "")
+    s.JOB_TITLE = config.get("JOB_TITLE", "")
+    s.CV_PATH = config.get("CV_PATH", "")
+    s.MAX_JOBS = config.get("MAX_JOBS", 100)
+    s.EXPECTED_SALARY = config.get("EXPECTED_SALARY", "100000")
+    s.LOCATION = config.get("LOCATION", "Brisbane, Australia")
+    s.SCAN_SPEED = config.get("SCAN_SPEED", 50)
+    s.APPLY_SPEED = config.get("APPLY_SPEED", 50)
+    s.COOLDOWN_DELAY = config.get("COOLDOWN_DELAY", 5)
+    s.STEALTH_MODE = config.get("STEALTH_MODE", False)
+    
+    # Recompile title / blocklist matching for the new config
+    s.MATCHER = _shared_matcher(config)
+    s.BLOCKED_COMPANIES = [c.lower().strip() for c in config.get("BLOCKED_COMPANIES", [])]
+    s.BLOCKED_TITLES = [t.lower().strip() for t in config.get("BLOCKED_TITLES", [])]
+    s.SEARCH_URL = build_search_url(s.JOB_TITLE, s.LOCATION)
+
+    # Credentials - environment (.env) wins over config.json
+    s.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY") or config.get("OPENAI_API_KEY", "")
+    s.ANTHROPIC_API_KEY = (os.getenv("ANTHROPIC_API_KEY") or config.get("ANTHROPIC_API_KEY", "")).strip()
+    s.TWOCAPTCHA_API_KEY = os.getenv("TWOCAPTCHA_API_KEY") or config.get("TWOCAPTCHA_API_KEY", "")
+    s.TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID") or config.get("TWILIO_ACCOUNT_SID", "")
+    s.TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN") or config.get("TWILIO_AUTH_TOKEN", "")
+    s.TWILIO_WHATSAPP_FROM = os.getenv("TWILIO_WHATSAPP_FROM") or config.get("TWILIO_WHATSAPP_FROM", "whatsapp:+14155238886")
+    s.WHATSAPP_NOTIFICATIONS = config.get("WHATSAPP_NOTIFICATIONS", True)
     
     # Print speed settings
-    stealth_status = "🥷 ENABLED" if STEALTH_MODE else "OFF"
-    print(f"[CONFIG RELOADED] Scan: {SCAN_SPEED}% | Apply: {APPLY_SPEED}% | Cooldown: {COOLDOWN_DELAY}s | Stealth: {stealth_status}")
-    print(f"[CONFIG RELOADED] Max Jobs: {MAX_JOBS} | Location: {LOCATION}")
-
-# Initial load
-reload_config()
+    stealth_status = "🥷 ENABLED" if s.STEALTH_MODE else "OFF"
+    print(f"[CONFIG RELOADED] Scan: {s.SCAN_SPEED}% | Apply: {s.APPLY_SPEED}% | Cooldown: {s.COOLDOWN_DELAY}s | Stealth: {stealth_status}")
+    print(f"[CONFIG RELOADED] Max Jobs: {s.MAX_JOBS} | Location: {s.LOCATION}")
 
 def get_scan_multiplier():
     """Convert 1-100 slider to delay multiplier (100=fastest, 1=slowest)"""
-    if SCAN_SPEED >= 95:
+    if SESSION.SCAN_SPEED >= 95:
         return 0.02  # Near instant
-    elif SCAN_SPEED >= 75:
+    elif SESSION.SCAN_SPEED >= 75:
         return 0.15  # Fast
-    elif SCAN_SPEED >= 50:
+    elif SESSION.SCAN_SPEED >= 50:
         return 0.4   # Normal
-    elif SCAN_SPEED >= 25:
+    elif SESSION.SCAN_SPEED >= 25:
         return 0.8   # Slow
     else:
         return 1.5   # Very slow
 
 def get_apply_multiplier():
     """Convert 1-100 slider to delay multiplier for form filling"""
-    if APPLY_SPEED >= 95:
+    if SESSION.APPLY_SPEED >= 95:
         return 0.02
-    elif APPLY_SPEED >= 75:
+    elif SESSION.APPLY_SPEED >= 75:
         return 0.15
-    elif APPLY_SPEED >= 50:
+    elif SESSION.APPLY_SPEED >= 50:
         return 0.4
-    elif APPLY_SPEED >= 25:
+    elif SESSION.APPLY_SPEED >= 25:
         return 0.8
     else:
         return 1.5
 
 def throttle():
     """Extra delay layer for page scanning operations."""
-    if SCAN_SPEED >= 90:
+    if SESSION.SCAN_SPEED >= 90:
         return  # Skip entirely for fast modes
-    if SCAN_SPEED >= 75:
+    if SESSION.SCAN_SPEED >= 75:
         time.sleep(0.1)
-    elif SCAN_SPEED >= 50:
+    elif SESSION.SCAN_SPEED >= 50:
         time.sleep(0.3)
     else:
         time.sleep(0.6)
@@ -334,12 +298,12 @@ def speed_sleep(base, mode="scan"):
     
     # Enforce minimum delays for stability (but much lower for insane mode)
     if mode == "scan":
-        if SCAN_SPEED >= 95:
+        if SESSION.SCAN_SPEED >= 95:
             actual_delay = max(actual_delay, 0.05)  # 50ms minimum
         else:
             actual_delay = max(actual_delay, 0.1)   # 100ms minimum
     else:
-        if APPLY_SPEED >= 95:
+        if SESSION.APPLY_SPEED >= 95:
             actual_delay = max(actual_delay, 0.02)  # 20ms minimum for form filling
         else:
             actual_delay = max(actual_delay, 0.05)
@@ -348,9 +312,9 @@ def speed_sleep(base, mode="scan"):
 
 def job_cooldown():
     """Wait between job applications (from slider)."""
-    if COOLDOWN_DELAY > 0:
-        print(f"    [*] Cooldown: waiting {COOLDOWN_DELAY}s before next job...")
-        time.sleep(COOLDOWN_DELAY)
+    if SESSION.COOLDOWN_DELAY > 0:
+        print(f"    [*] Cooldown: waiting {SESSION.COOLDOWN_DELAY}s before next job...")
+        time.sleep(SESSION.COOLDOWN_DELAY)
 
 
 # ============================================
@@ -360,7 +324,7 @@ import random
 
 def stealth_random_scroll(driver):
     """Perform random scrolling like a human would"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     try:
@@ -382,7 +346,7 @@ def stealth_random_scroll(driver):
 
 def stealth_random_pause():
     """Add random pauses like a human reading"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     # Random pause between 0.5 and 2.5 seconds
@@ -391,7 +355,7 @@ def stealth_random_pause():
 
 def stealth_mouse_wiggle(driver):
     """Simulate mouse movement by moving to random elements"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     try:
@@ -410,7 +374,7 @@ def stealth_mouse_wiggle(driver):
 
 def stealth_reading_delay():
     """Simulate reading time on job description"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     # Simulate reading: 2-6 seconds
@@ -419,21 +383,21 @@ def stealth_reading_delay():
 
 def stealth_typing_delay():
     """Add small delays between typing actions"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     time.sleep(random.uniform(0.05, 0.15))
 
 def stealth_before_click():
     """Pause briefly before clicking (like a human would)"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     time.sleep(random.uniform(0.2, 0.6))
 
 def stealth_page_behavior(driver):
     """Combined human-like behavior when viewing a page"""
-    if not STEALTH_MODE:
+    if not SESSION.STEALTH_MODE:
         return
     
     try:
@@ -455,102 +419,23 @@ def title_matches(title: str) -> bool:
     Smart matching: checks if job title relates to user's target titles.
     Uses both direct matching AND category-based expansion.
     """
-    allowed = [t.lower().strip() for t in CONFIG.get("JOB_TITLES", [])]
-    title_clean = title.lower().strip()
-
-    # 1. Direct match - any target title keyword in job title
-    if any(a in title_clean for a in allowed):
-        return True
-    
-    # 2. Reverse match - any job title word in target titles
-    title_words = [w for w in title_clean.replace('-', ' ').split() if len(w) > 3]
-    for word in title_words:
-        if any(word in a for a in allowed):
-            return True
-    
-    # 3. Category expansion - related roles
-    category = detect_category(allowed)
-    
-    if category == "social":
-        related = ["research", "policy", "community", "program", "stakeholder", 
-                   "case manager", "social", "analyst", "coordinator", "officer",
-                   "engagement", "advisor", "consultant", "specialist"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "gov":
-        related = ["el1", "el 1", "el2", "el 2", "ses", "director", "policy",
-                   "principal", "executive", "governance", "advisor", "analyst",
-                   "coordinator", "officer", "manager", "public sector"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "project":
-        related = ["project", "program", "delivery", "scrum", "agile", "lead",
-                   "coordinator", "manager", "officer", "analyst"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "sales":
-        related = ["bdm", "business development", "sales", "account", "partnership",
-                   "growth", "client", "relationship", "solutions", "commercial"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "leadership":
-        related = ["director", "head", "general manager", "gm", "executive",
-                   "principal", "lead", "chief", "senior", "manager"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "admin":
-        related = ["admin", "coordinator", "ea", "executive assistant",
-                   "office", "project coordinator", "officer", "support"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    if category == "it":
-        related = ["developer", "engineer", "software", "it", "cloud", "cyber",
-                   "product", "technical", "devops", "data", "analyst"]
-        if any(r in title_clean for r in related):
-            return True
-    
-    return False
+    return SESSION.MATCHER.matches(title)
 
 
 # ---------- BLOCKLIST FILTERS ----------
-BLOCKED_COMPANIES = [c.lower().strip() for c in CONFIG.get("BLOCKED_COMPANIES", [])]
-BLOCKED_TITLES = [t.lower().strip() for t in CONFIG.get("BLOCKED_TITLES", [])]
-
 def is_company_blocked(company: str) -> bool:
     """Check if a company is in the blocklist"""
-    if not BLOCKED_COMPANIES:
-        return False
-    company_clean = company.lower().strip()
-    return any(blocked in company_clean for blocked in BLOCKED_COMPANIES)
+    return SESSION.MATCHER.blocked_company_keyword(company) is not None
 
 def is_title_blocked(title: str) -> bool:
     """Check if a job title contains blocked keywords"""
-    if not BLOCKED_TITLES:
-        return False
-    title_clean = title.lower().strip()
-    return any(blocked in title_clean for blocked in BLOCKED_TITLES)
-
-# Print blocklist info on startup
-if BLOCKED_COMPANIES:
-    print(f"[BLOCKLIST] Companies: {', '.join(BLOCKED_COMPANIES)}")
-if BLOCKED_TITLES:
-    print(f"[BLOCKLIST] Titles: {', '.join(BLOCKED_TITLES)}")
+    return SESSION.MATCHER.blocked_title_keyword(title) is not None
 
 
 # ============================================
 # TWILIO WHATSAPP NOTIFICATIONS
 # ============================================
-TWOCAPTCHA_API_KEY = os.getenv("TWOCAPTCHA_API_KEY") or CONFIG.get("TWOCAPTCHA_API_KEY", "")
-TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID") or CONFIG.get("TWILIO_ACCOUNT_SID", "")
-TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN") or CONFIG.get("TWILIO_AUTH_TOKEN", "")
-TWILIO_WHATSAPP_FROM = os.getenv("TWILIO_WHATSAPP_FROM") or CONFIG.get("TWILIO_WHATSAPP_FROM", "whatsapp:+14155238886")
-WHATSAPP_NOTIFICATIONS = CONFIG.get("WHATSAPP_NOTIFICATIONS", True)
+# Twilio credentials are loaded by reload_config()
 
 # Profile phone numbers for WhatsApp notifications
 PROFILE_PHONES = {
@@ -561,11 +446,11 @@ PROFILE_PHONES = {
 
 def send_whatsapp_summary(full_name, jobs_applied, duration_minutes, job_titles=None):
     """Send a WhatsApp summary via Twilio when run completes"""
-    if not WHATSAPP_NOTIFICATIONS:
+    if not SESSION.WHATSAPP_NOTIFICATIONS:
         print("[WhatsApp] Notifications disabled")
         return False
     
-    if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN:
+    if not SESSION.TWILIO_ACCOUNT_SID or not SESSION.TWILIO_AUTH_TOKEN:
         print("[WhatsApp] Twilio credentials not configured")
         return False
     
@@ -597,21 +482,21 @@ Great work! Your applications have been submitted."""
 
     try:
         # Twilio API endpoint
-        url = f"https://api.twilio.com/2010-04-01/Accounts/{TWILIO_ACCOUNT_SID}/Messages.json"
+        url = f"https://api.twilio.com/2010-04-01/Accounts/{SESSION.TWILIO_ACCOUNT_SID}/Messages.json"
         
         # Format phone for WhatsApp
         to_number = f"whatsapp:{phone}" if not phone.startswith("whatsapp:") else phone
         
         # Prepare data
         data = urllib.parse.urlencode({
-            'From': TWILIO_WHATSAPP_FROM,
+            'From': SESSION.TWILIO_WHATSAPP_FROM,
             'To': to_number,
             'Body': message
         }).encode('utf-8')
         
         # Create request with basic auth
         request = urllib.request.Request(url, data=data)
-        credentials = f"{TWILIO_ACCOUNT_SID}:{TWILIO_AUTH_TOKEN}"
+        credentials = f"{SESSION.TWILIO_ACCOUNT_SID}:{SESSION.TWILIO_AUTH_TOKEN}"
         import base64
         encoded_credentials = base64.b64encode(credentials.encode()).decode()
         request.add_header('Authorization', f'Basic {encoded_credentials}')
@@ -632,10 +517,10 @@ Great work! Your applications have been submitted."""
 
 def _send_slack(payload):
     """Generic Slack webhook POST helper. Returns True on success."""
-    if not CONFIG.get("SLACK_NOTIFICATIONS_ENABLED", False):
+    if not SESSION.CONFIG.get("SLACK_NOTIFICATIONS_ENABLED", False):
         return False
 
-    webhook = (os.getenv("SLACK_WEBHOOK_URL") or CONFIG.get("SLACK_WEBHOOK_URL", "")).strip()
+    webhook = (os.getenv("SLACK_WEBHOOK_URL") or SESSION.CONFIG.get("SLACK_WEBHOOK_URL", "")).strip()
     if not webhook or not webhook.startswith("https://hooks.slack.com/"):
         return False
 
@@ -729,36 +614,29 @@ def send_slack_alert(instance_name, message, level="warning"):
     return _send_slack({"text": fallback, "blocks": blocks})
 
 
-# OpenAI
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY") or CONFIG.get("OPENAI_API_KEY", "")
-OPENAI_MODEL = "gpt-4.1-mini"
-
-# Anthropic (fallback when OpenAI fails)
-ANTHROPIC_API_KEY = (os.getenv("ANTHROPIC_API_KEY") or CONFIG.get("ANTHROPIC_API_KEY", "")).strip()
-
 
 # ============================================
 # BUILD SEEK URL (NOW USES LOCATION)
 # ============================================
-def build_search_url(job_title, location):
+def build_search_url(job_title, location, page=1):
     # Strip ", Australia" because SEEK doesn't use it in URL searches
     safe_location = location.replace(", Australia", "").strip()
 
     job_query = job_title.replace(" ", "%20")
     loc_query = safe_location.replace(" ", "%20")
 
-    return f"https://www.seek.com.au/jobs?keywords={job_query}&where={loc_query}&sortmode=ListedDate"
-
-
-
-SEARCH_URL = build_search_url(JOB_TITLE, LOCATION)
+    url = f"https://www.seek.com.au/jobs?keywords={job_query}&where={loc_query}&sortmode=ListedDate"
+    return f"{url}&page={page}" if page > 1 else url
 
 
 
 # ------------------ FIXED BROWSER LAUNCHER ------------------
+_BROWSER_LAUNCH_LOCK = threading.Lock()
+
 def init_browser():
     import tempfile
 
+    timer = StartupTimer()
     chrome_options = uc.ChromeOptions()
 
     # Check if running in headless mode (for VPS/server deployment)
@@ -783,11 +661,10 @@ def init_browser():
 
     # Each bot instance MUST use its own Chrome profile (never share logins)
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    bot_chrome_profile = os.getenv("BOT_CHROME_PROFILE")
+    bot_chrome_profile = SESSION.chrome_profile
     # If we're an instance (have instance config) but profile not set, derive from config path
-    if not bot_chrome_profile and os.getenv("BOT_CONFIG_FILE"):
-        config_path = os.getenv("BOT_CONFIG_FILE", "")
-        base = os.path.basename(config_path)
+    if not bot_chrome_profile and SESSION.name:
+        base = os.path.basename(SESSION.config_file)
         if base.endswith("_config.json"):
             instance_name = base.replace("_config.json", "").strip()
             bot_chrome_profile = f"chrome_profile_{instance_name}"
@@ -803,18 +680,47 @@ def init_browser():
         profile_dir = os.path.join(os.path.expanduser("~"), ".seekmate_chrome_profile")
         os.makedirs(profile_dir, exist_ok=True)
 
+    # Lean profile: fewer processes and caches for more bots per VPS (browser_profile.py)
+    if SESSION.CONFIG.get("BROWSER_PROFILE", "default") == "lean":
+        apply_lean_options(chrome_options,
+                           cache_mb=SESSION.CONFIG.get("BROWSER_CACHE_MB", DEFAULT_CACHE_MB),
+                           renderer_limit=SESSION.CONFIG.get("BROWSER_RENDERER_LIMIT", DEFAULT_RENDERER_LIMIT),
+                           share_renderers=SESSION.CONFIG.get("BROWSER_SHARE_RENDERERS", False))
+        freed = prune_profile(profile_dir)
+        print(f"[BROWSER] Lean profile: pruned {freed:.0f} MB of caches")
+
+    # Route through the local asset proxy so bundles are downloaded once per machine (asset_proxy.py)
+    if SESSION.CONFIG.get("ASSET_PROXY", False):
+        proxy_args = chrome_proxy_args()
+        for arg in proxy_args:
+            chrome_options.add_argument(arg)
+        print("[BROWSER] Using the local asset proxy" if proxy_args else
+              "[BROWSER] ASSET_PROXY is on but no asset proxy is running - connecting directly")
+
     # Allow popups so window.open() works for opening job tabs
     chrome_options.add_experimental_option("prefs", {
         "profile.default_content_setting_values.popups": 1,
     })
 
     print(f"[BROWSER] Chrome profile: {profile_dir}")
-    driver = uc.Chrome(options=chrome_options, user_data_dir=profile_dir)
+    # Patched once per Chrome version and shared read-only (driver_cache.py)
+    major = chrome_major_version()
+    driver_path = patched_driver_path(major)
+    timer.mark("driver")
+    if driver_path:
+        driver = uc.Chrome(options=chrome_options, user_data_dir=profile_dir,
+                           driver_executable_path=driver_path, version_main=major)
+    else:
+        # undetected_chromedriver patches the driver binary on launch - one session at a time
+        with _BROWSER_LAUNCH_LOCK:
+            driver = uc.Chrome(options=chrome_options, user_data_dir=profile_dir)
+    timer.mark("chrome launch")
+    driver.startup_timer = timer
 
     # Set implicit wait based on SCAN_SPEED slider
-    if SCAN_SPEED >= 90:
+    if SESSION.SCAN_SPEED >= 90:
         driver.implicitly_wait(0.1)
-    elif SCAN_SPEED >= 50:
+    elif SESSION.SCAN_SPEED >= 50:
         driver.implicitly_wait(1)
     else:
         driver.implicitly_wait(3)
@@ -861,42 +767,75 @@ class SeekBot:
         self.driver = driver
         self.applied_job_titles = []  # Track job titles that were successfully applied to
         self.job_timestamps = []  # Track timestamps for 24/7 mode
-        self.mode_24_7 = CONFIG.get("MODE_24_7", False)
+        self.mode_24_7 = SESSION.CONFIG.get("MODE_24_7", False)
+        # Counters also go to the per-instance time series behind the dashboard chart
+        self.metrics = MetricsStore(SESSION.metrics_dir, enabled=SESSION.CONFIG.get("METRICS_ENABLED", True))
+        self.status = StatusPublisher(SESSION.status_file, bot="seek", instance=SESSION.name,
+                                      max_jobs=SESSION.MAX_JOBS, metrics=self.metrics)
+        self.checkpoint = RunCheckpoint(
+            SESSION.checkpoint_file,
+            enabled=SESSION.CONFIG.get("RESUME_CHECKPOINT", True),
+            max_age_hours=SESSION.CONFIG.get("CHECKPOINT_MAX_AGE_HOURS", CHECKPOINT_MAX_AGE_HOURS)
+        )
+        self.run_completed = False
+        # The search page's tab and the tabs opened for the current job - a shared-mode Gmail
+        # window lives in the same Chrome and must never be switched to or closed
+        self.main_handle = driver.current_window_handle
+        self.job_handles = []
         
         # WebDriverWait timeout based on speed
-        if SCAN_SPEED >= 90:
+        if SESSION.SCAN_SPEED >= 90:
             wait_timeout = 3   # Fast timeout for insane mode
-        elif SCAN_SPEED >= 50:
+        elif SESSION.SCAN_SPEED >= 50:
             wait_timeout = 8   # Normal timeout
         else:
             wait_timeout = 15  # Patient timeout for slow mode
         
         self.wait = WebDriverWait(driver, wait_timeout)
-        self.client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+        # LLM clients (and their connection pools) are shared by every session using the same key
+        openai_key = SESSION.OPENAI_API_KEY
+        self.client = shared(("openai", openai_key, "apply"),
+                             lambda: make_openai_client(openai_key, priority="apply")) if openai_key else None
         self.anthropic_client = None
-        if ANTHROPIC_AVAILABLE and ANTHROPIC_API_KEY:
+        if ANTHROPIC_AVAILABLE and SESSION.ANTHROPIC_API_KEY:
             try:
-                self.anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY)
+                anthropic_key = SESSION.ANTHROPIC_API_KEY
+                self.anthropic_client = shared(("anthropic", anthropic_key, "apply"),
+                                               lambda: make_anthropic_client(anthropic_key, priority="apply"))
             except Exception as e:
                 print(f"[!] Anthropic fallback not available: {e}")
         
         # Initialize Gmail cleanup if available and enabled
         self.gmail_cleanup = None
         self.gmail_thread = None
-        use_gmail_cleanup = CONFIG.get("USE_GMAIL_CLEANUP", False)
-        if GMAIL_CLEANUP_AVAILABLE and use_gmail_cleanup:
+        use_gmail_cleanup = SESSION.CONFIG.get("USE_GMAIL_CLEANUP", False)
+        if use_gmail_cleanup and SESSION.CONFIG.get("GMAIL_BACKEND", "browser") == "imap":
+            # No browser at all: IMAP fetch + one batched server-side delete per pass
+            self.gmail_cleanup = GmailImapCleanup.from_config(SESSION.CONFIG, openai_client=self.client)
+            print("[Gmail] Gmail cleanup initialized over IMAP")
+        elif use_gmail_cleanup:
             try:
                 # Create Gmail cleanup with separate window (doesn't interfere with main bot)
+                # "shared" mode: a background window in this bot's Chrome instead of a second browser
                 # Pass OpenAI client for GPT analysis
+                shared_browser = SESSION.CONFIG.get("GMAIL_BROWSER_MODE", "separate") == "shared"
                 self.gmail_cleanup = GmailCleanup(
                     driver=None,  # Will create its own browser
                     openai_client=self.client,
-                    create_separate_window=True
+                    create_separate_window=True,
+                    seen_file=default_seen_file(SESSION.name),
+                    local_classifier=SESSION.CONFIG.get("GMAIL_LOCAL_CLASSIFIER", True),
+                    attach_to=driver if shared_browser else None,
+                    search_delete=SESSION.CONFIG.get("GMAIL_SEARCH_DELETE", False),
+                    delete_senders=SESSION.CONFIG.get("GMAIL_DELETE_SENDERS"),
+                    search_older_than=SESSION.CONFIG.get("GMAIL_SEARCH_OLDER_THAN")
                 )
                 print("[Gmail] Gmail cleanup initialized with GPT analysis in separate window")
+            except ImportError as e:
+                print(f"[!] Gmail cleanup module not available: {e}")
             except Exception as e:
                 print(f"[Gmail] Failed to initialize: {e}")
-        elif not use_gmail_cleanup:
+        else:
             print("[Gmail] Gmail cleanup is disabled in config")
 
     # ---------- GPT ----------
@@ -925,10 +864,12 @@ class SeekBot:
         # Track job title for WhatsApp summary
         if title not in self.applied_job_titles:
             self.applied_job_titles.append(title)
-    def gpt(self, system_prompt: str, user_prompt: str) -> str:
+    def gpt(self, system_prompt: str, user_prompt: str, priority: str = "apply") -> str:
+        """priority: "apply" for answers during an application, "triage" for relevance checks"""
         # Try OpenAI first
         if self.client:
             try:
+                started = time.time()
                 res = self.client.chat.completions.create(
                     model=OPENAI_MODEL,
                     messages=[
@@ -937,7 +878,9 @@ class SeekBot:
                     ],
                     max_tokens=800,
                     temperature=0.4,
+                    extra_headers=priority_headers(priority),
                 )
+                self.metrics.observe("llm_latency_ms", (time.time() - started) * 1000)
                 return res.choices[0].message.content.strip()
             except Exception as e:
                 print(f"GPT ERROR: {e}")
@@ -946,21 +889,57 @@ class SeekBot:
         # Anthropic fallback
         if self.anthropic_client:
             try:
+                started = time.time()
                 res = self.anthropic_client.messages.create(
                     model="claude-3-5-haiku-20241022",
                     max_tokens=800,
                     system=system_prompt,
                     messages=[{"role": "user", "content": user_prompt}],
+                    extra_headers=priority_headers(priority),
                 )
+                self.metrics.observe("llm_latency_ms", (time.time() - started) * 1000)
                 return res.content[0].text.strip()
             except Exception as e:
                 print(f"CLAUDE ERROR: {e}")
         return ""
 
+    # ---------- METRICS ----------
+    def _sample_browser_memory(self):
+        """Background: record Chrome's total RSS (browser + renderers) until the browser is gone"""
+        import psutil
+        pid = getattr(self.driver, "browser_pid", None)
+        if not pid:
+            return
+        while True:
+            try:
+                browser = psutil.Process(pid)
+                procs = [browser] + browser.children(recursive=True)
+                rss = 0
+                for p in procs:
+                    try:
+                        rss += p.memory_info().rss
+                    except psutil.Error:
+                        pass
+                self.metrics.observe("browser_memory_mb", rss / (1024 * 1024))
+            except psutil.Error:
+                return
+            time.sleep(METRICS_SAMPLE_INTERVAL)
+
+    def report_startup(self):
+        """Print (once) how long driver preparation, Chrome launch and the first page load took"""
+        timer = getattr(self.driver, "startup_timer", None)
+        if not timer or timer.has("first navigation"):
+            return
+        timer.mark("first navigation")
+        print(f"[BROWSER] Startup: {timer.summary()}")
+        for step, seconds in timer.steps:
+            self.metrics.observe(f"startup_{step.replace(' ', '_')}_ms", seconds * 1000)
+
     # ---------- LOGIN ----------
     def ensure_logged_in(self):
         try:
             self.driver.get("https://www.seek.com.au/")
+            self.report_startup()
             speed_sleep(5, "scan")
 
             # Check for Cloudflare challenge before anything else
@@ -994,9 +973,9 @@ class SeekBot:
 
     # ---------- SEARCH ----------
     def open_search(self):
-        print(f"[*] Opening search for: {JOB_TITLE}")
-        print(f"    URL: {SEARCH_URL}")
-        self.driver.get(SEARCH_URL)
+        print(f"[*] Opening search for: {SESSION.JOB_TITLE}")
+        print(f"    URL: {SESSION.SEARCH_URL}")
+        self.driver.get(SESSION.SEARCH_URL)
         speed_sleep(3, "scan")
         wait_for_cloudflare(self.driver)
         throttle()
@@ -1058,7 +1037,67 @@ class SeekBot:
             print(f"    [!] Could not get job count: {e}")
             return 0
 
+    # ---------- TABS ----------
+    def bot_handles(self):
+        """This bot's tabs, without the Gmail window a shared-mode cleanup keeps in the same Chrome"""
+        gmail = getattr(self.gmail_cleanup, "gmail_tab_handle", None)
+        return [h for h in self.driver.window_handles if h != gmail]
+
+    def switch_to_new_tab(self, handles_before):
+        """Switch to a tab opened since handles_before and remember it as a job tab. Returns the handle or None."""
+        new_handles = [h for h in self.bot_handles() if h not in handles_before]
+        if not new_handles:
+            return None
+        handle = new_handles[-1]
+        self.job_handles.append(handle)
+        self.driver.switch_to.window(handle)
+        return handle
+
+    def close_job_tabs(self):
+        """Close the tabs opened for the current job and go back to the search page. True if any were closed."""
+        open_handles = self.bot_handles()
+        closed = False
+        for handle in self.job_handles:
+            if handle in open_handles and handle != self.main_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+                closed = True
+        self.job_handles = []
+        if self.main_handle in open_handles:
+            self.driver.switch_to.window(self.main_handle)
+        return closed
+
     # ---------- OPEN JOB ----------
+    def open_job_url(self, href) -> str:
+        """Opens a known job URL in a new tab (frontier jobs have no card). Returns URL or empty string."""
+        throttle()
+        try:
+            handles_before = set(self.bot_handles())
+            self.driver.execute_script("window.open(arguments[0], '_blank');", href)
+            speed_sleep(2, "scan")
+            if not self.switch_to_new_tab(handles_before):
+                # window.open blocked - open a blank tab and navigate it
+                self.driver.execute_script("window.open('');")
+                speed_sleep(1, "scan")
+                if not self.switch_to_new_tab(handles_before):
+                    return ""
+                self.driver.get(href)
+                speed_sleep(2, "scan")
+            stealth_page_behavior(self.driver)
+            print(f"    [+] Opened: {href}")
+            return href
+        except Exception as e:
+            print(f"    [-] Could not open job: {e}")
+            return ""
+
+    def card_job_id(self, card):
+        """SEEK job id of a search result card without opening it ("" if it has no link)"""
+        try:
+            href = card.find_element(By.CSS_SELECTOR, "a[data-automation='jobTitle']").get_attribute("href") or ""
+        except Exception:
+            return ""
+        return job_id_from_url(href) if href and href != "#" else ""
+
     def open_job(self, card) -> str:
         """Opens job in new tab. Returns URL if successful, empty string if failed."""
         throttle()
@@ -1073,12 +1112,10 @@ class SeekBot:
             speed_sleep(0.5, "scan")
 
             # Open job in a new tab (preserves search results page)
-            handles_before = set(self.driver.window_handles)
+            handles_before = set(self.bot_handles())
             self.driver.execute_script("window.open(arguments[0], '_blank');", href)
             speed_sleep(2, "scan")
-            new_handles = set(self.driver.window_handles) - handles_before
-            if new_handles:
-                self.driver.switch_to.window(new_handles.pop())
+            if self.switch_to_new_tab(handles_before):
                 stealth_page_behavior(self.driver)
                 print(f"    [+] Opened: {href}")
                 return href
@@ -1090,9 +1127,7 @@ class SeekBot:
             try:
                 ActionChains(self.driver).key_down(Keys.CONTROL).click(link).key_up(Keys.CONTROL).perform()
                 speed_sleep(2, "scan")
-                new_handles = set(self.driver.window_handles) - handles_before
-                if new_handles:
-                    self.driver.switch_to.window(new_handles.pop())
+                if self.switch_to_new_tab(handles_before):
                     stealth_page_behavior(self.driver)
                     print(f"    [+] Opened (Ctrl+click): {href}")
                     return href
@@ -1103,9 +1138,7 @@ class SeekBot:
             print("    [*] Trying direct navigation fallback...")
             self.driver.execute_script("window.open('');")
             speed_sleep(1, "scan")
-            new_handles = set(self.driver.window_handles) - handles_before
-            if new_handles:
-                self.driver.switch_to.window(new_handles.pop())
+            if self.switch_to_new_tab(handles_before):
                 self.driver.get(href)
                 speed_sleep(2, "scan")
                 stealth_page_behavior(self.driver)
@@ -1226,16 +1259,16 @@ class SeekBot:
         Selected presets are combined into JOB_TITLES in the config GUI.
         """
         # Check if GPT job check is enabled (TIGHT mode) or disabled (LOOSE mode)
-        if not CONFIG.get("GPT_JOB_CHECK", False):
+        if not SESSION.CONFIG.get("GPT_JOB_CHECK", False):
             print("    [⚡ LOOSE MODE] Skipping GPT job check - applying to all")
             return True  # LOOSE mode - apply to everything
         
-        if not OPENAI_API_KEY:
+        if not SESSION.OPENAI_API_KEY:
             return True  # If no API key, skip this check
         
         # JOB_TITLES contains all titles from all selected presets (when using preset chips)
         # or manually entered titles (when editing job entry directly)
-        target_titles = CONFIG.get("JOB_TITLES", [])
+        target_titles = SESSION.CONFIG.get("JOB_TITLES", [])
         
         # Get related titles based on preset categories
         related_titles = self._get_related_titles_for_preferences(target_titles)
@@ -1275,7 +1308,8 @@ Examples:
         try:
             response = self.gpt(
                 "You are a job matching assistant. Be strict about role relevance. Protect users from applying to mismatched roles.",
-                prompt
+                prompt,
+                priority="triage"
             )
             print(f"    [🤖 GPT] Job check: {response}")
             return response.upper().startswith("YES")
@@ -1367,14 +1401,13 @@ Examples:
     # ---------- SELECTION CRITERIA STATEMENT (GPT) ----------
     def fill_selection_criteria(self, job_title, company, desc):
         """Generate and fill selection criteria statement using GPT"""
-        full_name = CONFIG.get("FULL_NAME", "Applicant")
-        location = CONFIG.get("LOCATION", "Australia")
-        background_bio = CONFIG.get("BACKGROUND_BIO", "")
+        full_name = SESSION.CONFIG.get("FULL_NAME", "Applicant")
+        location = SESSION.CONFIG.get("LOCATION", "Australia")
+        background_bio = SESSION.CONFIG.get("BACKGROUND_BIO", "")
         
         # Find selection criteria input (textarea or rich editor)
         textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
         criteria_input = None  # selenium element
-        criteria_kind = None   # "textarea" | "contenteditable"
         
         for ta in textareas:
             try:
@@ -1391,7 +1424,6 @@ Examples:
                 if any(kw in placeholder or kw in name_attr or kw in aria 
                        for kw in ["selection", "criteria", "statement", "address"]):
                     criteria_input = ta
-                    criteria_kind = "textarea"
                     break
                     
             except:
@@ -1406,7 +1438,6 @@ Examples:
                 )
                 if sections:
                     criteria_input = sections[0]
-                    criteria_kind = "textarea"
             except:
                 pass
         
@@ -1420,7 +1451,6 @@ Examples:
                 )
                 if editables:
                     criteria_input = editables[0]
-                    criteria_kind = "contenteditable"
             except:
                 pass
 
@@ -1433,7 +1463,6 @@ Examples:
                 )
                 if role_boxes:
                     criteria_input = role_boxes[0]
-                    criteria_kind = "contenteditable"
             except:
                 pass
 
@@ -1481,36 +1510,9 @@ JOB DESCRIPTION:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", criteria_input)
             speed_sleep(0.5, "apply")
 
-            if criteria_kind == "textarea":
-                # Clear and fill
-                criteria_input.clear()
-                speed_sleep(0.2, "apply")
-
-                self.driver.execute_script(
-                    "arguments[0].value = arguments[1];", criteria_input, statement
-                )
-
-                # Fire events
-                self.driver.execute_script("""
-                    arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-                    arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-                """, criteria_input)
-
-                speed_sleep(0.3, "apply")
-                criteria_input.send_keys(" ")
-                criteria_input.send_keys("\b")
-            else:
-                # Rich editor: set text via JS and dispatch events
-                self.driver.execute_script("arguments[0].focus();", criteria_input)
-                speed_sleep(0.2, "apply")
-                self.driver.execute_script(
-                    "arguments[0].innerText = arguments[1];", criteria_input, statement
-                )
-                self.driver.execute_script("""
-                    arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-                    arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-                """, criteria_input)
-                speed_sleep(0.2, "apply")
+            # Textarea or rich editor - inserted in one go, falls back to typing (text_entry.py)
+            fill_text(self.driver, criteria_input, statement)
+            speed_sleep(0.3, "apply")
 
             print("    [+] Selection criteria statement added (GPT)")
             
@@ -1519,9 +1521,9 @@ JOB DESCRIPTION:
 
     # ---------- COVER LETTER (NEW LONG VERSION + OVERWRITE PROTECTION) ----------
     def fill_cover_letter(self, job_title, company, desc):
-        full_name = CONFIG.get("FULL_NAME", "Applicant")
-        location = CONFIG.get("LOCATION", "Australia")
-        background_bio = CONFIG.get("BACKGROUND_BIO", "")
+        full_name = SESSION.CONFIG.get("FULL_NAME", "Applicant")
+        location = SESSION.CONFIG.get("LOCATION", "Australia")
+        background_bio = SESSION.CONFIG.get("BACKGROUND_BIO", "")
         
         # Phone numbers for each profile
         PROFILE_PHONES = {
@@ -1609,29 +1611,10 @@ JOB DESCRIPTION:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", ta)
                 speed_sleep(0.5, "apply")
 
-                # 1) Double clear
-                ta.clear()
-                speed_sleep(0.2, "apply")
-                ta.clear()
-                speed_sleep(0.2, "apply")
-
-                # 2) Inject via JS
-                self.driver.execute_script(
-                    "arguments[0].value = arguments[1];", ta, letter
-                )
-
-                # 3) Fire typing events
-                self.driver.execute_script("""
-                    arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-                    arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-                """, ta)
-
+                # Replaces whatever SEEK pre-filled, with real input events so React commits it
+                fill_text(self.driver, ta, letter)
                 speed_sleep(0.4, "apply")
 
-                # 4) Force SEEK to commit
-                ta.send_keys(" ")
-                ta.send_keys("\b")
-
                 print("    [+] Cover letter added (overwrite protection).")
                 return
             except:
@@ -1639,9 +1622,9 @@ JOB DESCRIPTION:
 
     # ---------- SCREENING TEXT QUESTIONS (MULTI-USER VERSION) ----------
     def answer_questions(self, job_title, company, desc):
-        full_name = CONFIG.get("FULL_NAME", "the candidate")
-        location = CONFIG.get("LOCATION", "Australia")
-        background_bio = CONFIG.get("BACKGROUND_BIO", "")
+        full_name = SESSION.CONFIG.get("FULL_NAME", "the candidate")
+        location = SESSION.CONFIG.get("LOCATION", "Australia")
+        background_bio = SESSION.CONFIG.get("BACKGROUND_BIO", "")
 
         textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
 
@@ -1705,8 +1688,7 @@ QUESTION:
                 # Fill the textarea safely
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", ta)
                 speed_sleep(0.5, "apply")
-                ta.clear()
-                ta.send_keys(answer)
+                fill_text(self.driver, ta, answer)
                 speed_sleep(0.3, "apply")
 
             except Exception as e:
@@ -1931,7 +1913,7 @@ QUESTION:
                     # ---------- SALARY EXPECTATIONS ----------
                     if any(word in label_text for word in ["salary", "pay", "remuneration", "expectation", "compensation"]):
                         # Find the option closest to our expected salary
-                        target_salary = EXPECTED_SALARY
+                        target_salary = SESSION.EXPECTED_SALARY
                         if isinstance(target_salary, str):
                             target_salary = int(target_salary.replace(",", "").replace("$", "").replace("k", "000"))
                         
@@ -2026,7 +2008,7 @@ QUESTION:
                             continue
                         
                         # Get our expected salary
-                        target_salary = EXPECTED_SALARY
+                        target_salary = SESSION.EXPECTED_SALARY
                         if isinstance(target_salary, str):
                             target_salary = target_salary.replace(",", "").replace("$", "").replace("k", "000")
                         
@@ -2152,7 +2134,7 @@ QUESTION:
                     if item["type"] == "text":
                         # Text question - ask GPT for a written answer
                         answer = self.gpt(
-                            f"You are {CONFIG.get('FULL_NAME', 'a professional')} applying for {job_title} at {company}. Answer concisely and professionally.",
+                            f"You are {SESSION.CONFIG.get('FULL_NAME', 'a professional')} applying for {job_title} at {company}. Answer concisely and professionally.",
                             f"""Answer this job application question in 2-4 sentences. Be specific and enthusiastic.
 
 Question: {item['question']}
@@ -2160,16 +2142,15 @@ Question: {item['question']}
 Context about the role:
 {desc[:500] if desc else 'No description available'}
 
-Your background: {CONFIG.get('BACKGROUND_BIO', 'Experienced professional')}
-Location: {CONFIG.get('LOCATION', 'Australia')}"""
+Your background: {SESSION.CONFIG.get('BACKGROUND_BIO', 'Experienced professional')}
+Location: {SESSION.CONFIG.get('LOCATION', 'Australia')}"""
                         )
                         
                         if answer:
                             ta = item["element"]
                             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", ta)
                             speed_sleep(0.2, "apply")
-                            ta.clear()
-                            ta.send_keys(answer)
+                            fill_text(self.driver, ta, answer)
                             print(f"    [+] GPT answered: {item['question'][:50]}...")
                             speed_sleep(0.2, "apply")
                     
@@ -2187,7 +2168,7 @@ Options:
 Important context:
 - You are an Australian citizen with full work rights
 - You have a driver's license
-- You are based in {CONFIG.get('LOCATION', 'Australia')}
+- You are based in {SESSION.CONFIG.get('LOCATION', 'Australia')}
 - You can travel if needed
 - Answer YES to capability questions
 - For experience questions, pick the highest/best option
@@ -2327,17 +2308,19 @@ Reply with ONLY the exact option text to select:"""
 
         if not apply_btn:
             print("    [-] No apply button found.")
+            self.status.incr("skipped")
             return
 
         # GPT Job Relevance Check - ONLY if Quick Apply button exists
         desc = self.get_description()
-        if desc and OPENAI_API_KEY:
+        if desc and SESSION.OPENAI_API_KEY:
             if not self.gpt_should_apply(job_title, desc):
                 print(f"    [🤖 SKIP] GPT says job doesn't match your target roles")
+                self.status.incr("skipped")
                 return
 
         # Now click the apply button
-        handles_before = len(self.driver.window_handles)
+        handles_before = set(self.bot_handles())
         url_before = ""
         try:
             url_before = (self.driver.current_url or "").lower()
@@ -2353,16 +2336,18 @@ Reply with ONLY the exact option text to select:"""
             print("    [+] Clicked apply button:", apply_sel)
         except Exception as e:
             print(f"    [-] Failed to click apply button: {e}")
+            self.status.incr("failed")
+            self.status.error(f"Failed to click apply button: {e}")
             return
 
+        self.status.set_phase("applying")
         speed_sleep(3, "apply")
         throttle()
         stealth_random_pause()  # Pause after form loads
 
         # If Quick apply opened in a new tab/window, switch to it
         try:
-            if len(self.driver.window_handles) > handles_before:
-                self.driver.switch_to.window(self.driver.window_handles[-1])
+            if self.switch_to_new_tab(handles_before):
                 speed_sleep(1, "scan")
                 throttle()
         except:
@@ -2445,6 +2430,7 @@ Reply with ONLY the exact option text to select:"""
         # PAGE 2+ — full automation with GPT fallback
         # --------------------------
         for page_attempt in range(6):
+            self.status.beat()
             # First pass - use rule-based handlers
             self.answer_questions(job_title, company, desc)
             self.answer_radio_buttons()
@@ -2518,16 +2504,17 @@ Reply with ONLY the exact option text to select:"""
 
             # Register in shared tracker so other bot instances skip this job
             if SHARED_JOBS_AVAILABLE:
-                instance_name = os.getenv("BOT_INSTANCE_NAME") or CONFIG.get("FULL_NAME", "Main")
+                instance_name = SESSION.name or SESSION.CONFIG.get("FULL_NAME", "Main")
                 register_applied_job(job_url, instance_name, job_title, company)
 
             # COUNT REAL SUBMISSION
             self.successful_submits += 1
             current_time = datetime.now()
             self.job_timestamps.append(current_time)
+            self.status.incr("applied", event=f"Applied: {job_title} @ {company}")
             
             # Live Slack notification: instance, status, jobs, time only
-            instance_name = os.getenv("BOT_INSTANCE_NAME") or CONFIG.get("FULL_NAME", "Main")
+            instance_name = SESSION.name or SESSION.CONFIG.get("FULL_NAME", "Main")
             elapsed = int(time.time() - getattr(self, "run_start_time", time.time()))
             m, s = divmod(elapsed, 60)
             h, m = divmod(m, 60)
@@ -2538,6 +2525,7 @@ Reply with ONLY the exact option text to select:"""
             # Clean old timestamps (older than 24 hours)
             cutoff_time = current_time - timedelta(hours=24)
             self.job_timestamps = [ts for ts in self.job_timestamps if ts > cutoff_time]
+            self.checkpoint.job_done(job_id_from_url(job_url), self.successful_submits, self.job_timestamps)
             
             print(f"    [+] Successful submissions: {self.successful_submits}")
             
@@ -2589,10 +2577,172 @@ Reply with ONLY the exact option text to select:"""
 
     def send_summary_and_exit(self, run_start_time):
         """Helper to send WhatsApp summary and exit"""
+        self.status.finish("stopped" if check_control() == "stop" else "finished")
+        # Only a run that worked through everything (or hit MAX_JOBS) starts from the top next time
+        self.checkpoint.finish("finished" if self.run_completed else "stopped",
+                               self.successful_submits, self.job_timestamps)
         duration_minutes = int((time.time() - run_start_time) / 60)
-        full_name = CONFIG.get("FULL_NAME", "User")
+        full_name = SESSION.CONFIG.get("FULL_NAME", "User")
         send_whatsapp_summary(full_name, self.successful_submits, duration_minutes)
 
+    # ---------- SHARED JOB FRONTIER (multi-bot) ----------
+    def _frontier_accept(self, job):
+        """This profile's eligibility check for a job another instance may have discovered"""
+        verdict, reason = SESSION.MATCHER.check_title(job["title"])
+        if verdict == "mismatch":
+            print(f"    [-] SKIPPED (title mismatch): {job['title']}")
+        elif verdict == "blocked":
+            print(f"    [🚫] BLOCKED (title '{reason}'): {job['title']}")
+        elif is_company_blocked(job["company"]):
+            print(f"    [🚫] BLOCKED (company): {job['company']}")
+        elif SHARED_JOBS_AVAILABLE and is_job_applied(job["url"]):
+            print(f"    [!] SKIP: Already applied by another bot instance")
+        else:
+            return True
+        self.status.incr("skipped")
+        return False
+
+    def _discover_jobs(self, frontier, search_title, location, page):
+        """Scrape up to PAGES_PER_CLAIM result pages of one search into the frontier"""
+        print(f"\n[Frontier] 🌍 Discovering: {search_title} in {location} (page {page})")
+        self.status.set_phase("searching", title=search_title, location=location, page=page)
+        self.driver.get(build_search_url(search_title, location, page))
+        speed_sleep(3, "scan")
+        throttle()
+
+        exhausted = False
+        for n in range(PAGES_PER_CLAIM):
+            if check_control() == "stop":
+                break
+            self.status.update(page=page)
+            cards = self.get_job_cards()
+            if not cards:
+                exhausted = True
+                break
+
+            jobs = []
+            for card in cards:
+                try:
+                    link = card.find_element(By.CSS_SELECTOR, "a[data-automation='jobTitle']")
+                    href = link.get_attribute("href") or ""
+                    title = link.text or "Unknown"
+                except:
+                    continue
+                if not href or href == "#":
+                    continue
+                try:
+                    company = card.find_element(By.CSS_SELECTOR, "[data-automation='jobCompany']").text
+                except:
+                    company = "Unknown"
+                jobs.append({"url": href, "title": title, "company": company})
+
+            added = frontier.add_jobs(jobs, location)
+            print(f"[Frontier] Page {page}: {len(jobs)} jobs, {added} new")
+            page += 1
+
+            if n < PAGES_PER_CLAIM - 1 and not self.go_to_next_page():
+                exhausted = True
+                break
+
+        frontier.release_search(search_title, location, page, exhausted=exhausted)
+        if exhausted:
+            print(f"[Frontier] ✓ Exhausted all pages for {search_title} in {location}")
+
+    def _apply_frontier_job(self, frontier, job):
+        """Apply to one leased job. Returns False if the run should stop."""
+        title, company = job["title"], job["company"]
+        print(f"\n[*] Job: {title} | {company}")
+        self.status.set_phase("scanning", title=title)
+        self.status.incr("scanned", event=f"{title} | {company}")
+
+        # Check 24/7 mode limit before applying
+        if self.mode_24_7:
+            cutoff_time = datetime.now() - timedelta(hours=24)
+            self.job_timestamps = [ts for ts in self.job_timestamps if ts > cutoff_time]
+            if len(self.job_timestamps) >= 100:
+                print(f"    [!] 24/7 MODE: Reached 100 jobs in 24 hours. Stopping...")
+                frontier.complete(job, "skipped")
+                return False
+
+        stealth_random_pause()
+        job_url = self.open_job_url(job["url"])
+        if not job_url:
+            self.status.incr("failed")
+            frontier.complete(job, "failed")
+            return True
+
+        submits_before = self.successful_submits
+        outcome = "skipped"
+        keep_going = True
+        try:
+            speed_sleep(2, "scan")
+            if self.apply(title, company, job_url) is False:  # 24/7 limit reached during apply
+                keep_going = False
+        except Exception as e:
+            print(f"    [!] Error during apply: {e}")
+            self.status.incr("failed")
+            self.status.error(f"Error during apply: {e}")
+            outcome = "failed"
+        if self.successful_submits > submits_before:
+            outcome = "applied"
+        frontier.complete(job, outcome)
+        self.checkpoint.job_done(job["job_id"], self.successful_submits, self.job_timestamps)
+
+        self.close_job_tabs()
+
+        job_cooldown()
+        return keep_going
+
+    def run_frontier(self, job_titles, locations, run_start_time):
+        """
+        Multi-bot mode: searches are discovered once for the whole fleet and jobs are leased from the
+        shared frontier, so instances with overlapping titles/cities don't scrape or apply twice.
+        """
+        instance_name = SESSION.name or SESSION.CONFIG.get("FULL_NAME", "Main")
+        frontier = JobFrontier(instance_name)
+        searches = [(t, loc) for t in job_titles for loc in locations]
+        print(f"[Frontier] {instance_name}: {len(searches)} searches | queue: {frontier.stats()}")
+
+        try:
+            while self.successful_submits < SESSION.MAX_JOBS:
+                status = check_control()
+                if status == "stop":
+                    print("[!] Stop signal received. Shutting down...")
+                    break
+                if status == "pause":
+                    print("[*] Bot paused. Waiting to resume...")
+                    self.status.set_phase("paused")
+                    if not wait_while_paused():
+                        break
+                    print("[*] Bot resumed.")
+
+                # 1. Work already in the queue (ours or discovered by other instances)
+                leased = frontier.lease(self._frontier_accept, limit=1)
+                if leased:
+                    if not self._apply_frontier_job(frontier, leased[0]):
+                        break
+                    continue
+
+                # 2. Queue is dry for us - discover the next unclaimed search
+                claim = frontier.claim_search(searches)
+                if claim:
+                    self._discover_jobs(frontier, *claim)
+                    continue
+
+                # 3. Nothing to claim: wait if other instances are still discovering our searches
+                if frontier.searches_in_progress(searches):
+                    self.status.set_phase("waiting")
+                    print("[Frontier] Waiting for other instances to finish discovering...")
+                    time.sleep(15)
+                    continue
+                break
+        finally:
+            print(f"[Frontier] Queue: {frontier.stats()}")
+            frontier.close()
+
+        print(f"\n[*] DONE — Successfully submitted {self.successful_submits} REAL applications.")
+        self.send_summary_and_exit(run_start_time)
+
     # ---------- RECOMMENDED JOBS MODE ----------
     def run_recommended_mode(self):
         """Run in Recommended Jobs mode - searches all job titles across ALL of Australia (no location filter)"""
@@ -2609,10 +2759,10 @@ Reply with ONLY the exact option text to select:"""
         print("="*50)
         print("Applying to jobs across ALL of AUSTRALIA")
         print("Using your job titles, ignoring location filter")
-        print(f"Target: {MAX_JOBS} applications")
+        print(f"Target: {SESSION.MAX_JOBS} applications")
         print("="*50 + "\n")
 
-        job_titles = CONFIG.get("JOB_TITLES", [])
+        job_titles = SESSION.CONFIG.get("JOB_TITLES", [])
         
         if not job_titles:
             print("[!] No job titles configured. Please add job titles in the config.")
@@ -2625,17 +2775,18 @@ Reply with ONLY the exact option text to select:"""
                 self.send_summary_and_exit(run_start_time)
                 return
             
-            if self.successful_submits >= MAX_JOBS:
-                print(f"\n[✓] Reached {MAX_JOBS} applications! Stopping.")
+            if self.successful_submits >= SESSION.MAX_JOBS:
+                print(f"\n[✓] Reached {SESSION.MAX_JOBS} applications! Stopping.")
                 break
             
             print(f"\n==============================")
             print(f"🎯 RECOMMENDED: {search_title} ({title_index + 1}/{len(job_titles)})")
-            print(f"    Progress: {self.successful_submits}/{MAX_JOBS} applications")
+            print(f"    Progress: {self.successful_submits}/{SESSION.MAX_JOBS} applications")
             print(f"==============================\n")
 
             # Search URL with NO location filter - searches all of Australia
             search_url = f"https://www.seek.com.au/jobs?keywords={search_title.replace(' ', '%20')}&sortmode=ListedDate"
+            self.status.set_phase("searching", title=search_title, location="All Australia", page=1)
             print(f"[*] Opening search for: {search_title}")
             print(f"    URL: {search_url}")
 
@@ -2645,7 +2796,7 @@ Reply with ONLY the exact option text to select:"""
 
             page = 1
 
-            while self.successful_submits < MAX_JOBS:
+            while self.successful_submits < SESSION.MAX_JOBS:
                 # Check for stop signal
                 if check_control() == "stop":
                     print("[!] Stop signal received. Shutting down...")
@@ -2653,6 +2804,7 @@ Reply with ONLY the exact option text to select:"""
                     return
                 
                 print(f"\n===== PAGE {page} =====")
+                self.status.update(page=page)
                 cards = self.get_job_cards()
 
                 if not cards:
@@ -2668,11 +2820,13 @@ Reply with ONLY the exact option text to select:"""
                         return
                     elif status == "pause":
                         print("[*] Bot paused. Waiting to resume...")
+                        self.status.set_phase("paused")
                         if not wait_while_paused():
                             # Stop signal received while paused
                             self.send_summary_and_exit(run_start_time)
                             return
                         print("[*] Bot resumed.")
+                    self.status.set_phase("scanning")
 
                     try:
                         title = card.find_element(By.CSS_SELECTOR, "[data-automation='jobTitle']").text
@@ -2680,16 +2834,19 @@ Reply with ONLY the exact option text to select:"""
                         title = "Unknown"
 
                     # In recommended mode, we still apply title matching
-                    if not title_matches(title):
+                    verdict, reason = SESSION.MATCHER.check_title(title)
+                    if verdict == "mismatch":
                         print(f"    [-] SKIPPED (title mismatch): {title}")
+                        self.status.incr("skipped")
                         continue
 
                     # Check blocklist
-                    if is_title_blocked(title):
-                        print(f"    [🚫] BLOCKED (title): {title}")
+                    if verdict == "blocked":
+                        print(f"    [🚫] BLOCKED (title '{reason}'): {title}")
+                        self.status.incr("skipped")
                         continue
 
-                    if self.successful_submits >= MAX_JOBS:
+                    if self.successful_submits >= SESSION.MAX_JOBS:
                         break
 
                     try:
@@ -2699,23 +2856,25 @@ Reply with ONLY the exact option text to select:"""
 
                     if is_company_blocked(company):
                         print(f"    [🚫] BLOCKED (company): {company}")
+                        self.status.incr("skipped")
                         continue
 
                     print(f"\n[*] 🎯 Job {idx + 1}: {title} | {company}")
+                    self.status.incr("scanned", event=f"{title} | {company}")
 
                     # Stealth: Random pause before opening job
                     stealth_random_pause()
 
                     job_url = self.open_job(card)
                     if not job_url:
+                        self.status.incr("failed")
                         continue
 
                     # Cross-instance duplicate check
                     if SHARED_JOBS_AVAILABLE and is_job_applied(job_url):
                         print(f"    [!] SKIP: Already applied by another bot instance")
-                        if len(self.driver.window_handles) > 1:
-                            self.driver.close()
-                            self.driver.switch_to.window(self.driver.window_handles[0])
+                        self.status.incr("skipped")
+                        self.close_job_tabs()
                         continue
 
                     # Check 24/7 mode limit before applying
@@ -2737,10 +2896,10 @@ Reply with ONLY the exact option text to select:"""
                             return
                     except Exception as e:
                         print(f"    [!] Error during apply: {e}")
+                        self.status.incr("failed")
+                        self.status.error(f"Error during apply: {e}")
 
-                    if len(self.driver.window_handles) > 1:
-                        self.driver.close()
-                        self.driver.switch_to.window(self.driver.window_handles[0])
+                    if self.close_job_tabs():
 
                         # Stealth: Scroll around on main page between jobs
                         stealth_random_scroll(self.driver)
@@ -2748,7 +2907,7 @@ Reply with ONLY the exact option text to select:"""
                     # Apply cooldown between jobs
                     job_cooldown()
 
-                if self.successful_submits >= MAX_JOBS:
+                if self.successful_submits >= SESSION.MAX_JOBS:
                     break
 
                 moved = self.go_to_next_page()
@@ -2765,6 +2924,7 @@ Reply with ONLY the exact option text to select:"""
     # ---------- MAIN LOOP ----------
     def run(self):
         # Reload config to get latest settings
+        init()
         reload_config()
         
         # Reset control flags for fresh start
@@ -2819,21 +2979,43 @@ Reply with ONLY the exact option text to select:"""
                         print(f"[Gmail] Cleanup error: {e}")
                         time.sleep(60)  # Wait 1 minute before retry
             
-            self.gmail_thread = threading.Thread(target=gmail_cleanup_loop, daemon=True)
-            self.gmail_thread.start()
+            self.gmail_thread = start_thread(gmail_cleanup_loop)
             print("[Gmail] Gmail cleanup started - will open visible tab and run continuously")
         
+        if PSUTIL_AVAILABLE and self.metrics.enabled:
+            start_thread(self._sample_browser_memory)
+        
+        self.status.set_phase("logging_in")
         self.ensure_logged_in()
         run_start_time = time.time()  # Track start time for WhatsApp summary
         self.run_start_time = run_start_time  # For Slack notifications
 
-        # Check if running in Recommended Jobs mode
+        job_titles = SESSION.CONFIG.get("JOB_TITLES", [])
+        gpt_tight_mode = SESSION.CONFIG.get("GPT_JOB_CHECK", False)
+
+        # Pick up where the last run stopped (crash, restart or stop) if its checkpoint still applies
         if is_recommended_mode():
+            run_mode = "recommended"
+        elif SESSION.name and SESSION.CONFIG.get("JOB_FRONTIER", False):
+            run_mode = "frontier"
+        else:
+            run_mode = "tight" if gpt_tight_mode else "loose"
+        resume = self.checkpoint.start({
+            "mode": run_mode,
+            "titles": job_titles,
+            "location": SESSION.CONFIG.get("LOCATION", "Brisbane, Australia"),
+        })
+        self.successful_submits = self.checkpoint.successful_submits
+        self.job_timestamps = self.checkpoint.job_timestamps
+        if resume:
+            print(f"[Checkpoint] Resuming: {resume['title']} in {resume['location']} (page {resume['page']}) | "
+                  f"{self.successful_submits} applications so far")
+            self.status.update(applied=self.successful_submits)
+
+        # Check if running in Recommended Jobs mode
+        if run_mode == "recommended":
             self.run_recommended_mode()
             return
-
-        job_titles = CONFIG.get("JOB_TITLES", [])
-        gpt_tight_mode = CONFIG.get("GPT_JOB_CHECK", False)
         
         # Define city rotation order: Brisbane → Gold Coast → Sydney → Melbourne
         city_rotation = [
@@ -2856,7 +3038,21 @@ Reply with ONLY the exact option text to select:"""
             "Darwin, Australia",
         ]
 
+        # Multi-bot instances share one job frontier instead of each scraping the same searches
+        if SESSION.name and SESSION.CONFIG.get("JOB_FRONTIER", False):
+            if gpt_tight_mode:
+                primary_location = SESSION.CONFIG.get("LOCATION", "Brisbane, Australia")
+                locations = [primary_location] + [loc for loc in alternative_locations if loc != primary_location]
+            else:
+                locations = city_rotation
+            self.run_frontier(job_titles, locations, run_start_time)
+            return
+
         for title_index, search_title in enumerate(job_titles):
+            # Titles the previous run already finished
+            if resume and title_index < resume["title_index"]:
+                continue
+
             # Check for stop signal between searches
             if check_control() == "stop":
                 print("[!] Stop signal received. Shutting down...")
@@ -2864,25 +3060,26 @@ Reply with ONLY the exact option text to select:"""
                 return
             
             # Skip to next title if we already hit MAX_JOBS
-            if self.successful_submits >= MAX_JOBS:
-                print(f"\n[✓] Reached {MAX_JOBS} applications! Stopping.")
+            if self.successful_submits >= SESSION.MAX_JOBS:
+                print(f"\n[✓] Reached {SESSION.MAX_JOBS} applications! Stopping.")
                 break
             
             print(f"\n==============================")
             print(f"🔎 SEARCHING: {search_title} ({title_index + 1}/{len(job_titles)})")
-            print(f"    Progress: {self.successful_submits}/{MAX_JOBS} applications")
+            print(f"    Progress: {self.successful_submits}/{SESSION.MAX_JOBS} applications")
             print(f"==============================\n")
 
             # Determine location strategy based on GPT mode
             if gpt_tight_mode:
                 # TIGHT mode: Use primary location, expand to alternatives if < 100 jobs
-                primary_location = CONFIG.get("LOCATION", "Brisbane, Australia")
+                primary_location = SESSION.CONFIG.get("LOCATION", "Brisbane, Australia")
                 locations_to_try = [primary_location]
                 
                 # Remove primary from alternatives if in list
                 alternative_locations_clean = [loc for loc in alternative_locations if loc != primary_location]
                 
                 search_url = build_search_url(search_title, primary_location)
+                self.status.set_phase("searching", title=search_title, location=primary_location, page=1)
                 print(f"[*] Opening search for: {search_title} in {primary_location}")
                 print(f"    URL: {search_url}")
                 
@@ -2908,18 +3105,38 @@ Reply with ONLY the exact option text to select:"""
                 
                 print(f"[*] ⚡ LOOSE MODE: Will search cities in order: {', '.join(locations_to_try)}")
                 print(f"[*] Starting with: {primary_location}")
+
+            # Resuming this title: skip the cities the previous run finished, start on its page
+            resume_loc, resume_page = None, 1
+            if resume and title_index == resume["title_index"]:
+                if resume["location"] in locations_to_try:
+                    resume_loc, resume_page = locations_to_try.index(resume["location"]), resume["page"]
+                else:
+                    print(f"[Checkpoint] {resume['location']} is no longer searched for this title, starting over")
+                resume = None
             
             # Process jobs for each location
             for loc_index, location in enumerate(locations_to_try):
-                if self.successful_submits >= MAX_JOBS:
+                if self.successful_submits >= SESSION.MAX_JOBS:
                     break
+                if resume_loc is not None and loc_index < resume_loc:
+                    continue
+                start_page = resume_page if loc_index == resume_loc else 1
                 
+                # Resuming: open the saved page directly
                 # For TIGHT mode, skip first location (already loaded above)
                 # For LOOSE mode, load each location
-                if gpt_tight_mode and loc_index == 0:
+                if start_page > 1:
+                    print(f"\n[*] 🌍 Resuming {location} at page {start_page}")
+                    self.status.set_phase("searching", title=search_title, location=location, page=start_page)
+                    self.driver.get(build_search_url(search_title, location, start_page))
+                    speed_sleep(3, "scan")
+                    throttle()
+                elif gpt_tight_mode and loc_index == 0:
                     pass  # Already loaded above for TIGHT mode
                 else:
                     print(f"\n[*] 🌍 Searching in: {location}")
+                    self.status.set_phase("searching", title=search_title, location=location, page=1)
                     search_url = build_search_url(search_title, location)
                     print(f"    URL: {search_url}")
                     
@@ -2936,10 +3153,10 @@ Reply with ONLY the exact option text to select:"""
                         continue
                 
                 # Process pages for this location
-                page = 1
+                page = start_page
                 location_done = False
 
-                while self.successful_submits < MAX_JOBS and not location_done:
+                while self.successful_submits < SESSION.MAX_JOBS and not location_done:
                     # Check for stop signal
                     if check_control() == "stop":
                         print("[!] Stop signal received. Shutting down...")
@@ -2947,6 +3164,9 @@ Reply with ONLY the exact option text to select:"""
                         return
                     
                     print(f"\n===== PAGE {page} =====")
+                    self.status.update(page=page)
+                    self.checkpoint.at_page(title_index, search_title, location, page,
+                                            self.successful_submits, self.job_timestamps)
                     cards = self.get_job_cards()
 
                     if not cards:
@@ -2963,27 +3183,32 @@ Reply with ONLY the exact option text to select:"""
                             return
                         elif status == "pause":
                             print("[*] Bot paused. Waiting to resume...")
+                            self.status.set_phase("paused")
                             if not wait_while_paused():
                                 # Stop signal received while paused
                                 self.send_summary_and_exit(run_start_time)
                                 return
                             print("[*] Bot resumed.")
+                        self.status.set_phase("scanning")
                         
                         try:
                             title = card.find_element(By.CSS_SELECTOR, "[data-automation='jobTitle']").text
                         except:
                             title = "Unknown"
 
-                        if not title_matches(title):
+                        verdict, reason = SESSION.MATCHER.check_title(title)
+                        if verdict == "mismatch":
                             print(f"    [-] SKIPPED (title mismatch): {title}")
+                            self.status.incr("skipped")
                             continue
                         
                         # Check if title is blocked
-                        if is_title_blocked(title):
-                            print(f"    [🚫] BLOCKED (title): {title}")
+                        if verdict == "blocked":
+                            print(f"    [🚫] BLOCKED (title '{reason}'): {title}")
+                            self.status.incr("skipped")
                             continue
 
-                        if self.successful_submits >= MAX_JOBS:
+                        if self.successful_submits >= SESSION.MAX_JOBS:
                             break
 
                         try:
@@ -2994,23 +3219,33 @@ Reply with ONLY the exact option text to select:"""
                         # Check if company is blocked
                         if is_company_blocked(company):
                             print(f"    [🚫] BLOCKED (company): {company}")
+                            self.status.incr("skipped")
+                            continue
+
+                        # Handled before a crash/restart
+                        job_id = self.card_job_id(card)
+                        if self.checkpoint.is_processed(job_id):
+                            print(f"    [=] SKIP: Already handled in an earlier run: {title}")
                             continue
 
                         print(f"\n[*] Job {idx + 1}: {title} | {company}")
+                        self.status.incr("scanned", event=f"{title} | {company}")
                         
                         # Stealth: Random pause before opening job
                         stealth_random_pause()
 
                         job_url = self.open_job(card)
                         if not job_url:
+                            self.status.incr("failed")
+                            self.checkpoint.job_done(job_id)
                             continue
 
                         # Cross-instance duplicate check
                         if SHARED_JOBS_AVAILABLE and is_job_applied(job_url):
                             print(f"    [!] SKIP: Already applied by another bot instance")
-                            if len(self.driver.window_handles) > 1:
-                                self.driver.close()
-                                self.driver.switch_to.window(self.driver.window_handles[0])
+                            self.status.incr("skipped")
+                            self.checkpoint.job_done(job_id)
+                            self.close_job_tabs()
                             continue
 
                         speed_sleep(2, "scan")
@@ -3032,10 +3267,11 @@ Reply with ONLY the exact option text to select:"""
                                 return
                         except Exception as e:
                             print(f"    [!] Error during apply: {e}")
+                            self.status.incr("failed")
+                            self.status.error(f"Error during apply: {e}")
+                        self.checkpoint.job_done(job_id, self.successful_submits, self.job_timestamps)
 
-                        if len(self.driver.window_handles) > 1:
-                            self.driver.close()
-                            self.driver.switch_to.window(self.driver.window_handles[0])
+                        if self.close_job_tabs():
                             
                             # Stealth: Scroll around on main page between jobs
                             stealth_random_scroll(self.driver)
@@ -3043,7 +3279,7 @@ Reply with ONLY the exact option text to select:"""
                         # Apply cooldown between jobs
                         job_cooldown()
 
-                    if self.successful_submits >= MAX_JOBS:
+                    if self.successful_submits >= SESSION.MAX_JOBS:
                         break
 
                     moved = self.go_to_next_page()
@@ -3055,7 +3291,7 @@ Reply with ONLY the exact option text to select:"""
                     page += 1
                 
                 # If we've hit MAX_JOBS, break out of location loop too
-                if self.successful_submits >= MAX_JOBS:
+                if self.successful_submits >= SESSION.MAX_JOBS:
                     break
                 
                 # In LOOSE mode, log when moving to next city
@@ -3064,14 +3300,21 @@ Reply with ONLY the exact option text to select:"""
                         next_city = locations_to_try[loc_index + 1]
                         print(f"\n[*] 🔄 Moving to next city: {next_city}")
 
+        self.run_completed = True
         print(f"\n[*] DONE — Successfully submitted {self.successful_submits} REAL applications.")
         
         # Send WhatsApp summary
         self.send_summary_and_exit(run_start_time)
 
 
-def main():
+def run_session(session=None):
+    """Run one bot to completion in the calling thread, under `session` (default: this process's session)"""
+    if session is not None:
+        activate(session)
+    bot = None
     try:
+        init()
+
         # Reload config to get latest settings
         reload_config()
         
@@ -3087,9 +3330,16 @@ def main():
     except Exception as e:
         import traceback
         print(f"[ERROR] Bot stopped: {e}")
+        if bot is not None:
+            bot.status.error(e)
+            bot.status.finish("crashed")
         traceback.print_exc()
         raise
 
 
+def main():
+    run_session()
+
+
 if __name__ == "__main__":
     main()
@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('seekmate_logo.png', '.')],
-    hiddenimports=[],
+    hiddenimports=['undetected_chromedriver', 'llm_gateway', 'asset_proxy', 'gmail_cleanup', 'gmail_imap', 'gmail_rules', 'multi_bot_launcher', 'anthropic', 'plyer'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,178 @@
+"""
+Time-series Metrics Store for SeekMateAI
+Every bot records its counters (applied / scanned / skipped / failed) and gauges (LLM latency,
+browser memory) into small fixed-size files, one per metric per instance. Each file holds three
+ring buffers - per minute (1 day), per hour (14 days) and per day (1 year) - so a sample updates
+one slot in each ring and the files never grow. The dashboard reads them to chart throughput over
+days without re-parsing logs, and the history survives restarts of both bots and dashboard.
+"""
+import os
+import mmap
+import time
+import struct
+import threading
+
+from bot_status import get_data_dir, instance_status_file
+
+# (name, seconds per slot, slots)
+RESOLUTIONS = (
+    ("minute", 60, 24 * 60),
+    ("hour", 3600, 14 * 24),
+    ("day", 86400, 366),
+)
+
+COUNTERS = ("applied", "scanned", "skipped", "failed")
+GAUGES = ("llm_latency_ms", "browser_memory_mb")
+
+_MAGIC = b"SMTS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")              # magic, version, ring count
+_SLOT = struct.Struct("<qddI4x")               # bucket number, sum, max, sample count
+_RING_OFFSETS = []
+_offset = _HEADER.size
+for _name, _seconds, _slots in RESOLUTIONS:
+    _RING_OFFSETS.append(_offset)
+    _offset += _slots * _SLOT.size
+FILE_SIZE = _offset
+
+
+def default_metrics_dir(instance=None, status_file=None):
+    """metrics/<instance> next to the instance status file, else the data dir"""
+    instance = instance or os.getenv("BOT_INSTANCE_NAME")
+    status_file = status_file or os.getenv("BOT_STATUS_FILE")
+    if instance and status_file:
+        return os.path.join(os.path.dirname(os.path.abspath(status_file)), "metrics", instance)
+    return os.path.join(get_data_dir(), "metrics", instance or "Main")
+
+
+def instance_metrics_dir(name, info=None, script_dir=None):
+    """Metrics directory for a multi-bot instance entry from bot_instances.json"""
+    return default_metrics_dir(name, instance_status_file(name, info, script_dir))
+
+
+def _resolution(name):
+    for index, (res_name, seconds, slots) in enumerate(RESOLUTIONS):
+        if res_name == name:
+            return index, seconds, slots
+    raise ValueError(f"Unknown resolution: {name}")
+
+
+class MetricSeries:
+    """One metric file. Writers map it; readers just read the bytes of the ring they need."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._map = None
+
+    def _open_for_write(self):
+        if self._map is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            header = _HEADER.pack(_MAGIC, _VERSION, len(RESOLUTIONS))
+            with open(self.path, "r+b" if os.path.exists(self.path) else "w+b") as f:
+                if os.fstat(f.fileno()).st_size != FILE_SIZE or f.read(_HEADER.size) != header:
+                    # New file, or one from another layout - start it empty
+                    f.truncate(0)
+                    f.truncate(FILE_SIZE)
+                    f.seek(0)
+                    f.write(header)
+                    f.flush()
+                self._map = mmap.mmap(f.fileno(), FILE_SIZE)
+        return self._map
+
+    def record(self, value, now=None, count=1):
+        """Add `value` to the current bucket of every ring (count = samples it stands for)"""
+        now = now or time.time()
+        with self._lock:
+            m = self._open_for_write()
+            for (_, seconds, slots), base in zip(RESOLUTIONS, _RING_OFFSETS):
+                bucket = int(now // seconds)
+                pos = base + (bucket % slots) * _SLOT.size
+                old_bucket, total, peak, n = _SLOT.unpack_from(m, pos)
+                if old_bucket != bucket:
+                    total, peak, n = 0.0, value, 0
+                _SLOT.pack_into(m, pos, bucket, total + value, max(peak, value), n + count)
+
+    def read(self, resolution="hour", since=None, now=None):
+        """[(bucket start epoch, sum, max, count)] oldest first, empty buckets left out"""
+        index, seconds, slots = _resolution(resolution)
+        now = now or time.time()
+        current = int(now // seconds)
+        oldest = current - slots + 1
+        if since is not None:
+            oldest = max(oldest, int(since // seconds))
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != _MAGIC:
+                    return []
+                f.seek(_RING_OFFSETS[index])
+                data = f.read(slots * _SLOT.size)
+        except OSError:
+            return []
+        rows = []
+        for bucket, total, peak, n in _SLOT.iter_unpack(data[:len(data) - len(data) % _SLOT.size]):
+            if n and oldest <= bucket <= current:
+                rows.append((bucket * seconds, total, peak, n))
+        rows.sort()
+        return rows
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+
+class MetricsStore:
+    """All metric series of one instance"""
+
+    def __init__(self, directory=None, enabled=True):
+        self.directory = directory or default_metrics_dir()
+        self.enabled = enabled
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def series(self, metric):
+        with self._lock:
+            if metric not in self._series:
+                self._series[metric] = MetricSeries(os.path.join(self.directory, f"{metric}.ts"))
+            return self._series[metric]
+
+    def add(self, counter, amount=1):
+        """Count events (applied, scanned, ...)"""
+        self._record(counter, amount, amount)
+
+    def observe(self, gauge, value):
+        """Record one measurement (latency, memory); read back as average and max per bucket"""
+        self._record(gauge, value, 1)
+
+    def _record(self, metric, value, count):
+        if not self.enabled:
+            return
+        try:
+            self.series(metric).record(float(value), count=count)
+        except Exception as e:
+            # Never let metrics break the bot
+            print(f"[Metrics] Could not record {metric}: {e}")
+
+    def read(self, metric, resolution="hour", since=None):
+        return self.series(metric).read(resolution, since)
+
+    def close(self):
+        for series in list(self._series.values()):
+            series.close()
+
+
+def combine(series_list, how="sum"):
+    """Merge several read() results bucket by bucket: "sum" adds totals, "avg" averages gauges"""
+    merged = {}
+    for rows in series_list:
+        for start, total, peak, n in rows:
+            t, p, c = merged.get(start, (0.0, None, 0))
+            merged[start] = (t + total, peak if p is None else max(p, peak), c + n)
+    out = []
+    for start in sorted(merged):
+        total, peak, n = merged[start]
+        out.append((start, total / n if how == "avg" and n else total, peak, n))
+    return out
@@ -10,10 +10,23 @@ import sys
 import json
 import os
 import re
+import copy
+import queue
 import threading
 import time
+from collections import namedtuple
 from datetime import datetime, timedelta
 
+from bot_status import read_status, instance_status_file, is_stale, lifetime_count
+from bot_control import read_control_file, control_state, write_control_file
+from log_tail import LogTail
+from metrics_store import instance_metrics_dir, MetricSeries, combine
+from lazy_imports import LazyImport, module_available
+
+# First used by the collector thread, so bot_supervisor's HTTP stack stays off the start-up path
+supervisor_state = LazyImport("bot_supervisor", "supervisor_state")
+save_instances = LazyImport("multi_bot_launcher", "save_instances")
+
 # Run from script directory so launcher and config paths work
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if os.getcwd() != SCRIPT_DIR:
@@ -21,6 +34,31 @@ if os.getcwd() != SCRIPT_DIR:
 
 INSTANCES_FILE = os.path.join(SCRIPT_DIR, "bot_instances.json")
 
+REFRESH_INTERVAL = 3      # Seconds between background collections
+SNAPSHOT_POLL_MS = 200    # How often the Tk loop picks up a finished snapshot
+
+# Immutable results of one background collection, applied to the UI as a whole
+InstanceRow = namedtuple("InstanceRow", "name values tag")
+DashboardSnapshot = namedtuple("DashboardSnapshot", "rows active scanned applied rate jph chart")
+ChartData = namedtuple("ChartData", "label seconds points total")   # points: [(bucket start, applications)]
+
+# Chart range -> (store resolution, seconds covered), read from the per-instance metrics files
+CHART_RANGES = {
+    "2h": ("minute", 2 * 3600),
+    "24h": ("hour", 24 * 3600),
+    "7d": ("hour", 7 * 86400),
+    "30d": ("day", 30 * 86400),
+}
+_RESOLUTION_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 # ── Color Palette ──────────────────────────────────────────────
 C = {
     "bg":           "#0f0f1a",
@@ -45,17 +83,22 @@ C = {
 }
 
 # ── Toast Notifications ────────────────────────────────────────
-_toast_available = False
+# win10toast (and the pywin32 modules behind it) is only loaded when the first toast is shown
+_toast_available = module_available("win10toast")
 _toaster = None
-try:
-    from win10toast import ToastNotifier
-    _toaster = ToastNotifier()
-    _toast_available = True
-except Exception:
-    pass
+
+def _get_toaster():
+    global _toaster, _toast_available
+    if _toaster is None and _toast_available:
+        try:
+            from win10toast import ToastNotifier
+            _toaster = ToastNotifier()
+        except Exception:
+            _toast_available = False
+    return _toaster
 
 def notify(title, msg):
-    if _toast_available and _toaster:
+    if _toast_available and _get_toaster():
         try:
             threading.Thread(
                 target=_toaster.show_toast,
@@ -110,16 +153,26 @@ class MultiBotGUI:
         self.selected_instance_for_log = None
         self.log_tail_lines = 150
         self.log_filter = "All"  # All | Errors | Applications | Skipped
+        self._log_tail = None       # LogTail of the selected instance's log
+        self._log_view = None       # (path, filter) currently drawn in the log widget
+        self._log_rendered = 0      # Log lines currently in the widget
         self.prev_notification_counts = {}  # for milestone notifications
-        self.chart_data = {}  # name -> list of (timestamp, cumulative_jobs)
+        self.chart_range = "24h"       # Key of CHART_RANGES
+        self.chart_instance = None     # Instance shown in the chart (None = all instances)
+
+        # Caches shared with the collector thread, keyed by file and gated on its stat signature
+        self._cache_lock = threading.Lock()
+        self._config_cache = {}     # path -> (signature, config)
+        self._log_count_cache = {}  # path -> (signature, counts)
+
+        # Treeview rows currently shown: name -> (item id, values, tag)
+        self._tree_rows = {}
 
         self.load_instances()
-        self._init_session_baselines()
         self._build_ui()
-        self.refresh_list()
 
         self.auto_refresh_running = True
-        self.auto_refresh()
+        self._start_collector()
         self.log_preview_running = True
         self._schedule_log_preview()
 
@@ -136,9 +189,9 @@ class MultiBotGUI:
         if not getattr(self, "instances", None):
             return
         for name, info in self.instances.items():
-            log_path = self._log_path(name)
-            self.session_baseline_jobs[name] = int(self._count_jobs_applied(log_path) or 0)
-            self.session_baseline_scanned[name] = int(self._count_jobs_scanned(log_path) or 0)
+            counts = self._instance_counts(name)
+            self.session_baseline_jobs[name] = counts["applied"]
+            self.session_baseline_scanned[name] = counts["scanned"]
 
     def _session_counts(self, name, abs_jobs, abs_scanned):
         if name not in self.session_baseline_jobs:
@@ -180,21 +233,62 @@ class MultiBotGUI:
         p = self.instances[name].get("control_file", os.path.join(SCRIPT_DIR, f"control_{name}.json"))
         return p if os.path.isabs(p) else os.path.join(SCRIPT_DIR, p)
 
+    def _status_path(self, name):
+        return instance_status_file(name, self.instances.get(name), SCRIPT_DIR)
+
+    def _instance_counts(self, name):
+        """Lifetime counters from the bot's status snapshot; log parsing only for bots without one"""
+        snapshot = read_status(self._status_path(name))
+        if snapshot:
+            counts = {c: lifetime_count(snapshot, c) for c in ("applied", "scanned", "skipped", "failed")}
+        else:
+            counts = self._log_counts(self._log_path(name))
+        counts["snapshot"] = snapshot
+        return counts
+
+    def _log_counts(self, log_file):
+        """Counters parsed from the log; the log is only re-read when it grew or changed"""
+        signature = _file_signature(log_file)
+        with self._cache_lock:
+            cached = self._log_count_cache.get(log_file)
+        if cached and cached[0] == signature:
+            return dict(cached[1])
+        counts = {
+            "applied": int(self._count_jobs_applied(log_file) or 0),
+            "scanned": int(self._count_jobs_scanned(log_file) or 0),
+            "skipped": self._count_skipped(log_file),
+            "failed": self._count_failed(log_file),
+        }
+        with self._cache_lock:
+            self._log_count_cache[log_file] = (signature, counts)
+        return dict(counts)
+
     def _load_config(self, name):
+        """Instance config, re-read only when the file changed (callers get their own copy)"""
         p = self._config_path(name)
-        if p and os.path.exists(p):
-            try:
-                with open(p, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {}
+        signature = _file_signature(p) if p else None
+        if signature is None:
+            return {}
+        with self._cache_lock:
+            cached = self._config_cache.get(p)
+        if cached and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
+        except Exception:
+            return {}
+        with self._cache_lock:
+            self._config_cache[p] = (signature, cfg)
+        return copy.deepcopy(cfg)
 
     def _save_config(self, name, cfg):
         p = self._config_path(name)
         if p:
             with open(p, "w", encoding="utf-8") as f:
                 json.dump(cfg, f, indent=4)
+            with self._cache_lock:
+                self._config_cache.pop(p, None)
 
     def check_process_alive(self, pid):
         if not pid:
@@ -461,8 +555,20 @@ class MultiBotGUI:
                               highlightthickness=1, padx=16, pady=12)
         chart_card.pack(fill=tk.X, padx=12, pady=6)
 
-        tk.Label(chart_card, text="Applications Over Time", font=("Segoe UI", 12, "bold"),
-                 fg=C["text"], bg=C["card"]).pack(anchor="w", pady=(0, 8))
+        chart_header = tk.Frame(chart_card, bg=C["card"])
+        chart_header.pack(fill=tk.X, pady=(0, 8))
+        self.chart_title = tk.Label(chart_header, text="Applications Over Time", font=("Segoe UI", 12, "bold"),
+                                    fg=C["text"], bg=C["card"])
+        self.chart_title.pack(side=tk.LEFT)
+
+        self.chart_range_buttons = {}
+        for label in reversed(list(CHART_RANGES)):
+            b = tk.Button(chart_header, text=label, font=("Segoe UI", 9, "bold"), fg="white",
+                          bg=C["accent"] if label == self.chart_range else C["surface2"],
+                          activebackground=C["border"], relief=tk.FLAT, cursor="hand2", padx=8, pady=2,
+                          command=lambda r=label: self._set_chart_range(r))
+            b.pack(side=tk.RIGHT, padx=2)
+            self.chart_range_buttons[label] = b
 
         self.chart_canvas = tk.Canvas(chart_card, bg=C["surface"], height=120,
                                       highlightthickness=0)
@@ -761,6 +867,8 @@ class MultiBotGUI:
             self.selected_instance_for_log = item["values"][0] if item["values"] else None
         else:
             self.selected_instance_for_log = None
+        self.chart_instance = self.selected_instance_for_log
+        self.refresh_list()
         self.log_instance_label.config(
             text=f"Log: {self.selected_instance_for_log}" if self.selected_instance_for_log
             else "Select an instance",
@@ -794,53 +902,58 @@ class MultiBotGUI:
             pass
 
     # ── Log Preview ───────────────────────────────────────────
+    def _show_log_message(self, text):
+        self._log_view = None
+        self._log_rendered = 0
+        self.log_text.delete("1.0", tk.END)
+        self.log_text.insert(tk.END, text)
+
     def _update_log_preview(self):
+        """Append only what the log gained since the last poll; redraw from the index on switches"""
         if self.active_tab != "logs":
             return
         if not self.selected_instance_for_log:
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.insert(tk.END, "Select an instance to view logs.")
+            self._show_log_message("Select an instance to view logs.")
             return
         path = self._log_path(self.selected_instance_for_log)
         if not path or not os.path.exists(path):
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.insert(tk.END, f"No log file yet for '{self.selected_instance_for_log}'.")
+            self._log_tail = None
+            self._show_log_message(f"No log file yet for '{self.selected_instance_for_log}'.")
             return
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-
-            # Apply filter
-            if self.log_filter == "Errors":
-                lines = [l for l in lines if any(k in l for k in
-                         ["[ERROR]", "Error:", "Traceback", "Exception", "Failed", "[!]"])]
-            elif self.log_filter == "Applications":
-                lines = [l for l in lines if any(k in l for k in
-                         ["SUBMITTED", "Successfully submitted", "Job ", "apply", "Applied"])]
-            elif self.log_filter == "Skipped":
-                lines = [l for l in lines if "SKIPPED" in l or "BLOCKED" in l or "blocked" in l]
-
-            tail = lines[-self.log_tail_lines:] if len(lines) > self.log_tail_lines else lines
-
-            self.log_text.delete("1.0", tk.END)
-            for line in tail:
-                start = self.log_text.index(tk.END)
-                self.log_text.insert(tk.END, line)
-                end = self.log_text.index(tk.END)
-                if "[ERROR]" in line or "Error:" in line or "Traceback" in line or "Exception" in line:
-                    self.log_text.tag_add("error", start, end)
-                elif "[!]" in line or "WARN" in line or "Failed" in line:
-                    self.log_text.tag_add("warn", start, end)
-                elif "SUBMITTED" in line or "Successfully submitted" in line:
-                    self.log_text.tag_add("success", start, end)
-                elif "SKIPPED" in line or "BLOCKED" in line:
-                    self.log_text.tag_add("skip", start, end)
-                elif re.search(r'\[\*\].*?Job \d+:', line):
-                    self.log_text.tag_add("job_header", start, end)
-            self.log_text.see(tk.END)
+            if self._log_tail is None or self._log_tail.path != path:
+                self._log_tail = LogTail(path)
+            reset, new_entries = self._log_tail.poll()
+
+            if reset or self._log_view != (path, self.log_filter):
+                # New instance, new filter or rotated log: redraw the tail from the index
+                self.log_text.delete("1.0", tk.END)
+                self._log_rendered = 0
+                self._log_view = (path, self.log_filter)
+                self._append_log_lines(self._log_tail.lines(self.log_filter, self.log_tail_lines))
+            else:
+                self._append_log_lines([(line, tag) for line, tag, filters in new_entries
+                                        if self.log_filter in filters])
         except Exception:
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.insert(tk.END, "Could not read log file.")
+            self._log_tail = None
+            self._show_log_message("Could not read log file.")
+
+    def _append_log_lines(self, entries):
+        """Insert entries in one Text call and keep the widget at log_tail_lines lines"""
+        if not entries:
+            return
+        entries = entries[-self.log_tail_lines:]
+        args = []
+        for line, tag in entries:
+            args.extend((line, (tag,) if tag else ()))
+        self.log_text.insert(tk.END, *args)
+        self._log_rendered += len(entries)
+
+        excess = self._log_rendered - self.log_tail_lines
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_rendered -= excess
+        self.log_text.see(tk.END)
 
     def _schedule_log_preview(self):
         if getattr(self, "log_preview_running", True):
@@ -908,8 +1021,11 @@ class MultiBotGUI:
         if not os.path.exists(log_file):
             return "—"
         try:
-            with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+            # Only the tail of the file is needed
+            with open(log_file, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 8192))
+                lines = f.read().decode("utf-8", errors="ignore").splitlines()
             for line in reversed(lines):
                 stripped = line.strip()
                 if stripped and not stripped.startswith("Traceback"):
@@ -974,24 +1090,46 @@ class MultiBotGUI:
             return False
 
     # ── Mini Chart ────────────────────────────────────────────
-    def _update_chart(self, total_jobs):
-        now = time.time()
-        if "global" not in self.chart_data:
-            self.chart_data["global"] = []
-        self.chart_data["global"].append((now, total_jobs))
-        # Keep last 60 data points
-        self.chart_data["global"] = self.chart_data["global"][-60:]
+    def _set_chart_range(self, label):
+        self.chart_range = label
+        for name, b in self.chart_range_buttons.items():
+            b.config(bg=C["accent"] if name == label else C["surface2"])
+        self.refresh_list()
+
+    def _collect_chart(self):
+        """Collector side: applications per bucket for the chosen range, from the metrics files"""
+        resolution, span = CHART_RANGES.get(self.chart_range, CHART_RANGES["24h"])
+        seconds = _RESOLUTION_SECONDS[resolution]
+        name = self.chart_instance if self.chart_instance in self.instances else None
+        names = [name] if name else list(self.instances)
 
-        data = self.chart_data["global"]
+        now = time.time()
+        since = now - span
+        rows = combine([
+            MetricSeries(os.path.join(instance_metrics_dir(n, self.instances.get(n), SCRIPT_DIR), "applied.ts"))
+            .read(resolution, since, now)
+            for n in names
+        ])
+        by_bucket = {start: total for start, total, _, _ in rows}
+
+        # Zero-fill so gaps show as gaps in the trend, not as a straight line
+        first = int(since // seconds) + 1
+        last = int(now // seconds)
+        points = [(b * seconds, by_bucket.get(b * seconds, 0.0)) for b in range(first, last + 1)]
+        label = f"Applications per {resolution} — {name or 'all instances'}"
+        return ChartData(label, seconds, points, int(sum(v for _, v in points)))
+
+    def _update_chart(self, chart):
+        self.chart_title.config(text=chart.label)
         self.chart_canvas.delete("all")
         w = self.chart_canvas.winfo_width()
         h = self.chart_canvas.winfo_height()
+        data = chart.points
         if w < 10 or h < 10 or len(data) < 2:
             return
 
-        vals = [d[1] for d in data]
+        vals = [v for _, v in data]
         max_val = max(vals) or 1
-        min_val = min(vals)
 
         # Draw grid lines
         for i in range(5):
@@ -1000,78 +1138,96 @@ class MultiBotGUI:
 
         # Draw line
         points = []
-        for i, (_, v) in enumerate(data):
-            x = (i / (len(data) - 1)) * w
-            y = h - ((v - min_val) / (max_val - min_val + 1)) * (h - 10) - 5
+        for i, v in enumerate(vals):
+            x = (i / (len(vals) - 1)) * w
+            y = h - (v / max_val) * (h - 16) - 4
             points.append((x, y))
 
-        if len(points) >= 2:
-            # Fill area under curve
-            fill_points = [(points[0][0], h)] + points + [(points[-1][0], h)]
-            flat = [coord for p in fill_points for coord in p]
-            self.chart_canvas.create_polygon(flat, fill="#1a2a4a", outline="")
+        # Fill area under curve
+        fill_points = [(points[0][0], h)] + points + [(points[-1][0], h)]
+        flat = [coord for p in fill_points for coord in p]
+        self.chart_canvas.create_polygon(flat, fill="#1a2a4a", outline="")
 
-            # Draw the line
-            line_flat = [coord for p in points for coord in p]
-            self.chart_canvas.create_line(line_flat, fill=C["accent"], width=2, smooth=True)
+        # Draw the line
+        line_flat = [coord for p in points for coord in p]
+        self.chart_canvas.create_line(line_flat, fill=C["accent"], width=2)
 
-            # Current value label
-            self.chart_canvas.create_text(w - 4, 8, text=str(total_jobs),
-                                           fill=C["accent"], font=("Segoe UI", 8, "bold"),
-                                           anchor="ne")
+        # Range total and peak bucket
+        self.chart_canvas.create_text(w - 4, 8, text=f"{chart.total} total · peak {int(max(vals))}",
+                                       fill=C["accent"], font=("Segoe UI", 8, "bold"), anchor="ne")
+        fmt = "%d %b" if chart.seconds >= 86400 else ("%a %H:%M" if len(data) * chart.seconds > 86400 else "%H:%M")
+        self.chart_canvas.create_text(4, h - 4, text=datetime.fromtimestamp(data[0][0]).strftime(fmt),
+                                       fill=C["text_dim"], font=("Segoe UI", 7), anchor="sw")
 
     # ── Refresh List ──────────────────────────────────────────
     def refresh_list(self):
-        self.load_instances()
+        """Ask the collector for a fresh snapshot now instead of at the next interval"""
+        self._refresh_requested.set()
 
-        # Health check — auto-restart crashed
-        changed = False
-        for name, info in self.instances.items():
-            if info.get("status") == "running":
-                if not self.check_process_alive(info.get("process_id")):
-                    info["status"] = "crashed"
-                    changed = True
-                    notify("SeekMateAI", f"Bot '{name}' crashed! Auto-restarting...")
-                    # Auto-restart
-                    info["status"] = "stopped"
-                    info.pop("process_id", None)
-                    try:
-                        with open(INSTANCES_FILE, "w", encoding="utf-8") as f:
-                            json.dump(self.instances, f, indent=4)
-                        subprocess.run(
-                            [sys.executable, "multi_bot_launcher.py", "start", name],
-                            capture_output=True, text=True, timeout=10, cwd=SCRIPT_DIR,
-                            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-                        )
-                        self.load_instances()
-                    except Exception as e:
-                        print(f"[Dashboard] Auto-restart failed for {name}: {e}")
-
-        if changed:
+    def _start_collector(self):
+        self._snapshots = queue.Queue()
+        self._refresh_requested = threading.Event()
+        threading.Thread(target=self._collector_loop, daemon=True).start()
+        self._poll_snapshots()
+
+    def _collector_loop(self):
+        """Background worker: all file I/O, health checks and restarts happen here, never on the Tk thread"""
+        self._init_session_baselines()
+        while self.auto_refresh_running:
             try:
-                with open(INSTANCES_FILE, "w", encoding="utf-8") as f:
-                    json.dump(self.instances, f, indent=4)
-            except Exception:
-                pass
+                self._snapshots.put(self._collect())
+            except Exception as e:
+                print(f"[Dashboard] Refresh failed: {e}")
+            self._refresh_requested.wait(REFRESH_INTERVAL)
+            self._refresh_requested.clear()
 
-        # Preserve selection
-        sel = self.tree.selection()
-        selected_name = None
-        if sel:
-            item = self.tree.item(sel[0])
-            selected_name = item["values"][0] if item["values"] else None
+    def _poll_snapshots(self):
+        """Tk side: apply the newest finished snapshot, if any"""
+        snapshot = None
+        try:
+            while True:
+                snapshot = self._snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        if snapshot is not None:
+            self._apply_snapshot(snapshot)
+        if self.auto_refresh_running:
+            self.root.after(SNAPSHOT_POLL_MS, self._poll_snapshots)
+
+    def _collect(self):
+        self.load_instances()
+
+        # When bot_supervisor is running it owns restarts; otherwise fall back to our own health check
+        supervised = supervisor_state()
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Health check — auto-restart crashed
+        crashed = [] if supervised is not None else [
+            name for name, info in self.instances.items()
+            if info.get("status") == "running" and not self.check_process_alive(info.get("process_id"))
+        ]
+        for name in crashed:
+            notify("SeekMateAI", f"Bot '{name}' crashed! Auto-restarting...")
+            # Marked on a copy of the latest file contents - the Tk handlers read self.instances meanwhile
+            instances = copy.deepcopy(self.instances)
+            if name not in instances:
+                continue
+            instances[name]["status"] = "stopped"
+            instances[name].pop("process_id", None)
+            try:
+                save_instances(instances)
+                subprocess.run(
+                    [sys.executable, "multi_bot_launcher.py", "start", name],
+                    capture_output=True, text=True, timeout=10, cwd=SCRIPT_DIR,
+                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+                )
+                self.load_instances()
+            except Exception as e:
+                print(f"[Dashboard] Auto-restart failed for {name}: {e}")
 
         if not self.instances:
-            self.tree.insert("", tk.END, values=(
-                "No instances", "—", "—", "—", "—", "—", "—", "—", "—",
-                "Click Add Instance to get started"
-            ))
-            self._update_stat_cards(0, 0, 0, 0, 0)
-            return
+            return DashboardSnapshot((), 0, 0, 0, 0, 0, None)
 
+        rows = []
         total_applied = 0
         total_scanned = 0
         total_skipped = 0
@@ -1084,19 +1240,27 @@ class MultiBotGUI:
 
             # Check pause state
             ctrl_path = self._control_path(name)
-            is_paused = False
-            if ctrl_path and os.path.exists(ctrl_path):
-                try:
-                    with open(ctrl_path, "r") as f:
-                        ctrl = json.load(f)
-                    if ctrl.get("status") == "pause":
-                        is_paused = True
-                except Exception:
-                    pass
+            is_paused = bool(ctrl_path) and control_state(read_control_file(ctrl_path)) == "pause"
 
-            if status == "running" and is_paused:
+            log_file = self._log_path(name)
+            counts = self._instance_counts(name)
+            snapshot = counts["snapshot"]
+            if snapshot and snapshot.get("phase") == "paused":
+                is_paused = True
+
+            sup = (supervised or {}).get(name, {})
+            if sup.get("state") == "backoff":
+                status_display = f"Restarting ({sup.get('restart_in') or 0}s)"
+                tag = "crashed"
+            elif sup.get("state") == "crash_loop":
+                status_display = "Crash loop"
+                tag = "crashed"
+            elif status == "running" and is_paused:
                 status_display = "Paused"
                 tag = "paused"
+            elif status == "running" and is_stale(snapshot):
+                status_display = "Stalled"
+                tag = "crashed"
             elif status == "running":
                 status_display = "Running"
                 tag = "running"
@@ -1108,20 +1272,25 @@ class MultiBotGUI:
                 status_display = "Stopped"
                 tag = "stopped"
 
-            log_file = self._log_path(name)
-            abs_jobs = int(self._count_jobs_applied(log_file) or 0)
-            abs_scanned = int(self._count_jobs_scanned(log_file) or 0)
-            sess_jobs, sess_scanned = self._session_counts(name, abs_jobs, abs_scanned)
+            sess_jobs, sess_scanned = self._session_counts(name, counts["applied"], counts["scanned"])
 
-            skipped = self._count_skipped(log_file)
-            failed = self._count_failed(log_file)
-            max_jobs = self._get_max_jobs(name)
+            skipped = counts["skipped"]
+            failed = counts["failed"]
+            max_jobs = (snapshot or {}).get("max_jobs") or self._get_max_jobs(name)
             progress = f"{sess_jobs}/{max_jobs}"
 
             start_time = info.get("start_time", "")
             elapsed = self._get_elapsed(start_time, log_file) if status == "running" else "—"
-            jph = self._get_jobs_per_hour(str(sess_jobs), start_time, log_file) if status == "running" else "—"
-            last_log = self._get_last_log_line(log_file)
+            if status != "running":
+                jph = "—"
+            elif snapshot:
+                jph = f"{float(snapshot.get('jobs_per_hour') or 0):.1f}"
+            else:
+                jph = self._get_jobs_per_hour(str(sess_jobs), start_time, log_file)
+            if snapshot:
+                last_log = f"[{snapshot.get('phase', '—')}] {snapshot.get('last_event') or snapshot.get('title', '')}"
+            else:
+                last_log = self._get_last_log_line(log_file)
 
             total_applied += sess_jobs
             total_scanned += sess_scanned
@@ -1132,14 +1301,11 @@ class MultiBotGUI:
             except ValueError:
                 pass
 
-            item_id = self.tree.insert("", tk.END, values=(
+            rows.append(InstanceRow(name, (
                 name, status_display, progress, sess_scanned, sess_jobs,
                 skipped, failed, elapsed, jph,
                 (last_log[:55] + "...") if len(last_log) > 55 else last_log,
-            ), tags=(tag,))
-
-            if selected_name == name:
-                self.tree.selection_set(item_id)
+            ), tag))
 
             # Milestone notifications (every 5 jobs)
             prev = self.prev_notification_counts.get(name, 0)
@@ -1147,11 +1313,43 @@ class MultiBotGUI:
                 notify("SeekMateAI", f"{name}: {sess_jobs} jobs applied!")
             self.prev_notification_counts[name] = sess_jobs
 
-        # Update stat cards
         success_rate = (total_applied / total_scanned * 100) if total_scanned > 0 else 0
-        self._update_stat_cards(active_count, total_scanned, total_applied, success_rate, total_jph)
-        self._update_chart(total_applied)
-        self._energy_auto_manage()
+        try:
+            chart = self._collect_chart()
+        except Exception as e:
+            print(f"[Dashboard] Chart data unavailable: {e}")
+            chart = None
+        return DashboardSnapshot(tuple(rows), active_count, total_scanned, total_applied, success_rate, total_jph, chart)
+
+    def _apply_snapshot(self, snap):
+        """Update only the Treeview rows that changed; selection survives because rows are kept"""
+        rows = snap.rows or (InstanceRow(None, (
+            "No instances", "—", "—", "—", "—", "—", "—", "—", "—",
+            "Click Add Instance to get started"
+        ), ""),)
+
+        wanted = set()
+        for index, row in enumerate(rows):
+            wanted.add(row.name)
+            current = self._tree_rows.get(row.name)
+            if current is None:
+                item_id = self.tree.insert("", index, values=row.values, tags=(row.tag,))
+            else:
+                item_id = current[0]
+                if current[1:] != (row.values, row.tag):
+                    self.tree.item(item_id, values=row.values, tags=(row.tag,))
+                if self.tree.index(item_id) != index:
+                    self.tree.move(item_id, "", index)
+            self._tree_rows[row.name] = (item_id, row.values, row.tag)
+
+        for name in [n for n in self._tree_rows if n not in wanted]:
+            self.tree.delete(self._tree_rows.pop(name)[0])
+
+        self._update_stat_cards(snap.active, snap.scanned, snap.applied, snap.rate, snap.jph)
+        if snap.chart is not None:
+            self._update_chart(snap.chart)
+        if snap.rows:
+            self._energy_auto_manage()
 
     def _update_stat_cards(self, active, scanned, applied, rate, jph):
         self.stat_cards["active_bots"].config(text=str(active))
@@ -1160,11 +1358,6 @@ class MultiBotGUI:
         self.stat_cards["success_rate"].config(text=f"{rate:.1f}%")
         self.stat_cards["jobs_per_hour"].config(text=f"{jph:.1f}")
 
-    def auto_refresh(self):
-        if self.auto_refresh_running:
-            self.refresh_list()
-            self.root.after(3000, self.auto_refresh)
-
     # ── Pause / Resume ────────────────────────────────────────
     def _pause_selected(self):
         name = self._selected_name()
@@ -1173,8 +1366,7 @@ class MultiBotGUI:
         ctrl = self._control_path(name)
         if ctrl:
             try:
-                with open(ctrl, "w") as f:
-                    json.dump({"status": "pause"}, f)
+                write_control_file(ctrl, pause=True)
                 notify("SeekMateAI", f"{name} paused")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to pause: {e}")
@@ -1187,8 +1379,7 @@ class MultiBotGUI:
         ctrl = self._control_path(name)
         if ctrl:
             try:
-                with open(ctrl, "w") as f:
-                    json.dump({"status": "run"}, f)
+                write_control_file(ctrl, pause=False)
                 notify("SeekMateAI", f"{name} resumed")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to resume: {e}")
@@ -1628,7 +1819,7 @@ class MultiBotGUI:
             self._execute_shutdown()
 
     def _energy_auto_manage(self):
-        """Called from refresh_list — auto-manage wake lock based on bot status."""
+        """Called when a snapshot is applied — auto-manage wake lock based on bot status."""
         running = any(i.get("status") == "running" for i in self.instances.values())
         if running:
             self._set_wake_lock()
@@ -17,8 +17,14 @@ import threading
 from pathlib import Path
 from datetime import datetime
 
+from bot_status import instance_status_file, write_json_atomic
+from bot_control import write_control_file
+from bot_supervisor import supervisor_request
+
 # Shared job tracking database for cross-instance duplicate prevention
 SHARED_JOBS_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shared_applied_jobs.json")
+# Sessions hosted in one process (session_host.py) check-and-register under this lock
+_SHARED_JOBS_LOCK = threading.Lock()
 
 def load_shared_jobs():
     """Load the shared applied jobs registry"""
@@ -31,26 +37,26 @@ def load_shared_jobs():
     return {}
 
 def save_shared_jobs(jobs):
-    """Save the shared applied jobs registry"""
+    """Save the shared applied jobs registry (atomic - other instances read it concurrently)"""
     try:
-        with open(SHARED_JOBS_DB, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, indent=2)
+        write_json_atomic(SHARED_JOBS_DB, jobs)
     except Exception as e:
         print(f"[SharedJobs] Failed to save: {e}")
 
 def register_applied_job(job_url, instance_name, job_title="", company=""):
     """Register a job as applied by an instance. Returns False if already applied by another instance."""
-    jobs = load_shared_jobs()
-    if job_url in jobs:
-        return False  # Already applied by another instance
-    jobs[job_url] = {
-        "instance": instance_name,
-        "title": job_title,
-        "company": company,
-        "applied_at": datetime.now().isoformat()
-    }
-    save_shared_jobs(jobs)
-    return True
+    with _SHARED_JOBS_LOCK:
+        jobs = load_shared_jobs()
+        if job_url in jobs:
+            return False  # Already applied by another instance
+        jobs[job_url] = {
+            "instance": instance_name,
+            "title": job_title,
+            "company": company,
+            "applied_at": datetime.now().isoformat()
+        }
+        save_shared_jobs(jobs)
+        return True
 
 def is_job_applied(job_url):
     """Check if a job has already been applied to by any instance"""
@@ -73,9 +79,8 @@ def load_instances():
     return {}
 
 def save_instances(instances):
-    """Save bot instances configuration"""
-    with open(INSTANCES_FILE, "w") as f:
-        json.dump(instances, f, indent=4)
+    """Save bot instances configuration (atomic - the supervisor and dashboard read it concurrently)"""
+    write_json_atomic(INSTANCES_FILE, instances)
 
 def create_instance_config(instance_name, base_config_path="config.json"):
     """Create a config file for a specific instance"""
@@ -142,6 +147,7 @@ def add_instance(instance_name, seek_email=None, full_name=None):
         "chrome_profile": f"chrome_profile_{instance_name}",
         "log_file": os.path.join(script_dir, f"log_{instance_name}.txt"),
         "control_file": os.path.join(script_dir, f"control_{instance_name}.json"),
+        "status_file": os.path.join(script_dir, f"status_{instance_name}.json"),
         "status": "stopped"
     }
     
@@ -171,25 +177,12 @@ def list_instances():
         print(f"   Log: {info['log_file']}")
     print("="*60 + "\n")
 
-def start_instance(instance_name):
-    """Start a single bot instance by running main.py with env vars (no generated files)."""
-    instances = load_instances()
-    
-    if instance_name not in instances:
-        print(f"❌ Instance '{instance_name}' not found!")
-        return False
-    
-    instance = instances[instance_name]
-    
-    if instance.get("status") == "running":
-        print(f"⚠️  Instance '{instance_name}' is already running!")
-        return False
-    
+def build_instance_launch(instance_name, instance):
+    """(command, env, log_path) for running main.py as this instance - shared with bot_supervisor"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     main_py = os.path.join(script_dir, "main.py")
     if not os.path.exists(main_py):
-        print(f"❌ main.py not found in {script_dir}")
-        return False
+        raise FileNotFoundError(f"main.py not found in {script_dir}")
     
     # Pass paths via environment so we never generate .py files or escape paths
     env = dict(os.environ)
@@ -198,17 +191,52 @@ def start_instance(instance_name):
     env["BOT_CHROME_PROFILE"] = instance["chrome_profile"]
     env["BOT_LOG_FILE"] = os.path.abspath(instance["log_file"])
     env["BOT_CONTROL_FILE"] = os.path.abspath(instance["control_file"])
+    env["BOT_STATUS_FILE"] = instance_status_file(instance_name, instance, script_dir)
     
     log_path = instance["log_file"]
     if not os.path.isabs(log_path):
         log_path = os.path.join(script_dir, log_path)
+    return [sys.executable, main_py], env, log_path
+
+def _via_supervisor(action, instance_name=""):
+    """Hand the command to a running bot_supervisor. Returns its result, or None if none is running."""
+    from urllib.parse import quote
+    result = supervisor_request(f"{action}/{quote(instance_name)}" if instance_name else action, method="POST", timeout=15)
+    if result is None:
+        return None
+    print(("✅ " if result.get("ok") else "⚠️  ") + result.get("message", ""))
+    return bool(result.get("ok"))
+
+def start_instance(instance_name):
+    """Start a single bot instance by running main.py with env vars (no generated files)."""
+    supervised = _via_supervisor("start", instance_name)
+    if supervised is not None:
+        return supervised
+    
+    instances = load_instances()
+    
+    if instance_name not in instances:
+        print(f"❌ Instance '{instance_name}' not found!")
+        return False
+    
+    instance = instances[instance_name]
+    
+    if instance.get("status") == "running":
+        print(f"⚠️  Instance '{instance_name}' is already running!")
+        return False
+    
+    try:
+        cmd, env, log_path = build_instance_launch(instance_name, instance)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return False
     
     print(f"🚀 Starting instance '{instance_name}'...")
     try:
         log_handle = open(log_path, "a", encoding="utf-8")
         process = subprocess.Popen(
-            [sys.executable, main_py],
-            cwd=script_dir,
+            cmd,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
             env=env,
             stdout=log_handle,
             stderr=subprocess.STDOUT,
@@ -229,6 +257,10 @@ def start_instance(instance_name):
 
 def stop_instance(instance_name):
     """Stop a single bot instance"""
+    supervised = _via_supervisor("stop", instance_name)
+    if supervised is not None:
+        return supervised
+    
     instances = load_instances()
     
     if instance_name not in instances:
@@ -244,14 +276,13 @@ def stop_instance(instance_name):
     # Write stop signal to control file
     control_file = instance["control_file"]
     try:
-        with open(control_file, "w") as f:
-            json.dump({"stop": True, "pause": False}, f)
+        write_control_file(control_file, pause=False, stop=True)
     except:
         pass
     
-    # Try to kill the process
+    # Try to kill the process (not a session host - the stop flag ends just this session)
     try:
-        pid = instance.get("process_id")
+        pid = None if instance.get("hosted") else instance.get("process_id")
         if pid:
             if sys.platform == "win32":
                 subprocess.run(["taskkill", "/F", "/PID", str(pid)], 
@@ -262,10 +293,8 @@ def stop_instance(instance_name):
         pass
     
     instance["status"] = "stopped"
-    if "process_id" in instance:
-        del instance["process_id"]
-    if "start_time" in instance:
-        del instance["start_time"]
+    for key in ("process_id", "start_time", "hosted"):
+        instance.pop(key, None)
     save_instances(instances)
     
     print(f"✅ Instance '{instance_name}' stopped")
@@ -317,6 +346,7 @@ Usage:
     python multi_bot_launcher.py start-all
     python multi_bot_launcher.py stop-all
     python multi_bot_launcher.py remove <instance_name>
+    python multi_bot_launcher.py supervise      (run the supervisor daemon: restarts, health, local API)
 
 Examples:
     python multi_bot_launcher.py add bot1 --email user1@example.com --name "John Doe"
@@ -371,6 +401,10 @@ Examples:
     elif command == "stop-all":
         stop_all()
     
+    elif command == "supervise":
+        import bot_supervisor
+        bot_supervisor.main()
+    
     elif command == "remove":
         if len(sys.argv) < 3:
             print("❌ Usage: python multi_bot_launcher.py remove <instance_name>")
@@ -0,0 +1,151 @@
+"""
+Crash-safe Run Checkpoints for SeekMateAI
+The run loop records where it is (title, location, page), which jobs it has already handled,
+the submit count and the 24/7 timestamps after every page and job. The record is replaced
+atomically, so when a bot crashes or is restarted it can go straight back to the page it was on
+instead of walking every search again from page 1.
+"""
+import os
+import time
+from datetime import datetime, timedelta
+
+from bot_status import get_data_dir, read_status, write_json_atomic
+
+CHECKPOINT_MAX_AGE_HOURS = 12   # Older positions are not resumed (SEEK results have moved on)
+MAX_PROCESSED_IDS = 5000        # Handled job ids kept for skipping on the next run
+
+
+def default_checkpoint_file(instance=None, status_file=None):
+    """BOT_CHECKPOINT_FILE, else next to the instance status file, else the data dir"""
+    path = None if instance else os.getenv("BOT_CHECKPOINT_FILE")
+    if path:
+        return path
+    instance = instance or os.getenv("BOT_INSTANCE_NAME")
+    status_file = status_file or os.getenv("BOT_STATUS_FILE")
+    if instance and status_file:
+        return os.path.join(os.path.dirname(os.path.abspath(status_file)), f"checkpoint_{instance}.json")
+    return os.path.join(get_data_dir(), "checkpoint.json")
+
+
+class RunCheckpoint:
+    """
+    Position and progress of one run loop.
+    - A run that died mid-way (state "running") resumes its position, submit count and handled jobs.
+    - A run that was stopped resumes its position and handled jobs; the submit count starts again.
+    - A finished run starts from the first search; handled jobs are still skipped.
+    Positions older than max_age_hours, or from a different search setup, are discarded.
+    The 24/7 timestamps are always kept (pruned to the last 24 hours).
+    """
+
+    def __init__(self, path=None, max_age_hours=CHECKPOINT_MAX_AGE_HOURS, enabled=True):
+        self.path = path or default_checkpoint_file()
+        self.max_age = max_age_hours * 3600
+        self.enabled = enabled
+        self.data = None
+        self._processed = {}     # job id -> handled at (epoch)
+
+    # ---------- START ----------
+    def start(self, fingerprint):
+        """
+        Load the previous checkpoint for a run with this search setup.
+        Returns the position to resume ({"title_index", "title", "location", "page"}) or None.
+        """
+        previous = (read_status(self.path) if self.enabled else None) or {}
+        now = time.time()
+        fresh = now - float(previous.get("updated_at") or 0) < self.max_age
+        same_setup = previous.get("fingerprint") == fingerprint
+
+        cutoff = now - self.max_age
+        if fresh:
+            self._processed = {k: v for k, v in (previous.get("processed") or {}).items() if v > cutoff}
+
+        position = None
+        submits = 0
+        state = previous.get("state")
+        if fresh and same_setup and state in ("running", "stopped") and previous.get("position"):
+            position = previous["position"]
+            if state == "running":
+                submits = int(previous.get("successful_submits") or 0)
+
+        day_ago = datetime.now() - timedelta(hours=24)
+        timestamps = []
+        for ts in previous.get("job_timestamps") or []:
+            try:
+                ts = datetime.fromisoformat(ts)
+            except (TypeError, ValueError):
+                continue
+            if ts > day_ago:
+                timestamps.append(ts)
+
+        self.data = {
+            "pid": os.getpid(),
+            "state": "running",
+            "fingerprint": fingerprint,
+            "position": position,
+            "successful_submits": submits,
+            "job_timestamps": timestamps,
+            "started_at": now,
+            "updated_at": now,
+        }
+        self._save()
+        return position
+
+    @property
+    def successful_submits(self):
+        return self.data["successful_submits"] if self.data else 0
+
+    @property
+    def job_timestamps(self):
+        return list(self.data["job_timestamps"]) if self.data else []
+
+    # ---------- PROGRESS ----------
+    def at_page(self, title_index, title, location, page, successful_submits=None, job_timestamps=None):
+        """Record that the loop is about to work through this results page"""
+        if self.data is None:
+            return
+        self.data["position"] = {"title_index": title_index, "title": title, "location": location, "page": page}
+        self._progress(successful_submits, job_timestamps)
+
+    def job_done(self, job_id, successful_submits=None, job_timestamps=None):
+        """Record that a job was handled (applied, skipped or failed) so it isn't opened again"""
+        if job_id:
+            self._processed[job_id] = time.time()
+            if len(self._processed) > MAX_PROCESSED_IDS:
+                oldest = sorted(self._processed, key=self._processed.get)
+                for key in oldest[:len(self._processed) - MAX_PROCESSED_IDS]:
+                    del self._processed[key]
+        self._progress(successful_submits, job_timestamps)
+
+    def is_processed(self, job_id):
+        return bool(job_id) and job_id in self._processed
+
+    def finish(self, state="finished", successful_submits=None, job_timestamps=None):
+        """End of run: "finished" clears the position, "stopped" keeps it for the next start"""
+        if self.data is None:
+            return
+        self.data["state"] = state
+        if state == "finished":
+            self.data["position"] = None
+        self._progress(successful_submits, job_timestamps)
+
+    # ---------- INTERNALS ----------
+    def _progress(self, successful_submits, job_timestamps):
+        if self.data is None:
+            return
+        if successful_submits is not None:
+            self.data["successful_submits"] = successful_submits
+        if job_timestamps is not None:
+            self.data["job_timestamps"] = list(job_timestamps)
+        self.data["updated_at"] = time.time()
+        self._save()
+
+    def _save(self):
+        if not self.enabled:
+            return
+        record = dict(self.data,
+                      job_timestamps=[ts.isoformat() for ts in self.data["job_timestamps"]],
+                      processed=self._processed)
+        try:
+            write_json_atomic(self.path, record)
+        except Exception as e:
+            print(f"[Checkpoint] Could not save {self.path}: {e}")
@@ -23,6 +23,8 @@ if "RUN_HEADLESS" not in os.environ:
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from bot_control import ControlChannel
+
 # Configuration
 CYCLE_WAIT_TIME = 3600  # Wait time between cycles in seconds (1 hour default)
 LOG_FILE = "continuous_runner.log"
@@ -92,19 +94,11 @@ def update_daily_count(jobs_applied):
         save_daily_job_count(new_count)
         log(f"Daily job count updated: {new_count}/{DAILY_JOB_LIMIT}", "INFO")
 
+CONTROL = ControlChannel("control.json")
+
 def check_control_file():
     """Check if control.json says to stop"""
-    try:
-        control_file = "control.json"
-        if os.path.exists(control_file):
-            import json
-            with open(control_file, "r") as f:
-                data = json.load(f)
-                if data.get("stop", False):
-                    return True
-    except Exception:
-        pass
-    return False
+    return CONTROL.check() == "stop"
 
 def run_bot_cycle():
     """Run one cycle of the bot"""
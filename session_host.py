@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Session Host for SeekMateAI
+Runs several bot instances from bot_instances.json inside ONE Python process, one thread per
+instance. Each session still gets its own config, Chrome + Chrome profile, log, control and status
+files (bot_session.BotSession), but the interpreter, imported modules, LLM clients, compiled title
+matchers and the shared-jobs / frontier stores are loaded once instead of once per bot.
+
+Usage:
+    python session_host.py <instance> [<instance> ...]
+    python session_host.py --all
+
+Stop one session with `python multi_bot_launcher.py stop <instance>` or the dashboard (control file);
+Ctrl+C stops them all.
+"""
+import os
+import sys
+import time
+import threading
+import traceback
+from datetime import datetime
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from bot_control import write_control_file
+from bot_session import BotSession
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+START_STAGGER = 2   # Seconds between session starts (same spacing as start-all)
+
+
+def _log(msg):
+    print(f"[Host] {datetime.now().strftime('%H:%M:%S')} {msg}", flush=True)
+
+
+def _rss_mb():
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _mark(name, **fields):
+    """Update one instance entry in bot_instances.json (None removes the key)"""
+    from multi_bot_launcher import load_instances, save_instances
+    try:
+        instances = load_instances()
+        info = instances.get(name)
+        if info is None:
+            return
+        for key, value in fields.items():
+            if value is None:
+                info.pop(key, None)
+            else:
+                info[key] = value
+        save_instances(instances)
+    except Exception as e:
+        _log(f"Could not update instances file for '{name}': {e}")
+
+
+def _run(session):
+    import main as bot_module
+    _mark(session.name, status="running", process_id=os.getpid(), hosted=True,
+          start_time=datetime.now().isoformat())
+    status = "stopped"
+    try:
+        bot_module.run_session(session)
+    except Exception as e:
+        status = "crashed"
+        _log(f"Session '{session.name}' crashed: {e}")
+        traceback.print_exc()
+    finally:
+        _mark(session.name, status=status, process_id=None, hosted=None, start_time=None)
+        _log(f"Session '{session.name}' ended ({status})")
+
+
+def host(names):
+    from multi_bot_launcher import load_instances
+    instances = load_instances()
+    missing = [n for n in names if n not in instances]
+    if missing:
+        print(f"❌ Instance(s) not found: {', '.join(missing)}")
+        return False
+    busy = [n for n in names if instances[n].get("status") == "running"]
+    if busy:
+        print(f"⚠️  Already running: {', '.join(busy)}")
+        return False
+
+    sessions = [BotSession.for_instance(n, instances[n], SCRIPT_DIR) for n in names]
+    baseline = _rss_mb()
+    threads = []
+    for i, session in enumerate(sessions):
+        if i:
+            time.sleep(START_STAGGER)
+        thread = threading.Thread(target=_run, args=(session,), name=f"session-{session.name}", daemon=True)
+        thread.start()
+        threads.append(thread)
+        _log(f"Started session '{session.name}' (log: {session.log_file})")
+
+    rss = _rss_mb()
+    if rss is not None:
+        _log(f"{len(sessions)} session(s) in PID {os.getpid()} - RSS {rss:.0f} MB (host alone {baseline:.0f} MB)")
+
+    try:
+        while any(t.is_alive() for t in threads):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        _log("Stopping all sessions...")
+        for session in sessions:
+            try:
+                write_control_file(session.control_file, pause=False, stop=True)
+            except Exception:
+                pass
+        for thread in threads:
+            thread.join(timeout=30)
+    return True
+
+
+def main():
+    # Instance paths in bot_instances.json are relative to the script directory
+    os.chdir(SCRIPT_DIR)
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    if args == ["--all"]:
+        from multi_bot_launcher import load_instances
+        args = list(load_instances())
+        if not args:
+            print("❌ No bot instances configured!")
+            return
+    host(args)
+
+
+if __name__ == "__main__":
+    main()
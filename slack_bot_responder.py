@@ -29,6 +29,9 @@ from threading import Thread
 from dotenv import load_dotenv
 load_dotenv()
 
+from bot_status import read_status, instance_status_file, is_stale, lifetime_count
+from bot_supervisor import supervisor_state, supervisor_request
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INSTANCES_FILE = os.path.join(SCRIPT_DIR, "bot_instances.json")
 BOT_CONFIG_FILE = os.path.join(SCRIPT_DIR, "slack_bot_config.json")
@@ -107,6 +110,15 @@ def get_jobs_scanned(log_file):
         return 0
 
 
+def get_counts(info, name):
+    """(scanned, applied) from the bot's status snapshot, falling back to log parsing"""
+    snapshot = read_status(instance_status_file(name, info, SCRIPT_DIR))
+    if snapshot:
+        return lifetime_count(snapshot, "scanned"), lifetime_count(snapshot, "applied")
+    log_file = get_log_path(info, name)
+    return get_jobs_scanned(log_file), get_jobs_applied(log_file)
+
+
 def get_log_path(info, name):
     log_file = info.get("log_file", os.path.join(SCRIPT_DIR, f"log_{name}.txt"))
     if not os.path.isabs(log_file):
@@ -190,20 +202,31 @@ def cmd_status():
     lines = ["*SeekMateAI Dashboard*\n"]
     total_applied = 0
     total_scanned = 0
+    supervised = supervisor_state()
     for name, info in instances.items():
         status = info.get("status", "stopped")
         pid = info.get("process_id")
-        if status == "running" and not check_process_alive(pid):
+        snapshot = read_status(instance_status_file(name, info, SCRIPT_DIR))
+        sup = (supervised or {}).get(name, {})
+        if sup.get("state") in ("backoff", "crash_loop"):
+            status = "restarting" if sup["state"] == "backoff" else "crash loop"
+        elif status == "running" and not check_process_alive(pid):
             status = "crashed"
-        emoji = {"running": "🟢", "crashed": "🔴", "stopped": "⚪"}.get(status, "⚪")
-        log_file = get_log_path(info, name)
-        applied = get_jobs_applied(log_file)
-        scanned = get_jobs_scanned(log_file)
+        elif status == "running" and is_stale(snapshot):
+            status = "stalled"
+        emoji = {"running": "🟢", "crashed": "🔴", "crash loop": "🔴", "stalled": "🟠",
+                 "restarting": "🟠", "stopped": "⚪"}.get(status, "⚪")
+        scanned, applied = get_counts(info, name)
         elapsed = get_elapsed_time(info.get("start_time", "")) if status == "running" else "—"
         total_applied += applied
         total_scanned += scanned
         lines.append(f"{emoji} *{name}* — {status.capitalize()}")
         lines.append(f"    Scanned: {scanned} | Applied: {applied} | Time: {elapsed}")
+        if snapshot and status == "running":
+            where = " · ".join(p for p in (snapshot.get("title"), snapshot.get("location")) if p)
+            lines.append(f"    Now: {snapshot.get('phase', '—')}" + (f" — {where} p{snapshot.get('page', 0)}" if where else ""))
+        if sup.get("restarts") or sup.get("last_reason"):
+            lines.append(f"    Restarts: {sup.get('restarts', 0)}" + (f" | Last: {sup['last_reason']}" if sup.get("last_reason") else ""))
     lines.append(f"\n*Totals:* {total_scanned} scanned · {total_applied} applied")
     return "\n".join(lines)
 
@@ -242,6 +265,10 @@ def cmd_restart(args):
     if not name:
         names = ", ".join(instances.keys())
         return f"Instance not found: _{args}_\nAvailable: {names}"
+    from urllib.parse import quote
+    result = supervisor_request(f"restart/{quote(name)}", method="POST", timeout=15)
+    if result is not None:
+        return result.get("message", "Done.")
     run_launcher(["stop", name])
     time.sleep(2)
     return run_launcher(["start", name])
@@ -278,11 +305,12 @@ def cmd_jobs():
     grand_applied = 0
     grand_scanned = 0
     for name, info in instances.items():
-        log_file = get_log_path(info, name)
-        applied = get_jobs_applied(log_file)
-        scanned = get_jobs_scanned(log_file)
+        snapshot = read_status(instance_status_file(name, info, SCRIPT_DIR))
+        scanned, applied = get_counts(info, name)
         rate = "—"
-        if info.get("status") == "running" and info.get("start_time"):
+        if info.get("status") == "running" and snapshot:
+            rate = f"{float(snapshot.get('jobs_per_hour') or 0):.1f}/hr"
+        elif info.get("status") == "running" and info.get("start_time"):
             try:
                 start = datetime.fromisoformat(info["start_time"])
                 hours = (datetime.now() - start).total_seconds() / 3600
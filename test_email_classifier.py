@@ -0,0 +1,38 @@
+"""
+Tests for the local email classifier (email_classifier.py)
+Run with: python -m pytest test_email_classifier.py
+"""
+import os
+
+from email_classifier import EmailClassifier, subject_template, subject_templates
+
+DIGEST_SUBJECTS = ["Job Alert", "New Jobs For You", "Weekly Job Digest", "Jobs Matching Your Search",
+                   "Recommended Roles This Week", "Top Picks For Developers", "Daily Job Alert",
+                   "More Jobs Near Sydney"]
+
+
+def _model(verdicts):
+    model = EmailClassifier(model_file=os.devnull, log_file=os.devnull)
+    for subject, delete in verdicts:
+        model._update(subject, "", delete)
+    return model
+
+
+def test_title_case_subjects_have_no_wildcard_only_template():
+    assert subject_template("Welcome Aboard", first_is_name=True) == "*"
+    for subject in ("Welcome Aboard", "Contract Signed", "Reference Check Request", "Your Start Date"):
+        assert "*" not in subject_templates(subject)
+
+
+def test_digest_verdicts_do_not_decide_unrelated_title_case_mail():
+    model = _model([(DIGEST_SUBJECTS[i % len(DIGEST_SUBJECTS)], True) for i in range(40)])
+    for subject in ("Reference Check Request", "Contract Signed", "Welcome Aboard", "Your Start Date"):
+        verdict, how = model.predict(subject)
+        assert verdict is None, (subject, how)
+
+
+def test_specific_template_still_decides():
+    companies = ["Acme Corp", "Globex", "Initech Pty Ltd", "Umbrella Group", "Hooli"]
+    roles = ["Senior Developer", "Chef", "Data Analyst"]
+    model = _model([(f"{c} has viewed your application for {r}", True) for c in companies for r in roles] * 2)
+    assert model.predict("Wayne Enterprises has viewed your application for Barista") == (True, "template")
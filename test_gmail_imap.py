@@ -0,0 +1,77 @@
+"""
+Tests for the IMAP cleanup backend (gmail_imap.py) against the local mock IMAP server
+Run with: python -m pytest test_gmail_imap.py
+"""
+import json
+
+import pytest
+
+from gmail_imap import GmailImapCleanup, start_mock_server
+
+DELETE_SUBJECT = "Acme Corp has viewed your application for Chef"     # Matches the delete patterns
+KEEP_SUBJECT = "Interview invitation - Chef at Acme Corp"
+
+
+@pytest.fixture
+def mock_server():
+    server, mailbox = start_mock_server(port=0, messages=0)
+    yield server.server_address[1], mailbox
+    server.shutdown()
+    server.server_close()
+
+
+def _add(mailbox, deletes, keeps):
+    with mailbox.lock:
+        for _ in range(deletes):
+            mailbox.add("INBOX", "SEEK <noreply@s.seek.com.au>", DELETE_SUBJECT, "Hi there")
+        for _ in range(keeps):
+            mailbox.add("INBOX", "Acme Talent <talent@example.com>", KEEP_SUBJECT, "Hi there")
+
+
+def _cleanup(port, state_file):
+    return GmailImapCleanup("test", "test", host="127.0.0.1", port=port, use_ssl=False,
+                            local_classifier=False, state_file=str(state_file))
+
+
+def _counts(mailbox):
+    with mailbox.lock:
+        return len(mailbox.folders["INBOX"]), len(mailbox.folders["[Gmail]/Trash"])
+
+
+def test_second_pass_resumes_from_saved_state(mock_server, tmp_path):
+    port, mailbox = mock_server
+    state_file = tmp_path / "state.json"
+    _add(mailbox, deletes=3, keeps=2)
+
+    first = _cleanup(port, state_file)
+    assert first.cleanup_emails(max_emails=25)
+    first.close()
+    assert _counts(mailbox) == (2, 3)
+
+    # A backlog bigger than one batch, picked up by a fresh (restarted) instance
+    _add(mailbox, deletes=40, keeps=20)
+    second = _cleanup(port, state_file)
+    assert second._last_uid == 5
+    assert second.cleanup_emails(max_emails=25)
+    second.close()
+    assert _counts(mailbox) == (22, 43)
+    state = json.loads(state_file.read_text())
+    assert state["test@127.0.0.1/INBOX"] == {"uidvalidity": "1", "last_uid": 65}
+
+
+def test_failed_delete_is_retried_next_pass(mock_server, tmp_path):
+    port, mailbox = mock_server
+    state_file = tmp_path / "state.json"
+    _add(mailbox, deletes=4, keeps=1)
+
+    failing = _cleanup(port, state_file)
+    failing._apply = lambda uids: None
+    assert not failing.cleanup_emails(max_emails=25)
+    failing.close()
+    assert _counts(mailbox) == (5, 0)
+    assert _cleanup(port, state_file)._last_uid == 0
+
+    retry = _cleanup(port, state_file)
+    assert retry.cleanup_emails(max_emails=25)
+    retry.close()
+    assert _counts(mailbox) == (1, 4)
@@ -0,0 +1,95 @@
+"""
+Fast Text Entry for SeekMateAI
+send_keys() types a cover letter one simulated key at a time, which takes seconds for 2,000+
+characters. fill_text() puts the whole string in with one operation instead:
+  1. CDP Input.insertText - Chrome inserts it like a paste, with real input events, so React
+     (SEEK's forms) sees the change. Only used when the field actually took focus.
+  2. if the field doesn't end up holding the text: the native value setter plus input/change events
+     (setting .value directly is ignored by React's value tracking)
+  3. if that doesn't stick either: send_keys as before
+"""
+import time
+
+# Focus the field and select its current content, so the insert replaces it. Returns whether the
+# field really has focus - insertText types wherever focus is, which may be another field.
+_SELECT_ALL_SCRIPT = """
+const el = arguments[0];
+el.focus();
+if (el.isContentEditable) {
+    const range = document.createRange();
+    range.selectNodeContents(el);
+    const sel = window.getSelection();
+    sel.removeAllRanges();
+    sel.addRange(range);
+} else if (typeof el.select === 'function') {
+    el.select();
+}
+return document.activeElement === el;
+"""
+
+_NATIVE_SET_SCRIPT = """
+const el = arguments[0], text = arguments[1];
+if (el.isContentEditable) {
+    el.innerText = text;
+} else {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+}
+el.dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+_CHANGE_SCRIPT = "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));"
+
+# What the field holds now, and what it should hold (maxlength cuts the text short)
+_READ_SCRIPT = """
+const el = arguments[0], text = arguments[1];
+const value = el.isContentEditable ? el.innerText : el.value;
+const max = el.maxLength > 0 ? el.maxLength : text.length;
+return [value, text.slice(0, max)];
+"""
+
+
+def _normalise(text):
+    return " ".join((text or "").split())
+
+
+def _holds(driver, element, text):
+    value, expected = driver.execute_script(_READ_SCRIPT, element, text)
+    return _normalise(value) == _normalise(expected)
+
+
+def fill_text(driver, element, text, log=print):
+    """
+    Replace the content of a textarea / text input / rich editor with `text` in one operation.
+    Returns the method that worked: "insertText", "setter" or "send_keys".
+    """
+    started = time.time()
+    method = None
+    try:
+        if driver.execute_script(_SELECT_ALL_SCRIPT, element):
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            if _holds(driver, element, text):
+                method = "insertText"
+    except Exception:
+        pass
+
+    if method is None:
+        try:
+            driver.execute_script(_NATIVE_SET_SCRIPT, element, text)
+            if _holds(driver, element, text):
+                method = "setter"
+        except Exception:
+            pass
+
+    if method is None:
+        element.clear()
+        element.send_keys(text)
+        method = "send_keys"
+    else:
+        try:
+            driver.execute_script(_CHANGE_SCRIPT, element)
+        except Exception:
+            pass
+
+    log(f"    [*] Entered {len(text)} chars via {method} in {(time.time() - started) * 1000:.0f} ms")
+    return method
@@ -0,0 +1,196 @@
+"""
+Precompiled Title / Blocklist Matcher for SeekMateAI
+Compiles JOB_TITLES, the smart category expansion and the BLOCKED_TITLES / BLOCKED_COMPANIES
+lists once per config load into a few regexes and a substring set, so every job card is
+decided with a handful of C-level scans instead of nested Python `any(... in ...)` loops.
+Decisions are identical to the original title_matches / is_*_blocked helpers.
+"""
+import re
+
+
+# Related keywords added by the smart category expansion (see detect_category)
+CATEGORY_RELATED = {
+    "social": ["research", "policy", "community", "program", "stakeholder",
+               "case manager", "social", "analyst", "coordinator", "officer",
+               "engagement", "advisor", "consultant", "specialist"],
+    "gov": ["el1", "el 1", "el2", "el 2", "ses", "director", "policy",
+            "principal", "executive", "governance", "advisor", "analyst",
+            "coordinator", "officer", "manager", "public sector"],
+    "project": ["project", "program", "delivery", "scrum", "agile", "lead",
+                "coordinator", "manager", "officer", "analyst"],
+    "sales": ["bdm", "business development", "sales", "account", "partnership",
+              "growth", "client", "relationship", "solutions", "commercial"],
+    "leadership": ["director", "head", "general manager", "gm", "executive",
+                   "principal", "lead", "chief", "senior", "manager"],
+    "admin": ["admin", "coordinator", "ea", "executive assistant",
+              "office", "project coordinator", "officer", "support"],
+    "it": ["developer", "engineer", "software", "it", "cloud", "cyber",
+           "product", "technical", "devops", "data", "analyst"],
+}
+
+
+def detect_category(titles):
+    """Detects which preset category user is targeting."""
+    titles_norm = [t.lower().strip() for t in titles]
+
+    # GOVERNMENT / EXEC / EL / SES (APS REMOVED)
+    gov_keywords = [
+        "el1", "el 1", "el2", "el 2",
+        "ses", "ses1", "ses 1", "ses2", "ses 2",
+        "policy", "governance", "compliance", "public sector",
+        "principal", "advisor"
+    ]
+    if any(k in t for t in titles_norm for k in gov_keywords):
+        return "gov"
+
+    # DIRECTOR / LEADERSHIP
+    if any(t in titles_norm for t in [
+        "director", "program director", "operations director",
+        "project director", "head of", "general manager",
+        "executive", "principal", "portfolio manager", "gm"
+    ]):
+        return "leadership"
+
+    # PROJECT / PROGRAM
+    if any(t in titles_norm for t in [
+        "project manager", "program manager", "agile",
+        "scrum master", "project lead", "delivery manager"
+    ]):
+        return "project"
+
+    # SALES / BDM
+    if any(t in titles_norm for t in [
+        "bdm", "business development", "sales", "account manager",
+        "relationship manager", "client", "growth", "partnership"
+    ]):
+        return "sales"
+
+    # SOCIAL / RESEARCH
+    if any(t in titles_norm for t in [
+        "research", "policy", "community", "anthropology",
+        "program officer", "stakeholder engagement"
+    ]):
+        return "social"
+
+    # ADMIN
+    if any(t in titles_norm for t in [
+        "admin", "coordinator", "ea", "executive assistant"
+    ]):
+        return "admin"
+
+    # IT
+    if any(t in titles_norm for t in [
+        "it", "developer", "engineer", "software", "cyber",
+        "cloud", "data"
+    ]):
+        return "it"
+
+    return "generic"
+
+
+def compile_keywords(keywords):
+    """
+    One regex that finds any of the keywords as a plain substring (None for an empty list).
+    Longest-first so the reported keyword is the most specific one at that position.
+    """
+    unique = sorted(set(keywords), key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(k) for k in unique))
+
+
+def _word_fragments(titles, min_len=4):
+    """Every whitespace-free substring (len >= min_len) of the target titles"""
+    fragments = set()
+    for t in titles:
+        for part in t.split():
+            n = len(part)
+            for i in range(n - min_len + 1):
+                for j in range(i + min_len, n + 1):
+                    fragments.add(part[i:j])
+    return fragments
+
+
+class TitleMatcher:
+    """Compiled once per config load; answers match/block questions with the reason"""
+
+    def __init__(self, job_titles, blocked_titles=(), blocked_companies=(), expand_categories=True):
+        self.allowed = [t.lower().strip() for t in job_titles]
+        self.blocked_titles = [t.lower().strip() for t in blocked_titles]
+        self.blocked_companies = [c.lower().strip() for c in blocked_companies]
+
+        self.category = detect_category(self.allowed) if expand_categories else "generic"
+        self.related = CATEGORY_RELATED.get(self.category, [])
+
+        # 1. Direct match - any target title inside the job title
+        self._direct_re = compile_keywords(self.allowed)
+        # 2. Reverse match - any job title word (> 3 chars) inside a target title
+        self._fragments = _word_fragments(self.allowed)
+        # 3. Category expansion - related roles
+        self._related_re = compile_keywords(self.related)
+
+        self._blocked_title_re = compile_keywords(self.blocked_titles)
+        self._blocked_company_re = compile_keywords(self.blocked_companies)
+
+    @classmethod
+    def from_config(cls, config, expand_categories=True):
+        return cls(
+            config.get("JOB_TITLES", []),
+            config.get("BLOCKED_TITLES", []),
+            config.get("BLOCKED_COMPANIES", []),
+            expand_categories=expand_categories,
+        )
+
+    # ---------- TITLE MATCH ----------
+    def match_reason(self, title):
+        """Why the title matches the targets ("direct: x", "word: x", "related: x"), or "" if it doesn't"""
+        title_clean = title.lower().strip()
+
+        if self._direct_re is not None:
+            m = self._direct_re.search(title_clean)
+            if m:
+                return f"direct: {m.group(0)}"
+
+        # Words are split the same way as before; a set lookup replaces the nested scan
+        for word in title_clean.replace('-', ' ').split():
+            if len(word) > 3 and word in self._fragments:
+                return f"word: {word}"
+
+        if self._related_re is not None:
+            m = self._related_re.search(title_clean)
+            if m:
+                return f"related: {m.group(0)}"
+        return ""
+
+    def matches(self, title):
+        return bool(self.match_reason(title))
+
+    # ---------- BLOCKLISTS ----------
+    def blocked_title_keyword(self, title):
+        """The blocked keyword found in the title, or None"""
+        if self._blocked_title_re is None:
+            return None
+        m = self._blocked_title_re.search(title.lower().strip())
+        return m.group(0) if m else None
+
+    def blocked_company_keyword(self, company):
+        """The blocked keyword found in the company name, or None"""
+        if self._blocked_company_re is None:
+            return None
+        m = self._blocked_company_re.search(company.lower().strip())
+        return m.group(0) if m else None
+
+    # ---------- ONE-PASS DECISION ----------
+    def check_title(self, title):
+        """
+        Decide a job card title in one call.
+        Returns (verdict, reason): verdict is "ok", "mismatch" or "blocked".
+        Mismatch wins over blocked, matching the order the run loops used to check in.
+        """
+        reason = self.match_reason(title)
+        if not reason:
+            return "mismatch", ""
+        blocked = self.blocked_title_keyword(title)
+        if blocked is not None:
+            return "blocked", blocked
+        return "ok", reason
@@ -0,0 +1,236 @@
+"""
+Vision Screenshot Preparation for SeekMateAI
+GPT Vision calls used to send a full-window PNG every time. This module screenshots only the element
+that matters (the inbox list, the reCAPTCHA challenge frame), optionally cuts it to the rows needed,
+downsamples it to the smallest size that stays legible, re-encodes it as JPEG and picks the "low" or
+"high" detail setting. Every call is logged (bytes, estimated and billed tokens, latency) to
+vision_calls.jsonl so the saving can be checked.
+
+Pillow is optional - without it the element screenshot is sent as PNG, still cropped.
+Set VISION_FULL_WINDOW=1 to send full-window PNGs again (baseline for comparisons).
+
+Usage:
+    python vision_image.py report              (per task: average bytes, tokens, latency; full vs prepared)
+    python vision_image.py bench <screenshot.png>
+"""
+import io
+import os
+import sys
+import json
+import math
+import time
+import base64
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from bot_status import get_data_dir
+
+FULL_WINDOW = os.getenv("VISION_FULL_WINDOW", "false").lower() in ("1", "true")
+
+# OpenAI image token accounting: (base tokens, tokens per 512px tile) - gpt-4o unless listed
+TILE_SIZE = 512
+IMAGE_TOKEN_COSTS = {
+    "gpt-4o": (85, 170),
+    "gpt-4o-mini": (2833, 5667),
+}
+
+
+def vision_tokens(width, height, detail="high", model="gpt-4o"):
+    """Input tokens an image of this size costs"""
+    base, per_tile = IMAGE_TOKEN_COSTS.get(model, IMAGE_TOKEN_COSTS["gpt-4o"])
+    if detail == "low" or not width or not height:
+        return base
+    # Fit in 2048x2048, then shortest side down to 768, then count 512px tiles
+    scale = min(1.0, 2048 / max(width, height))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768 / min(width, height))
+    width, height = width * scale, height * scale
+    return base + per_tile * math.ceil(width / TILE_SIZE) * math.ceil(height / TILE_SIZE)
+
+
+class VisionImage:
+    """An image ready for a chat message, plus what it cost to send"""
+
+    def __init__(self, data, mime, width, height, detail, raw_bytes, window=None):
+        self.data = data
+        self.mime = mime
+        self.width = width
+        self.height = height
+        self.detail = detail
+        self.raw_bytes = raw_bytes      # Screenshot PNG as captured
+        self.window = window            # (width, height) of the full window, for the baseline cost
+
+    def tokens(self, model="gpt-4o"):
+        return vision_tokens(self.width, self.height, self.detail, model)
+
+    def baseline_tokens(self, model="gpt-4o"):
+        """What a full-window screenshot would have cost"""
+        return vision_tokens(*self.window, "high", model) if self.window else None
+
+    @property
+    def bytes(self):
+        return len(self.data)
+
+    def image_part(self):
+        """The image_url content part for chat.completions"""
+        b64 = base64.b64encode(self.data).decode("utf-8")
+        return {"type": "image_url", "image_url": {"url": f"data:{self.mime};base64,{b64}", "detail": self.detail}}
+
+
+def _window_size(driver):
+    try:
+        size = driver.get_window_size()
+        return size["width"], size["height"]
+    except Exception:
+        return None
+
+
+def prepare_screenshot(driver, element=None, crop_height=None, max_width=1024, max_height=1536,
+                       grayscale=False, quality=70, detail="auto"):
+    """
+    Screenshot `element` (whole window if None) and shrink it for GPT Vision.
+    crop_height: keep only the top N CSS pixels of the element (e.g. down to the last row asked about)
+    detail: "low", "high", or "auto" (low when the result fits in one 512px tile anyway)
+    """
+    window = _window_size(driver)
+    png = None
+    if element is not None and not FULL_WINDOW:
+        try:
+            png = element.screenshot_as_png
+        except Exception as e:
+            print(f"[Vision] Element screenshot failed, using the whole window: {e}")
+    if png is None:
+        png = driver.get_screenshot_as_png()
+        element = None
+
+    if not PIL_AVAILABLE:
+        width = height = None
+        if element is not None:
+            rect = element.rect
+            width, height = int(rect["width"]), int(rect["height"])
+        elif window:
+            width, height = window
+        return VisionImage(png, "image/png", width, height, "high" if detail == "auto" else detail,
+                           len(png), window)
+
+    img = Image.open(io.BytesIO(png))
+    if element is not None and crop_height:
+        # Screenshot pixels per CSS pixel (device pixel ratio)
+        ratio = img.width / max(1, element.rect["width"])
+        bottom = int(min(img.height, crop_height * ratio))
+        if bottom > 0:
+            img = img.crop((0, 0, img.width, bottom))
+    if not FULL_WINDOW:
+        scale = min(1.0, max_width / img.width, max_height / img.height)
+        if scale < 1.0:
+            img = img.resize((max(1, int(img.width * scale)), max(1, int(img.height * scale))), Image.LANCZOS)
+        img = img.convert("L" if grayscale else "RGB")
+        out = io.BytesIO()
+        img.save(out, format="JPEG", quality=quality, optimize=True)
+        data, mime = out.getvalue(), "image/jpeg"
+    else:
+        data, mime = png, "image/png"
+
+    if detail == "auto":
+        detail = "low" if img.width <= TILE_SIZE and img.height <= TILE_SIZE else "high"
+    return VisionImage(data, mime, img.width, img.height, detail, len(png), window)
+
+
+def record_call(task, image, started, response=None, model="gpt-4o", log=print):
+    """Log one Vision call: bytes, tokens (estimated and billed), latency"""
+    latency = time.time() - started
+    prompt_tokens = None
+    try:
+        prompt_tokens = response.usage.prompt_tokens
+    except Exception:
+        pass
+    entry = {
+        "task": task,
+        "mode": "full" if FULL_WINDOW else "prepared",
+        "bytes": image.bytes,
+        "raw_bytes": image.raw_bytes,
+        "width": image.width,
+        "height": image.height,
+        "detail": image.detail,
+        "model": model,
+        "image_tokens": image.tokens(model),
+        "baseline_tokens": image.baseline_tokens(model),
+        "prompt_tokens": prompt_tokens,
+        "latency_ms": int(latency * 1000),
+        "at": int(time.time()),
+    }
+    billed = f", {prompt_tokens} prompt tok billed" if prompt_tokens is not None else ""
+    baseline = f" (full window ~{entry['baseline_tokens']})" if entry["baseline_tokens"] else ""
+    log(f"[Vision] {task}: {image.bytes // 1024} KB {image.mime.split('/')[1].upper()} "
+        f"{image.width}x{image.height} {image.detail}, ~{entry['image_tokens']} image tok{baseline}{billed}, "
+        f"{latency:.1f}s")
+    try:
+        with open(os.path.join(get_data_dir(), "vision_calls.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass
+    return entry
+
+
+def _report():
+    path = os.path.join(get_data_dir(), "vision_calls.jsonl")
+    groups = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    continue
+                groups.setdefault((e["task"], e["mode"]), []).append(e)
+    except OSError:
+        print(f"No Vision calls logged yet ({path})")
+        return
+
+    def avg(rows, key):
+        values = [r[key] for r in rows if r.get(key) is not None]
+        return sum(values) / len(values) if values else 0
+
+    print(f"{'task':<18}{'mode':<10}{'calls':>6}{'avg KB':>9}{'img tok':>9}{'billed':>9}{'latency':>9}")
+    for (task, mode), rows in sorted(groups.items()):
+        print(f"{task:<18}{mode:<10}{len(rows):>6}{avg(rows, 'bytes') / 1024:>9.0f}"
+              f"{avg(rows, 'image_tokens'):>9.0f}{avg(rows, 'prompt_tokens'):>9.0f}"
+              f"{avg(rows, 'latency_ms') / 1000:>8.1f}s")
+
+
+def _bench(path):
+    """Full PNG vs the prepared JPEG for a saved screenshot"""
+    if not PIL_AVAILABLE:
+        print("Pillow is not installed")
+        return
+    with open(path, "rb") as f:
+        png = f.read()
+    img = Image.open(io.BytesIO(png))
+    print(f"Original : {len(png) // 1024:>5} KB PNG  {img.width}x{img.height}  "
+          f"~{vision_tokens(img.width, img.height)} tok (high, gpt-4o)")
+    for max_width, grayscale in ((1024, False), (1024, True), (768, True)):
+        scale = min(1.0, max_width / img.width)
+        small = img.resize((int(img.width * scale), int(img.height * scale)), Image.LANCZOS)
+        small = small.convert("L" if grayscale else "RGB")
+        out = io.BytesIO()
+        small.save(out, format="JPEG", quality=70, optimize=True)
+        label = f"{max_width}px {'gray' if grayscale else 'rgb '}"
+        print(f"{label:<9}: {len(out.getvalue()) // 1024:>5} KB JPEG {small.width}x{small.height}  "
+              f"~{vision_tokens(small.width, small.height)} tok (high, gpt-4o)")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "report":
+        _report()
+    elif len(sys.argv) > 2 and sys.argv[1] == "bench":
+        _bench(sys.argv[2])
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main()
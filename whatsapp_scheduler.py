@@ -16,6 +16,9 @@ import urllib.request
 import urllib.parse
 import base64
 
+from bot_status import read_status, instance_status_file, heartbeat_age, lifetime_count
+from bot_supervisor import supervisor_state
+
 # Load config
 CONFIG_FILE = "config.json"
 if len(sys.argv) > 1:
@@ -66,10 +69,38 @@ def get_jobs_applied_from_log(log_file):
         pass
     return 0
 
+def check_health_from_snapshot(snapshot):
+    """Health from the bot's published status record (heartbeat instead of log mtime)"""
+    phase = snapshot.get("phase", "")
+    if phase == "crashed":
+        return ("🔴", f"Crashed: {snapshot.get('last_error', '')[:60]}", True)
+    if phase in ("finished", "stopped"):
+        return ("⚪", phase.capitalize(), False)
+    if phase == "paused":
+        return ("🟡", "Paused", False)
+
+    minutes_since_beat = (heartbeat_age(snapshot) or 0) / 60
+    if minutes_since_beat > 30:  # No heartbeat in 30+ minutes
+        return ("⚠️", f"Stuck/Frozen (no heartbeat {int(minutes_since_beat)}m)", True)
+    elif minutes_since_beat > 15:
+        return ("🟡", f"Slow/Idle (no heartbeat {int(minutes_since_beat)}m)", False)
+
+    last_error_at = snapshot.get("last_error_at")
+    if last_error_at and time.time() - float(last_error_at) < 600:
+        return ("⚠️", f"Has Errors ({snapshot.get('last_error', '')[:40]})", True)
+    return ("🟢", f"Running Well ({phase})", False)
+
 def check_bot_health(name, info):
     """Check bot health status - returns (status_icon, status_text, needs_attention)"""
     status = info.get("status", "stopped")
     
+    # The supervisor knows about restarts in progress and crash loops
+    sup = (supervisor_state() or {}).get(name, {})
+    if sup.get("state") == "backoff":
+        return ("🟡", f"Restarting in {sup.get('restart_in') or 0}s ({sup.get('last_reason', '')[:40]})", True)
+    if sup.get("state") == "crash_loop":
+        return ("🔴", f"Crash loop - gave up ({sup.get('last_reason', '')[:40]})", True)
+    
     if status != "running":
         return ("🔴", "Stopped", True)
     
@@ -92,9 +123,14 @@ def check_bot_health(name, info):
                 except OSError:
                     return ("🔴", "Process Not Found", True)
         except:
-            pass  # Continue with log file check
+            pass  # Continue with status/log file check
+    
+    # Prefer the heartbeat from the bot's own status snapshot
+    snapshot = read_status(instance_status_file(name, info))
+    if snapshot:
+        return check_health_from_snapshot(snapshot)
     
-    # Check if log file is being updated (bot is active)
+    # Fallback for bots that don't publish status yet: is the log file being updated?
     log_file = info.get("log_file", f"log_{name}.txt")
     if os.path.exists(log_file):
         try:
@@ -147,8 +183,12 @@ def get_all_bot_summaries():
             instances = json.load(f)
         
         for name, info in instances.items():
-            log_file = info.get("log_file", f"log_{name}.txt")
-            jobs_applied = get_jobs_applied_from_log(log_file)
+            snapshot = read_status(instance_status_file(name, info))
+            if snapshot:
+                jobs_applied = lifetime_count(snapshot, "applied")
+            else:
+                log_file = info.get("log_file", f"log_{name}.txt")
+                jobs_applied = get_jobs_applied_from_log(log_file)
             
             # Get config to find profile name
             config_file = info.get("config_file", "")